@@ -24,21 +24,10 @@ from typing import Dict
 from typing import Optional
 
 import click
-import requests
-import urllib3
-from requests.exceptions import MissingSchema  # type: ignore
 
 from mls import __version__ as version
-from mls.manager.allocation.cli import allocation
-from mls.manager.configure.cli import configure
-from mls.manager.dts.connector_cli import connector
-from mls.manager.dts.transfer_cli import transfer
-from mls.manager.job.cli import job
-from mls.manager.queue.cli import queue
+from mls.utils.cli_entrypoint_help import LazyCommand
 from mls.utils.cli_entrypoint_help import MLSHelp
-from mls.utils.common import create_autocomplete
-from mls.utils.common import handle_click_exception
-from mls.utils.common import suggest_autocomplete
 from mls.utils.execption import ConfigReadError
 from mls.utils.execption import ConfigWriteError
 from mls.utils.execption import DecryptionError
@@ -46,11 +35,49 @@ from mls.utils.execption import EncryptionError
 from mls.utils.execption import MissingPassword
 from mls.utils.style import error_format
 from mls.utils.style import text_format
-from mls_core.exceptions import AuthorizationError
-from mls_core.exceptions import InvalidAuthorizationToken
 
-
-@click.group(cls=MLSHelp)
+# Статическое описание подкоманд: модули импортируются только при вызове подкоманды,
+# а mls --help строится без загрузки requests, pycryptodome, yaml и tabulate.
+COMMANDS = {
+    'agent': LazyCommand(
+        'mls.manager.agent.cli:agent',
+        'Группа команд (входная точка) для работы с фоновым процессом mls agent.\n\nСинтаксис: mls agent [command] [args] [options]',
+        ('start', 'status', 'stop'),
+    ),
+    'allocation': LazyCommand(
+        'mls.manager.allocation.cli:allocation',
+        'Группа команд (входная точка) для работы с аллокациями.\n\nСинтаксис: mls allocation [command] [args] [options]',
+        ('inst-types', 'list'),
+    ),
+    'configure': LazyCommand(
+        'mls.manager.configure.cli:configure',
+        'Команда настройки конфигурации профиля пользователя. Если профиль не указан, используется профиль по умолчанию default.'
+        '\n\nСинтаксис:\n    mls configure [options]\n\nПример:\n    mls configure --profile name --encrypt',
+    ),
+    'connector': LazyCommand(
+        'mls.manager.dts.connector_cli:connector',
+        'Группа команд (входная точка) для работы с коннекторами.\n\nСинтаксис: mls connector [command] [args] [options]',
+        ('activate', 'create', 'deactivate', 'delete', 'list', 'sources', 'update'),
+    ),
+    'job': LazyCommand(
+        'mls.manager.job.cli:job',
+        'Группа команд (входная точка) при работе с задачами обучения.\n\nСинтаксис: mls job [command] [args] [options]',
+        ('kill', 'list', 'logs', 'pods', 'regions', 'restart', 'status', 'submit', 'table', 'types', 'wait', 'yaml'),
+    ),
+    'queue': LazyCommand(
+        'mls.manager.queue.cli:queue',
+        'Группа команд (входная точка) для работы с очередями.\n\nСинтаксис: mls queue [command] [args] [options]',
+        ('inst-types', 'list'),
+    ),
+    'transfer': LazyCommand(
+        'mls.manager.dts.transfer_cli:transfer',
+        'Группа команд (входная точка) для работы с правилами переноса.\n\nСинтаксис: mls transfer [command] [args] [options]',
+        ('activate', 'create', 'deactivate', 'delete', 'get', 'history', 'list', 'logs', 'stop', 'update'),
+    ),
+}
+
+
+@click.group(cls=MLSHelp, lazy_commands=COMMANDS)
 @click.version_option(version, '-v', '--version', message='Версия Distributed Train CLI %(version)s')
 def cli():
     """Основная точка входа для команд MLS.
@@ -60,16 +87,11 @@ def cli():
     """
 
 
-cli.add_command(job)
-cli.add_command(configure)
-cli.add_command(connector)
-cli.add_command(transfer)
-cli.add_command(allocation)
-cli.add_command(queue)
-
-
 def auto_complete_function(mapping: Optional[Dict[Any, Any]] = None):
     """Функция наполнения mls авто заполнителями."""
+    from mls.utils.common import create_autocomplete  # pylint: disable=import-outside-toplevel
+    from mls.utils.common import suggest_autocomplete  # pylint: disable=import-outside-toplevel
+
     if mapping is None:
         mapping = {}
     create_autocomplete('mls', cli, mapping)
@@ -86,26 +108,39 @@ def auto_complete_function(mapping: Optional[Dict[Any, Any]] = None):
         sys.stdout.write('\n'.join(suggest_autocomplete(cleaned_arg, mapping)))
 
 
-def autocomplete():
-    """Входная точка для запуска autocomplete.
+def entry_point():
+    """Входная точка для поддержки работы в рамках вызова через mls.cli (в режиме cli-приложения)."""
+    try:
+        cli(standalone_mode=False)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        handle_error(error)
+
 
-    Используется как complete entrypoint.
+def __getattr__(name: str):
+    """Доступ к подкомандам как к атрибутам модуля (from mls.cli import job) с загрузкой по требованию."""
+    if name in COMMANDS:
+        return cli.get_command(click.Context(cli), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
-    _mls_completion() {
-        autocomplete "${COMP_WORDS[@]}"
-    }
-    complete -F _mls_completion mls
+
+def handle_error(exc: Exception):
+    """Выводит сообщение об ошибке и завершает процесс с соответствующим кодом.
+
+    Модули requests, urllib3 и mls_core импортируются только здесь,
+    чтобы не замедлять запуск команд, которые завершились успешно без сети.
     """
-    try:
-        auto_complete_function()
-    except Exception:
-        pass
+    # pylint: disable=import-outside-toplevel
+    import requests
+    import urllib3
+    from requests.exceptions import MissingSchema  # type: ignore
 
+    from mls.utils.common import handle_click_exception
+    from mls_core.exceptions import AuthorizationError
+    from mls_core.exceptions import CircuitOpenError
+    from mls_core.exceptions import InvalidAuthorizationToken
 
-def entry_point():
-    """Входная точка для поддержки работы в рамках вызова через mls.cli (в режиме cli-приложения)."""
     try:
-        cli(standalone_mode=False)
+        raise exc
     except ConfigReadError as error:
         click.echo(error_format(str(error)))
         sys.exit(1)
@@ -125,6 +160,9 @@ def entry_point():
     except urllib3.exceptions.NameResolutionError as error:
         click.echo(error_format(f'Не удалось сопоставить IP-адрес с {error.conn.host}'))
         sys.exit(1)
+    except CircuitOpenError as error:
+        click.echo(error_format(str(error)))
+        sys.exit(1)
     except requests.exceptions.ConnectionError:
         click.echo(error_format('Не удалось установить соединение, проверьте настройки сети'))
         sys.exit(1)
@@ -155,7 +193,7 @@ def entry_point():
     except requests.exceptions.ChunkedEncodingError:
         click.echo(error_format('Сервер объявил chunked кодировку, но отправил не валидный chunk'))
         sys.exit(1)
-    except Exception as er:
+    except Exception as er:  # pylint: disable=broad-exception-caught
         click.echo(error_format(f'{er}'))
         sys.exit(2)
 
@@ -0,0 +1,4 @@
+"""ML Space (MLS) Package Initialization Module.
+
+Этот модуль инициализирует пакет `agent` и определяет его публичный интерфейс.
+"""
@@ -0,0 +1,107 @@
+"""Модуль CLI для управления фоновым процессом mls agent."""
+import os
+import subprocess
+import sys
+import time
+
+import click
+
+from .help import AgentHelp
+from .help import StartHelp
+from .help import StatusHelp
+from .help import StopHelp
+from mls.utils.common_types import PositiveIntWithZeroView
+from mls.utils.settings import ENCRYPTED_CREDENTIALS_FILE
+from mls.utils.settings import SECRET_PASSWORD
+from mls.utils.style import success_format
+from mls.utils.style import text_format
+from mls_core.agent import AgentClient
+from mls_core.setting import AGENT_IDLE_TIMEOUT
+from mls_core.setting import AGENT_SOCKET
+
+START_TIMEOUT = 10
+
+
+@click.group(cls=AgentHelp)
+def agent():
+    """Группа команд (входная точка) для работы с фоновым процессом mls agent.
+
+    Синтаксис: mls agent [command] [args] [options]
+
+    """
+
+
+@agent.command(cls=StartHelp)
+@click.option('-f', '--foreground', is_flag=True, help='Запуск в текущем терминале без перехода в фоновый режим', default=False)
+@click.option(
+    '-t', '--idle_timeout', type=PositiveIntWithZeroView(), default=AGENT_IDLE_TIMEOUT,
+    help='Время простоя в секундах, после которого агент завершает работу (0 - без ограничения)',
+)
+def start(foreground, idle_timeout):
+    """Команда запуска агента, хранящего сессии, токены и профили в памяти.
+
+    Синтаксис: mls agent start [options]
+
+    Пример: mls agent start --idle_timeout 3600
+
+    """
+    client = AgentClient()
+    if state := client.ping():
+        click.echo(text_format(f'Агент уже запущен (pid {state["pid"]})'))
+        return
+
+    if os.path.exists(ENCRYPTED_CREDENTIALS_FILE) and not SECRET_PASSWORD:
+        click.echo(text_format('MLS_PASSWORD не задан: зашифрованные профили агент передавать не будет'))
+
+    if foreground:
+        from .server import serve  # pylint: disable=import-outside-toplevel
+        serve(AGENT_SOCKET, idle_timeout)
+        return
+
+    subprocess.Popen(  # pylint: disable=consider-using-with
+        [sys.executable, '-m', 'mls.manager.agent.server', str(idle_timeout)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        if state := client.ping():
+            click.echo(success_format(f'Агент запущен (pid {state["pid"]})'))
+            return
+        time.sleep(0.1)
+    raise click.ClickException('Не удалось запустить агент')
+
+
+@agent.command(cls=StopHelp)
+def stop():
+    """Команда остановки агента.
+
+    Синтаксис: mls agent stop
+
+    Пример: mls agent stop
+
+    """
+    if AgentClient().stop():
+        click.echo(success_format('Агент остановлен'))
+    else:
+        click.echo(text_format('Агент не запущен'))
+
+
+@agent.command(cls=StatusHelp)
+def status():
+    """Команда отображения состояния агента.
+
+    Синтаксис: mls agent status
+
+    Пример: mls agent status
+
+    """
+    state = AgentClient().ping()
+    if state is None:
+        click.echo(text_format('Агент не запущен'))
+    else:
+        click.echo(success_format(
+            f'Агент запущен (pid {state["pid"]}), время работы {state["uptime"]} с, сессий {state["sessions"]}',
+        ))
@@ -0,0 +1,35 @@
+"""Модуль помощи для CLI команд mls agent."""
+import click
+
+from mls.utils.fomatter import CommonGroupFormatter
+
+
+class AgentHelp(CommonGroupFormatter):
+    """Класс помощи для группы команд агента."""
+    HEADING = 'Управление фоновым процессом mls agent.'
+
+
+class CommandHelp(click.Command):
+    """Класс команд с настройкой заголовков."""
+    HEADING = ''
+
+    def format_help(self, ctx, formatter):
+        """Переопределение вывода помощи."""
+        help_ = AgentHelp
+        help_.HEADING = self.HEADING
+        help_().format_help(ctx, formatter)
+
+
+class StartHelp(CommandHelp):
+    """Класс помощи при запуске агента."""
+    HEADING = 'Запуск агента.'
+
+
+class StopHelp(CommandHelp):
+    """Класс помощи при остановке агента."""
+    HEADING = 'Остановка агента.'
+
+
+class StatusHelp(CommandHelp):
+    """Класс помощи при просмотре состояния агента."""
+    HEADING = 'Состояние агента.'
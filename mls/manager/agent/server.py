@@ -0,0 +1,261 @@
+"""Сервер mls agent.
+
+Фоновый процесс, который держит в памяти клиентов API (сессии requests с пулом
+соединений и токенами доступа) и расшифрованные профили пользователя. Слушает
+unix-сокет с правами 0600 и принимает подключения только от процессов владельца.
+
+Запуск: python -m mls.manager.agent.server [idle_timeout]
+"""
+import hmac
+import os
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
+from configparser import NoSectionError
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import requests
+
+from mls.utils.common import load_saved_config
+from mls.utils.settings import CONFIG_FILE
+from mls.utils.settings import CREDENTIALS_FILE
+from mls.utils.settings import ENCRYPTED_CREDENTIALS_FILE
+from mls.utils.settings import SECRET_PASSWORD
+from mls_core.agent import AgentClient
+from mls_core.agent import decode_bytes
+from mls_core.agent import encode_bytes
+from mls_core.agent import password_digest
+from mls_core.agent import read_message
+from mls_core.agent import write_message
+from mls_core.client import CommonPublicApiInterface
+from mls_core.setting import AGENT_IDLE_TIMEOUT
+from mls_core.setting import AGENT_SOCKET
+
+STREAM_CHUNK_SIZE = 256
+
+
+class ProfileStore:
+    """Расшифрованные профили, перечитываются при изменении файлов конфигурации."""
+
+    def __init__(self, password: Optional[str] = SECRET_PASSWORD):
+        """Инициализация хранилища.
+
+        :param password: Пароль расшифровки credentials.key, переданный агенту при запуске.
+        """
+        self._password = password
+        self._digest = password_digest(password) if password else None
+        self._lock = threading.Lock()
+        self._loaded: Dict[bool, Tuple[tuple, tuple]] = {}
+
+    @staticmethod
+    def _stamp() -> tuple:
+        stamp: List[Optional[Tuple[int, int]]] = []
+        for path in (CONFIG_FILE, CREDENTIALS_FILE, ENCRYPTED_CREDENTIALS_FILE):
+            try:
+                stat = os.stat(path)
+                stamp.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def verify(self, digest: str) -> bool:
+        """Совпадает ли проверочное значение пароля вызывающего процесса с паролем агента."""
+        return self._digest is not None and hmac.compare_digest(digest, self._digest)
+
+    def get(self, name: str, digest: Optional[str]) -> Optional[dict]:
+        """Профиль по имени или None, если он не найден или не может быть расшифрован.
+
+        :param name: Имя профиля.
+        :param digest: Проверочное значение пароля вызывающего процесса (password_digest);
+            None - профиль из незашифрованных учётных данных.
+        """
+        encrypted = digest is not None
+        if digest is not None and not self.verify(digest):
+            return None
+        with self._lock:
+            stamp = self._stamp()
+            if encrypted not in self._loaded or self._loaded[encrypted][0] != stamp:
+                self._loaded[encrypted] = stamp, load_saved_config(self._password if encrypted else None)
+            _, (config, credentials) = self._loaded[encrypted]
+        try:
+            return {**dict(config.items(name)), **dict(credentials.items(name))}
+        except NoSectionError:
+            return None
+
+
+class AgentHandler(socketserver.StreamRequestHandler):
+    """Обработчик одного подключения: одно сообщение-запрос, один ответ."""
+
+    server: 'AgentServer'
+
+    def handle(self):
+        """Разбор сообщения и выполнение операции."""
+        self.server.touch(+1)
+        try:
+            message = read_message(self.rfile)
+            operation = getattr(self, f'op_{message.get("op")}', None)
+            if operation is None:
+                write_message(self.wfile, {'ok': False, 'error': 'AgentError', 'message': f'Неизвестная операция {message.get("op")}'})
+            else:
+                operation(message)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.server.touch(-1)
+
+    def op_ping(self, _):
+        """Состояние агента."""
+        write_message(self.wfile, {
+            'ok': True,
+            'pid': os.getpid(),
+            'uptime': int(time.monotonic() - self.server.started),
+            'sessions': len(self.server.clients),
+        })
+
+    def op_stop(self, _):
+        """Остановка агента."""
+        write_message(self.wfile, {'ok': True})
+        threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+    def op_profile(self, message):
+        """Профиль пользователя из памяти агента."""
+        try:
+            profile = self.server.profiles.get(message['name'], message.get('password'))
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            write_message(self.wfile, {'ok': False, 'error': type(error).__name__, 'message': str(error)})
+            return
+        write_message(self.wfile, {'ok': profile is not None, 'profile': profile})
+
+    def op_request(self, message):
+        """HTTP-запрос от имени клиента CLI."""
+        kwargs = message.get('kwargs', {})
+        if isinstance(kwargs.get('timeout'), list):
+            kwargs['timeout'] = tuple(kwargs['timeout'])
+        if isinstance(kwargs.get('data'), dict) and 'bytes' in kwargs['data']:
+            kwargs['data'] = decode_bytes(kwargs['data']['bytes'])
+        stream = bool(message.get('stream'))
+
+        try:
+            client = self.server.client(message['client'])
+            response = client._send(message['method'], message['path'], stream=stream, **kwargs)  # pylint: disable=protected-access
+            header = {
+                'ok': True,
+                'status': response.status_code,
+                'reason': response.reason,
+                'headers': dict(response.headers),
+                'url': response.url,
+                'encoding': response.encoding,
+            }
+            if not stream:
+                header['body'] = encode_bytes(response.content)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            write_message(self.wfile, {'ok': False, 'error': type(error).__name__, 'message': str(error)})
+            return
+
+        write_message(self.wfile, header)
+        if stream:
+            self._stream(response)
+
+    def _stream(self, response: requests.Response):
+        try:
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                write_message(self.wfile, {'chunk': encode_bytes(chunk)})
+            write_message(self.wfile, {'end': True})
+        except requests.exceptions.RequestException as error:
+            write_message(self.wfile, {'ok': False, 'error': type(error).__name__, 'message': str(error)})
+        finally:
+            response.close()
+
+
+class AgentServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Сервер mls agent на unix-сокете."""
+
+    daemon_threads = True
+
+    def __init__(self, path: str = AGENT_SOCKET, idle_timeout: int = AGENT_IDLE_TIMEOUT, password: Optional[str] = SECRET_PASSWORD):
+        """Инициализация сервера.
+
+        :param path: Путь к unix-сокету.
+        :param idle_timeout: Время простоя в секундах, после которого агент завершает работу; 0 - без ограничения.
+        :param password: Пароль расшифровки credentials.key.
+        """
+        self.path = path
+        self.idle_timeout = idle_timeout
+        self.started = time.monotonic()
+        self.profiles = ProfileStore(password)
+        self.clients: Dict[str, CommonPublicApiInterface] = {}
+        self._clients_lock = threading.Lock()
+        self._active = 0
+        self._last_activity = time.monotonic()
+        self._stopping = False
+
+        directory = os.path.dirname(path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if os.path.exists(path):
+            if AgentClient(path).ping() is not None:
+                raise OSError(f'mls agent уже запущен: {path}')
+            os.remove(path)
+
+        umask = os.umask(0o177)
+        try:
+            super().__init__(path, AgentHandler)
+        finally:
+            os.umask(umask)
+        os.chmod(path, 0o600)
+
+    def verify_request(self, request, client_address):
+        """Принимает подключения только от процессов того же пользователя."""
+        if not hasattr(socket, 'SO_PEERCRED'):
+            return True
+        credentials = request.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+        _, uid, _ = struct.unpack('3i', credentials)
+        return uid == os.getuid()
+
+    def client(self, options: dict) -> CommonPublicApiInterface:
+        """Клиент API для набора параметров, создаётся при первом обращении."""
+        key = repr(sorted(options.items()))
+        with self._clients_lock:
+            if key not in self.clients:
+                self.clients[key] = CommonPublicApiInterface(**options, agent=False)
+            return self.clients[key]
+
+    def touch(self, delta: int):
+        """Учёт активных подключений для остановки по простою."""
+        with self._clients_lock:
+            self._active += delta
+            self._last_activity = time.monotonic()
+
+    def service_actions(self):
+        """Остановка агента после idle_timeout секунд без подключений."""
+        if not self.idle_timeout or self._stopping:
+            return
+        with self._clients_lock:
+            idle = self._active == 0 and time.monotonic() - self._last_activity > self.idle_timeout
+        if idle:
+            self._stopping = True
+            threading.Thread(target=self.shutdown, daemon=True).start()
+
+    def server_close(self):
+        """Закрытие сокета и удаление файла сокета."""
+        super().server_close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def serve(path: str = AGENT_SOCKET, idle_timeout: int = AGENT_IDLE_TIMEOUT):
+    """Запускает агент в текущем процессе до остановки."""
+    with AgentServer(path, idle_timeout) as server:
+        try:
+            server.serve_forever(poll_interval=1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    serve(idle_timeout=int(sys.argv[1]) if len(sys.argv) > 1 else AGENT_IDLE_TIMEOUT)
@@ -6,9 +6,13 @@ import click
 from .help import AllocationHelp
 from .help import InstTypesHelp
 from .help import ListHelp
+from mls.manager.job.decorators import columns_selected
+from mls.manager.job.decorators import opt_list_output_format
 from mls.manager.job.decorators import opt_output_format
 from mls.utils.client import api_client
-from mls.utils.style import success_format
+from mls.utils.output import echo_response
+from mls.utils.output import echo_result
+from mls.utils.output import STREAM_FORMATS
 from mls_core import AllocationApi
 
 
@@ -22,17 +26,23 @@ def allocation():
 
 
 @allocation.command(cls=ListHelp, name='list')
-@opt_output_format
+@columns_selected
+@opt_list_output_format
 @api_client(AllocationApi)
-def list_(api: AllocationApi):
+def list_(api: AllocationApi, columns):
     """Команда отображения доступных аллокаций.
 
     Синтаксис: mls allocation list [options]
 
     Пример: mls allocation list
 
+    Пример: mls allocation list -O csv --columns id,name
+
     """
-    click.echo(success_format(api.get_list()))
+    if columns or api.USER_OUTPUT_PREFERENCE in STREAM_FORMATS:
+        echo_response(api.get_list(), api.USER_OUTPUT_PREFERENCE, columns or ())
+        return
+    echo_result(api.get_list(), api.USER_OUTPUT_PREFERENCE)
 
 
 @allocation.command(cls=InstTypesHelp)
@@ -47,4 +57,4 @@ def inst_types(api: AllocationApi, allocation_id: uuid.UUID):
     Пример: mls allocation inst-types 00000000-0000-4000-8000-000000000000
 
     """
-    click.echo(success_format(api.get_instance_types(allocation_id)))
+    echo_result(api.get_instance_types(allocation_id), api.USER_OUTPUT_PREFERENCE)
@@ -4,12 +4,25 @@ import click
 from .custom_types import ConfigureAdditionalOptions
 from .help import ConfigureHelp
 from .utils import configure_profile
+from .utils import lock_credentials
+from .utils import unlock_credentials
+from mls.utils.common_types import PositiveIntWithZeroView
+from mls.utils.settings import KEYRING_TTL
 
 
 @click.command(cls=ConfigureHelp)
 @click.option('-P', '--profile', cls=ConfigureAdditionalOptions, default=None,  help='Имя профиля')
 @click.option('-E', '--encrypt', cls=ConfigureAdditionalOptions, is_flag=True, default=False,  help='Шифрование профиля')
-def configure(profile, encrypt):
+@click.option(
+    '-U', '--unlock', cls=ConfigureAdditionalOptions, is_flag=True, default=False,
+    help='Разблокировать зашифрованные учётные данные: ключ расшифровки сохраняется в keyring',
+)
+@click.option('-L', '--lock', cls=ConfigureAdditionalOptions, is_flag=True, default=False,  help='Удалить ключ расшифровки из keyring')
+@click.option(
+    '-T', '--ttl', cls=ConfigureAdditionalOptions, type=PositiveIntWithZeroView(), default=KEYRING_TTL,
+    help='Время разблокировки в секундах',
+)
+def configure(profile, encrypt, unlock, lock, ttl):
     """Команда настройки конфигурации профиля пользователя. Если профиль не указан, используется профиль по умолчанию default.
 
     Синтаксис:
@@ -18,4 +31,9 @@ def configure(profile, encrypt):
     Пример:
         mls configure --profile name --encrypt
     """
-    configure_profile(profile, encrypt)
+    if lock:
+        lock_credentials()
+    elif unlock:
+        unlock_credentials(ttl)
+    else:
+        configure_profile(profile, encrypt)
@@ -11,6 +11,8 @@
     prepare_profile(profile_name): Загружает текущую конфигурацию профиля.
     mask_secret(secret): Маскирует секретные значения для безопасного отображения.
     get_user_input(prompt_text, default_value, no_entry_value): Получает ввод пользователя с предложением.
+    unlock_credentials(ttl): Сохраняет ключ расшифровки учётных данных в keyring.
+    lock_credentials(): Удаляет ключ расшифровки учётных данных из keyring.
 
 
 """
@@ -26,12 +28,15 @@ from mls.utils.execption import ConfigWriteError
 from mls.utils.execption import DecryptionError
 from mls.utils.execption import EncryptionError
 from mls.utils.execption import MissingPassword
+from mls.utils.key_cache import DerivedKeyCache
 from mls.utils.openssl import encrypt as enc
 from mls.utils.settings import CONFIG_FILE
 from mls.utils.settings import CREDENTIALS_FILE
 from mls.utils.settings import DEFAULT_PROFILE
 from mls.utils.settings import ENCRYPTED_CREDENTIALS_FILE
 from mls.utils.settings import ENDPOINT_URL
+from mls.utils.settings import KEYRING_CACHE
+from mls.utils.settings import SECRET_PASSWORD
 from mls.utils.style import error_format
 from mls.utils.style import message_format
 from mls.utils.style import success_format
@@ -224,3 +229,41 @@ def save_profile(config, credentials, password=None):
     else:
         with open(CREDENTIALS_FILE, 'w', encoding='utf-8') as cred_file:
             cred_file.write(fp.getvalue())
+
+
+def unlock_credentials(ttl):
+    """Разблокирует зашифрованные учётные данные.
+
+    Ключ расшифровки сохраняется в keyring, и в течение ttl секунд команды mls
+    читают credentials.key без MLS_PASSWORD и без повторной генерации ключа.
+
+    Аргументы:
+        ttl (int): Время разблокировки в секундах.
+
+    Возвращает:
+        None
+    """
+    if not os.path.exists(ENCRYPTED_CREDENTIALS_FILE):
+        raise ConfigReadError('Зашифрованные учётные данные не найдены. Выполните mls configure --encrypt')
+
+    if not KEYRING_CACHE:
+        raise ConfigWriteError('Кэш ключа расшифровки выключен. Задайте MLS_KEYRING_CACHE=true')
+    cache = DerivedKeyCache(ENCRYPTED_CREDENTIALS_FILE)
+    if not cache.available:
+        raise ConfigWriteError('Системное хранилище keyring недоступно')
+
+    password = SECRET_PASSWORD or get_decrypt_password()
+    with open(ENCRYPTED_CREDENTIALS_FILE, 'rb') as cred_file:
+        cache.unlock(cred_file.read(), password, ttl)
+
+    click.echo(success_format(f'Учётные данные разблокированы на {ttl} с'))
+
+
+def lock_credentials():
+    """Удаляет ключ расшифровки учётных данных из keyring.
+
+    Возвращает:
+        None
+    """
+    DerivedKeyCache(ENCRYPTED_CREDENTIALS_FILE).lock()
+    click.echo(success_format('Учётные данные заблокированы'))
@@ -8,13 +8,16 @@ from mls.manager.dts.custom_types import ConnectorInput
 from mls.manager.dts.custom_types import OptionalOptions
 from mls.manager.dts.decorators import arg_connector_ids
 from mls.manager.dts.decorators import opt_all_connector_types
+from mls.manager.dts.decorators import opt_columns
 from mls.manager.dts.decorators import opt_connector_id
 from mls.manager.dts.decorators import opt_connector_id_prompt
 from mls.manager.dts.decorators import opt_custom_connector_type
 from mls.manager.dts.decorators import opt_json_output_format
+from mls.manager.dts.decorators import opt_list_output_format
 from mls.manager.dts.decorators import opt_output_format
 from mls.manager.dts.decorators import opt_page_number
 from mls.manager.dts.decorators import opt_page_size
+from mls.manager.dts.decorators import opt_where
 from mls.manager.dts.help import ConnectorActivateHelp
 from mls.manager.dts.help import ConnectorCreateHelp
 from mls.manager.dts.help import ConnectorDeactivateHelp
@@ -28,8 +31,12 @@ from mls.manager.dts.table import display_connectors
 from mls.manager.dts.utils import client
 from mls.manager.dts.utils import collect_connector_params
 from mls.manager.dts.utils import process_json
+from mls.manager.dts.utils import select_items
 from mls.manager.dts.utils import validate_connector_exists
 from mls.utils.common_types import RussianChoice
+from mls.utils.output import echo_response
+from mls.utils.output import echo_result
+from mls.utils.output import STREAM_FORMATS
 from mls.utils.style import success_format
 from mls_core.client import DTSApi
 
@@ -45,7 +52,8 @@ def connector():
 @connector.command(cls=ConnectorListHelp, name='list')
 @opt_all_connector_types
 @arg_connector_ids
-@opt_output_format
+@opt_list_output_format
+@opt_columns
 @click.option(
     '--field',
     'fields',
@@ -57,6 +65,7 @@ def connector():
 )
 @opt_page_size
 @opt_page_number
+@opt_where
 @client
 def list_(
     api: DTSApi,
@@ -65,16 +74,25 @@ def list_(
     page_size: int,
     page_number: int,
     fields: list,
+    where,
+    columns,
 ):
     """Команда просмотра списка коннекторов.
 
     Синтаксис: mls connector list [args] [options]
 
     Пример: mls connector list 8ad28362-e7cf-401f-8057-d80e8e3d8069 --field created --field parameters --field system
+
+    Пример: mls connector list --where "system=false and status=active"
+
+    Пример: mls connector list -O csv --columns connector_id,name,source_type
     """
     connectors_list = api.conn_list(connector_ids, connector_type)
-    if api.USER_OUTPUT_PREFERENCE == 'json':
-        process_json(connectors_list, page_number, page_size)
+    if api.USER_OUTPUT_PREFERENCE in STREAM_FORMATS or columns and api.USER_OUTPUT_PREFERENCE == 'json':
+        echo_response(select_items(connectors_list, page_number, page_size, where), api.USER_OUTPUT_PREFERENCE, columns or ())
+
+    elif api.USER_OUTPUT_PREFERENCE == 'json':
+        process_json(connectors_list, page_number, page_size, where)
 
     else:
         result = DataTransferTableView(
@@ -83,6 +101,7 @@ def list_(
             sorters=[],
             schema=display_connectors,
             fields=fields or [],
+            where=where,
         ).display()
         click.echo(success_format(result))
 
@@ -107,7 +126,7 @@ def create(api: DTSApi, connector_type: str, public: bool):
     """
     u_input = collect_connector_params(connector_type)
     conn = ConnectorInput(**asdict(u_input), source_type=connector_type)
-    click.echo(success_format(api.conn_create(conn, public)))
+    echo_result(api.conn_create(conn, public), api.USER_OUTPUT_PREFERENCE)
 
 
 @connector.command(cls=ConnectorUpdateHelp, name='update')
@@ -128,9 +147,7 @@ def update(api, connector_id, connector_type):
     click.echo('коннектор найден')
 
     user_input = collect_connector_params(connector_type)
-    click.echo(
-        success_format(api.conn_update(connector_id, connector_type, user_input)),
-    )
+    echo_result(api.conn_update(connector_id, connector_type, user_input), api.USER_OUTPUT_PREFERENCE)
 
 
 @connector.command(cls=ConnectorActivateHelp, name='activate')
@@ -145,7 +162,7 @@ def activate(api: DTSApi, connector_id: str, connector_type: str):
 
     Пример: mls connector activate --connector-type s3custom --connector-id 48173044-64b7-41eb-9993-edafab55828c
     """
-    click.echo(success_format(api.conn_activate(connector_id, connector_type)))
+    echo_result(api.conn_activate(connector_id, connector_type), api.USER_OUTPUT_PREFERENCE)
 
 
 @connector.command(cls=ConnectorDeactivateHelp, name='deactivate')
@@ -160,7 +177,7 @@ def deactivate(api: DTSApi, connector_id: str, connector_type: str):
 
     Пример: mls connector deactivate --connector-type s3custom --connector-id 48173044-64b7-41eb-9993-edafab55828c
     """
-    click.echo(success_format(api.conn_deactivate(connector_id, connector_type)))
+    echo_result(api.conn_deactivate(connector_id, connector_type), api.USER_OUTPUT_PREFERENCE)
 
 
 @connector.command(cls=ConnectorDeleteHelp, name='delete')
@@ -174,7 +191,7 @@ def delete(api: DTSApi, connector_ids: list):
 
     Пример: mls connector delete 48173044-64b7-41eb-9993-edafab55828c
     """
-    click.echo(success_format(api.conn_delete(connector_ids)))
+    echo_result(api.conn_delete(connector_ids), api.USER_OUTPUT_PREFERENCE)
 
 
 @connector.command(cls=ConnectorSourcesHelp, name='sources')
@@ -187,4 +204,4 @@ def sources(api: DTSApi):
 
     Пример: mls connector sources
     """
-    click.echo(success_format(api.conn_sources()))
+    echo_result(api.conn_sources(), api.USER_OUTPUT_PREFERENCE)
@@ -6,8 +6,11 @@ from mls.manager.dts.custom_types import CUSTOM_CONNECTOR_TYPES
 from mls.manager.dts.custom_types import OptionalOptions
 from mls.manager.dts.custom_types import RequiredOptions
 from mls.manager.job.custom_types import ProfileOptions
+from mls.utils.common_types import ColumnsView
 from mls.utils.common_types import config_option_format_of_output
+from mls.utils.common_types import list_output_format
 from mls.utils.common_types import RussianChoice
+from mls.utils.common_types import WhereView
 
 opt_custom_connector_type = click.option(
     '--connector-type',
@@ -91,6 +94,15 @@ opt_output_format = click.option(
     help=f'Формат вывода в консоль. {config_option_format_of_output.options}',
     default='text',
 )
+opt_list_output_format = click.option(
+    '-O',
+    '--output',
+    cls=ProfileOptions,
+    index=1,
+    type=list_output_format,
+    help=f'Формат вывода в консоль. {list_output_format.options}',
+    default='text',
+)
 opt_json_output_format = click.option(
     '-O',
     '--output',
@@ -129,3 +141,17 @@ opt_page_number = click.option(
     callback=validate_positive,
     cls=OptionalOptions,
 )
+opt_columns = click.option(
+    '--columns',
+    help='Поля элементов списка для вывода через запятую, вложенные - через точку (name,query.source)',
+    type=ColumnsView(),
+    default=None,
+    cls=OptionalOptions,
+)
+opt_where = click.option(
+    '--where',
+    help='Условие отбора строк, например "status=active and name~^backup"',
+    type=WhereView(),
+    default=None,
+    cls=OptionalOptions,
+)
@@ -1,16 +1,14 @@
 """Модуль table содержит вспомогательные функции для обработки табличного представления данных."""
+from collections.abc import Mapping
 from datetime import datetime
 
-from tabulate import tabulate  # type: ignore
-
 from mls.manager.dts.custom_types import CONNECTOR_DEFAULT_FIELDS
 from mls.manager.dts.custom_types import CONNECTOR_FIELD_NAMES
 from mls.manager.dts.custom_types import CronViewModel
 from mls.manager.dts.custom_types import DAYS
 from mls.manager.dts.custom_types import TRANSFER_DEFAULT_FIELDS
 from mls.manager.dts.custom_types import TRANSFER_FIELD_NAMES
-from mls.schema.table import filter_by
-from mls.schema.table import sort_by
+from mls.schema.stream import format_table
 from mls.schema.table import TableView
 
 
@@ -46,7 +44,7 @@ def process_transfer_table_content(entity, fields) -> list:
     start_at = None
     schedule = 'Неизвестно'
     result: list = []
-    if not isinstance(entity, dict):
+    if not isinstance(entity, Mapping):
         return result
 
     if (ct := entity.get('crontab')) is not None:
@@ -77,7 +75,7 @@ def process_connector_table_content(entity, fields) -> list:
     """Функция подготовки данных для табличного представления коннектора."""
     fields = [f.replace('-', '_') for f in fields]
     result: list = []
-    if not isinstance(entity, dict):
+    if not isinstance(entity, Mapping):
         return result
 
     for field in fields:
@@ -88,44 +86,33 @@ def process_connector_table_content(entity, fields) -> list:
 
 
 def display_transfers(data, fields):
-    """Выборка из JSON-данных и отображение tabulate для трансферов."""
+    """Выборка из JSON-данных и отображение таблицей для трансферов (см. mls.schema.stream)."""
     if not fields:
         fields = TRANSFER_DEFAULT_FIELDS.keys()
 
     headers = [TRANSFER_FIELD_NAMES.get(f) for f in fields]
 
-    table_data = []
-    for entity in data:
-        table_data.append(process_transfer_table_content(entity, fields))
-
-    return tabulate(table_data, headers, tablefmt='pretty')
+    return format_table(headers, (process_transfer_table_content(entity, fields) for entity in data))
 
 
 def display_connectors(data, fields):
-    """Выборка из JSON-данных и отображение tabulate для коннекторов."""
+    """Выборка из JSON-данных и отображение таблицей для коннекторов (см. mls.schema.stream)."""
     if not fields:
         fields = CONNECTOR_DEFAULT_FIELDS.keys()
 
     headers = [CONNECTOR_FIELD_NAMES.get(f) for f in fields]
 
-    table_data = []
-    for entity in data:
-        table_data.append(process_connector_table_content(entity, fields))
-
-    return tabulate(table_data, headers, tablefmt='pretty')
+    return format_table(headers, (process_connector_table_content(entity, fields) for entity in data))
 
 
 class DataTransferTableView(TableView):
     """Специализированное табличное представление для отображения данных."""
 
-    def __init__(self, data, filters, sorters, schema, fields):
+    def __init__(self, data, filters, sorters, schema, fields, where=None):
         """Инициализация таблицы."""
-        super().__init__(data, filters, sorters, schema=schema)
+        super().__init__(data, filters, sorters, schema=schema, where=where)
         self.fields = fields
 
     def display(self):
         """Применяет фильтры и сортировки."""
-        for apply in self.filters:
-            self.data = filter_by(self.data, apply)
-        self.data = sort_by(self.data, self.sorters)
-        return self.schema(self.data, self.fields)
+        return self.schema(self.apply(), self.fields)
@@ -18,13 +18,16 @@ from mls.manager.dts.custom_types import TransferCreateOptional
 from mls.manager.dts.custom_types import TransferCreateRequired
 from mls.manager.dts.custom_types import TransferQuery
 from mls.manager.dts.decorators import arg_transfer_ids
+from mls.manager.dts.decorators import opt_columns
 from mls.manager.dts.decorators import opt_history_id
+from mls.manager.dts.decorators import opt_list_output_format
 from mls.manager.dts.decorators import opt_output_format
 from mls.manager.dts.decorators import opt_page_number
 from mls.manager.dts.decorators import opt_page_size
 from mls.manager.dts.decorators import opt_source_name
 from mls.manager.dts.decorators import opt_transfer_id
 from mls.manager.dts.decorators import opt_transfer_id_optional
+from mls.manager.dts.decorators import opt_where
 from mls.manager.dts.help import TransferActivateHelp
 from mls.manager.dts.help import TransferCreateHelp
 from mls.manager.dts.help import TransferDeactivateHelp
@@ -39,8 +42,12 @@ from mls.manager.dts.table import DataTransferTableView
 from mls.manager.dts.table import display_transfers
 from mls.manager.dts.utils import client
 from mls.manager.dts.utils import process_json
+from mls.manager.dts.utils import select_items
 from mls.manager.dts.utils import validate_ints
 from mls.utils.common_types import RussianChoice
+from mls.utils.output import echo_response
+from mls.utils.output import echo_result
+from mls.utils.output import STREAM_FORMATS
 from mls.utils.style import success_format
 from mls_core.client import DTSApi
 
@@ -210,7 +217,7 @@ def create(
 
             u_input.crontab.update(crontab)  # type: ignore
 
-    click.echo(success_format(api.transfer_create(Transfer(**asdict(u_input)))))
+    echo_result(api.transfer_create(Transfer(**asdict(u_input))), api.USER_OUTPUT_PREFERENCE)
 
 
 @transfer.command(cls=TransferDeleteHelp, name='delete')
@@ -224,11 +231,12 @@ def delete(api, transfer_ids):
 
     Пример: mls transfer delete ebe0e039-2f8c-4d54-8298-92fbff2989ba
     """
-    click.echo(success_format(api.transfer_delete(transfer_ids=transfer_ids)))
+    echo_result(api.transfer_delete(transfer_ids=transfer_ids), api.USER_OUTPUT_PREFERENCE)
 
 
 @transfer.command(cls=TransferListHelp, name='list')
-@opt_output_format
+@opt_list_output_format
+@opt_columns
 @opt_page_size
 @opt_page_number
 @click.option(
@@ -240,18 +248,26 @@ def delete(api, transfer_ids):
     multiple=True,
     default=None,
 )
+@opt_where
 @client
-def list_(api: DTSApi, page_size: int, page_number: int, fields: list):
+def list_(api: DTSApi, page_size: int, page_number: int, fields: list, where, columns):
     """Команда получения всех правил переноса пользователя.
 
     Синтаксис: mls transfer list [options]
 
     Пример: mls transfer list --field cluster-name --field description --field source-category
+
+    Пример: mls transfer list --where "strategy=write_all and name~^backup"
+
+    Пример: mls transfer list -O ndjson --columns transfer_id,name,query.source
     """
     transfers_list = api.transfer_list()
 
-    if api.USER_OUTPUT_PREFERENCE == 'json':
-        process_json(transfers_list, page_number, page_size)
+    if api.USER_OUTPUT_PREFERENCE in STREAM_FORMATS or columns and api.USER_OUTPUT_PREFERENCE == 'json':
+        echo_response(select_items(transfers_list, page_number, page_size, where), api.USER_OUTPUT_PREFERENCE, columns or ())
+
+    elif api.USER_OUTPUT_PREFERENCE == 'json':
+        process_json(transfers_list, page_number, page_size, where)
 
     else:
         result = DataTransferTableView(
@@ -260,6 +276,7 @@ def list_(api: DTSApi, page_size: int, page_number: int, fields: list):
             sorters=[],
             schema=display_transfers,
             fields=fields,
+            where=where,
         ).display()
 
         click.echo(success_format(result))
@@ -276,7 +293,7 @@ def get(api: DTSApi, transfer_id: str):
 
     Пример: mls transfer get --transfer-id 12c408ec-a4cd-4346-8f76-7364687d14f7
     """
-    click.echo(success_format(api.transfer_get(transfer_id=transfer_id)))
+    echo_result(api.transfer_get(transfer_id=transfer_id), api.USER_OUTPUT_PREFERENCE)
 
 
 @transfer.command(cls=TransferActivateHelp, name='activate')
@@ -290,7 +307,7 @@ def activate(api: DTSApi, transfer_id: str):
 
     Пример: mls transfer activate --transfer-id 12c408ec-a4cd-4346-8f76-7364687d14f6
     """
-    click.echo(success_format(api.transfer_switch(transfer_id=transfer_id, state=True)))
+    echo_result(api.transfer_switch(transfer_id=transfer_id, state=True), api.USER_OUTPUT_PREFERENCE)
 
 
 @transfer.command(cls=TransferDeactivateHelp, name='deactivate')
@@ -304,17 +321,16 @@ def deactivate(api: DTSApi, transfer_id: str):
 
     Пример: mls transfer deactivate --transfer-id 12c408ec-a4cd-4346-8f76-7364687d14f6
     """
-    click.echo(
-        success_format(api.transfer_switch(transfer_id=transfer_id, state=False)),
-    )
+    echo_result(api.transfer_switch(transfer_id=transfer_id, state=False), api.USER_OUTPUT_PREFERENCE)
 
 
 @transfer.command(cls=TransferLogsHelp, name='logs')
 @opt_transfer_id
 @opt_history_id
-@opt_output_format
+@opt_list_output_format
+@opt_columns
 @client
-def logs(api: DTSApi, transfer_id: str | None = None, history_id: str | None = None):
+def logs(api: DTSApi, transfer_id: str | None = None, history_id: str | None = None, columns=None):
     """Команда получения логов (событий) переноса.
 
     Синтаксис: mls transfer logs [options]
@@ -326,11 +342,11 @@ def logs(api: DTSApi, transfer_id: str | None = None, history_id: str | None = N
             'Пропущена опция (необходимо передать --transfer_id или --history-id)',
         )
 
-    click.echo(
-        success_format(
-            api.transfer_logs(transfer_id=transfer_id, history_id=history_id),
-        ),
-    )
+    events = api.transfer_logs(transfer_id=transfer_id, history_id=history_id)
+    if api.USER_OUTPUT_PREFERENCE in STREAM_FORMATS or columns:
+        echo_response(events, api.USER_OUTPUT_PREFERENCE, columns or ())
+    else:
+        echo_result(events, api.USER_OUTPUT_PREFERENCE)
 
 
 @transfer.command(cls=TransferStopHelp, name='stop')
@@ -355,7 +371,7 @@ def cancel(api: DTSApi, transfer_id: str, execution_date: datetime):
 
     Пример: mls transfer stop --transfer-id 12c408ec-a4cd-4346-8f76-7364687d14f6 --execution-date 1970-01-13T14:55:35
     """
-    click.echo(success_format(api.transfer_cancel(transfer_id, execution_date)))
+    echo_result(api.transfer_cancel(transfer_id, execution_date), api.USER_OUTPUT_PREFERENCE)
 
 
 @transfer.command(cls=TransferUpdateHelp, name='update')
@@ -506,19 +522,24 @@ def update(
 
     t = {k: v for k, v in t.items() if v is not None}
 
-    click.echo(success_format(api.transfer_update(transfer_id, t)))
+    echo_result(api.transfer_update(transfer_id, t), api.USER_OUTPUT_PREFERENCE)
 
 
 @transfer.command(cls=TransferHistoryHelp, name='history')
 @opt_transfer_id_optional
 @opt_source_name
-@opt_output_format
+@opt_list_output_format
+@opt_columns
 @client
-def history(api: DTSApi, transfer_id: str | None, source_name: str | None):
+def history(api: DTSApi, transfer_id: str | None, source_name: str | None, columns=None):
     """Команда получения истории запусков правил(а) переноса.
 
     Синтаксис: mls transfer history [options]
 
     Пример: mls transfer history --transfer-id 12c408ec-a4cd-4346-8f76-7364687d14f6 --source-name my-file.jpg
     """
-    click.echo(success_format(api.transfer_history(transfer_id, source_name)))
+    launches = api.transfer_history(transfer_id, source_name)
+    if api.USER_OUTPUT_PREFERENCE in STREAM_FORMATS or columns:
+        echo_response(launches, api.USER_OUTPUT_PREFERENCE, columns or ())
+    else:
+        echo_result(launches, api.USER_OUTPUT_PREFERENCE)
@@ -12,6 +12,7 @@ from mls.manager.dts.custom_types import SQLType
 from mls.manager.job.custom_types import JobDebugOptions
 from mls.manager.job.custom_types import ProfileOptions
 from mls.manager.job.utils import read_profile
+from mls.utils.output import echo_result
 from mls.utils.settings import DEFAULT_PROFILE
 from mls.utils.style import success_format
 from mls_core.client import DTSApi
@@ -46,10 +47,13 @@ def client(func):
     @common_cli_options
     def _init(*args, **kwargs):
         """Инициализация клиента PublicApi."""
-        profile = read_profile(kwargs.pop('profile'))
+        profile_name = kwargs.pop('profile')
+        profile = read_profile(profile_name)
 
         have_defaults = dict(
             debug=kwargs.pop('debug'),
+            profile=profile_name,
+            rate_limit=profile.get('rate_limit'),
         )
         stable_rules = dict(
             client_id=profile.get('key_id', ''),
@@ -95,9 +99,6 @@ def validate_connector_exists(api, connector_id, connector_type):
     """Проверяет наличие коннектора."""
     try:
         conn_list = api.conn_list(connector_ids=[connector_id], typ=connector_type)
-        if isinstance(conn_list, str):
-            conn_list = json.loads(conn_list)
-
     except Exception as e:
         raise click.exceptions.UsageError(
             f'Не удалось проверить доступность коннектора с ID: {connector_id}',
@@ -128,13 +129,32 @@ def paginate(data, page, per_page):
         raise click.ClickException(message=str(e))
 
 
-def process_json(data: str, page_number: int, page_size: int):
-    """Обработка и вывод данных в формате JSON."""
-    if page_size and page_number:
-        data = json.loads(data)
-        click.echo(paginate(data=data, page=page_number, per_page=page_size))
+def process_json(data, page_number: int, page_size: int, where=None):
+    """Вывод ответа со списком в формате JSON.
+
+    :param data: Разобранный ответ API; ответ, не являющийся списком, выводится как есть.
+    :param where: Предикат отбора элементов списка (--where).
+    """
+    data = select_items(data, 0, 0, where)
+    if page_size and page_number and isinstance(data, list):
+        paginate(data=data, page=page_number, per_page=page_size)
     else:
-        click.echo(success_format(data))
+        echo_result(data, 'json')
+
+
+def select_items(data, page_number: int, page_size: int, where=None):
+    """Элементы списка, подходящие под условие where, на странице page_number (если задан page_size).
+
+    Ответ, не являющийся списком, возвращается без изменений.
+    """
+    if not isinstance(data, list):
+        return data
+    if where is not None:
+        data = [item for item in data if isinstance(item, dict) and where(item)]
+    if page_size and page_number:
+        start = (page_number - 1) * page_size
+        data = data[start:start + page_size]
+    return data
 
 
 def validate_ints(ctx, param, value, min_val, max_val):
@@ -0,0 +1,226 @@
+"""Локальный архив логов завершённых задач.
+
+Журнал загружается один раз и хранится в ~/.mls/logs по sha256 содержимого:
+
+    objects/ab/abcdef....gz        - журнал, сжатый блоками (каждый блок - отдельный член gzip)
+    objects/ab/abcdef....idx.json  - индекс блоков: смещение, длина, первая строка, число строк, время
+    refs/<воркспейс>/<регион>/<имя задачи>.json - ссылка задачи на объект
+
+Воркспейс, регион и имя задачи в пути ссылки экранируются (см. _component),
+поэтому задачи с одним именем в разных воркспейсах и регионах не перезаписывают
+ссылки друг друга, а имя с / или .. не выходит за пределы каталога refs.
+
+Запросы --tail, --grep и по времени читают с диска только нужные блоки.
+Время строки - метка в начале строки (2024-01-31 12:00:00 или 2024-01-31T12:00:00);
+строки без метки относятся ко времени предыдущей строки.
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+import urllib.parse
+from datetime import datetime
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Pattern
+
+from mls.utils.settings import LOG_ARCHIVE_DIR
+
+INDEX_VERSION = 1
+BLOCK_SIZE = 1024 * 1024
+ARCHIVE_BATCH = 4096
+TIMESTAMP = re.compile(rb'^\W{0,2}(\d{4}-\d{2}-\d{2})[T ](\d{2}:\d{2}:\d{2})')
+
+
+class Block(NamedTuple):
+    """Сжатый блок журнала."""
+    offset: int
+    length: int
+    first_line: int
+    lines: int
+    since: Optional[str]
+    until: Optional[str]
+
+
+def line_time(line: bytes) -> Optional[str]:
+    """Метка времени в начале строки в виде YYYY-MM-DDTHH:MM:SS или None."""
+    match = TIMESTAMP.match(line)
+    return f'{match[1].decode()}T{match[2].decode()}' if match else None
+
+
+def _component(value: str) -> str:
+    """Компонент пути ссылки: все символы, кроме букв, цифр, - и _, экранируются; пустое значение - %."""
+    return urllib.parse.quote(value, safe='').replace('.', '%2E') or '%'
+
+
+def _write_json(path: str, data: dict):
+    """Атомарная запись JSON файла."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+        json.dump(data, file)
+    os.replace(temp_path, path)
+
+
+class LogArchive:
+    """Хранилище журналов логов задач."""
+
+    def __init__(self, root: Optional[str] = None, block_size: int = BLOCK_SIZE, workspace: str = '', region: str = ''):
+        """Инициализация хранилища.
+
+        :param root: Каталог хранилища, по умолчанию ~/.mls/logs.
+        :param block_size: Размер несжатого блока в байтах.
+        :param workspace: Воркспейс задач, ссылки которых читает и пишет хранилище.
+        :param region: Регион задач.
+        """
+        self.root = root or LOG_ARCHIVE_DIR
+        self.block_size = block_size
+        self.workspace = workspace
+        self.region = region
+
+    def _object(self, digest: str, suffix: str) -> str:
+        return os.path.join(self.root, 'objects', digest[:2], digest + suffix)
+
+    def _ref(self, name: str) -> str:
+        return os.path.join(self.root, 'refs', _component(self.workspace), _component(self.region), f'{_component(name)}.json')
+
+    def ref(self, name: str) -> Optional[dict]:
+        """Ссылка задачи на архив или None, если журнал задачи не сохранён."""
+        try:
+            with open(self._ref(name), encoding='utf-8') as file:
+                ref = json.load(file)
+        except (OSError, ValueError):
+            return None
+        return ref if os.path.exists(self._object(ref['object'], '.gz')) else None
+
+    def save(self, name: str, chunks: Iterable[bytes]) -> dict:
+        """Сохраняет журнал задачи, полученный по частям, и возвращает ссылку на него."""
+        os.makedirs(os.path.join(self.root, 'objects'), exist_ok=True)
+        digest = hashlib.sha256()
+        blocks: List[Block] = []
+        pending: List[bytes] = []
+        size = total = offset = 0
+        current: Optional[str] = None
+        since: Optional[str] = None
+
+        descriptor, temp_path = tempfile.mkstemp(dir=os.path.join(self.root, 'objects'), suffix='.tmp')
+        with os.fdopen(descriptor, 'wb') as file:
+            def flush():
+                nonlocal offset, size, total, pending, since
+                if not pending:
+                    return
+                data = gzip.compress(b''.join(pending))
+                file.write(data)
+                blocks.append(Block(offset, len(data), total, len(pending), since, current))
+                offset += len(data)
+                total += len(pending)
+                pending, size, since = [], 0, current
+
+            rest = b''
+            for chunk in chunks:
+                digest.update(chunk)
+                lines = (rest + chunk).split(b'\n')
+                rest = lines.pop()
+                for line in lines:
+                    current = line_time(line) or current
+                    since = since or current
+                    pending.append(line + b'\n')
+                    size += len(line) + 1
+                    if size >= self.block_size:
+                        flush()
+            if rest:
+                current = line_time(rest) or current
+                since = since or current
+                pending.append(rest)
+            flush()
+
+        object_id = digest.hexdigest()
+        target = self._object(object_id, '.gz')
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if os.path.exists(target):
+            os.remove(temp_path)
+        else:
+            os.replace(temp_path, target)
+        _write_json(self._object(object_id, '.idx.json'), {
+            'version': INDEX_VERSION, 'lines': total, 'blocks': [list(block) for block in blocks],
+        })
+        ref = {'object': object_id, 'lines': total, 'size': offset, 'archived_at': time.time()}
+        _write_json(self._ref(name), ref)
+        return ref
+
+    def _blocks(self, object_id: str) -> List[Block]:
+        with open(self._object(object_id, '.idx.json'), encoding='utf-8') as file:
+            index = json.load(file)
+        return [Block(*block) for block in index['blocks']]
+
+    def query(
+        self,
+        name: str,
+        tail: int = 0,
+        grep: Optional[Pattern] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Iterator[str]:
+        """Строки сохранённого журнала задачи.
+
+        :param name: Имя задачи.
+        :param tail: Число последних подходящих строк (0 - все).
+        :param grep: Регулярное выражение для отбора строк.
+        :param since: Строки не раньше указанного времени.
+        :param until: Строки не позже указанного времени.
+        """
+        ref = self.ref(name)
+        if ref is None:
+            return
+        start = since.isoformat(timespec='seconds') if since else None
+        end = until.isoformat(timespec='seconds') if until else None
+
+        def overlaps(block: Block) -> bool:
+            if not start and not end:
+                return True
+            if block.until is None:
+                return False
+            return not (start and block.until < start) and not (end and block.since is not None and block.since > end)
+
+        def in_range(current: Optional[str]) -> bool:
+            if not start and not end:
+                return True
+            if current is None:
+                return False
+            return not (start and current < start) and not (end and current > end)
+
+        def matches(line: bytes, current: Optional[str]) -> bool:
+            if not in_range(current):
+                return False
+            return grep is None or bool(grep.search(line.decode('utf-8', errors='replace')))
+
+        def read(block: Block) -> List[bytes]:
+            with open(self._object(ref['object'], '.gz'), 'rb') as file:
+                file.seek(block.offset)
+                data = gzip.decompress(file.read(block.length))
+            selected, current = [], block.since
+            # Каждая строка блока, кроме последней строки журнала без перевода строки, заканчивается \n.
+            for line in (data[:-1] if data.endswith(b'\n') else data).split(b'\n'):
+                current = line_time(line) or current
+                if matches(line, current):
+                    selected.append(line)
+            return selected
+
+        blocks = [block for block in self._blocks(ref['object']) if overlaps(block)]
+        if tail:
+            collected: List[bytes] = []
+            for block in reversed(blocks):
+                collected[:0] = read(block)
+                if len(collected) >= tail:
+                    break
+            selected: Iterable[bytes] = collected[-tail:]
+        else:
+            selected = (line for block in blocks for line in read(block))
+        for line in selected:
+            yield line.decode('utf-8', errors='replace')
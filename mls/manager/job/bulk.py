@@ -0,0 +1,146 @@
+"""Групповые операции над задачами обучения.
+
+Сбор имён задач из аргументов, файла и фильтров списка задач, чтение набора
+манифестов, параллельное выполнение действия в одной авторизованной сессии
+и сводная таблица результатов. Частоту запросов ограничивает клиент
+(TrainingJobApi.set_rate_limit, см. mls_core.ratelimit).
+"""
+import fnmatch
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import click
+import requests
+import yaml  # type: ignore
+from tabulate import tabulate  # type: ignore
+
+from mls_core import TrainingJobApi
+
+MESSAGE_WIDTH = 80
+SELECT_LIMIT = 6000
+MANIFEST_EXTENSIONS = ('.yaml', '.yml')
+DEFAULT_MANIFEST = 'Mls.yaml'
+
+
+class BulkResult(NamedTuple):
+    """Результат действия над одной задачей."""
+    name: str
+    ok: bool
+    message: str
+
+
+def read_names(path: Optional[str]) -> List[str]:
+    """Читает имена задач из файла: по одному в строке, пустые строки и строки с # пропускаются."""
+    if not path:
+        return []
+    with open(path, encoding='utf-8') as file:
+        return [line.strip() for line in file if line.strip() and not line.strip().startswith('#')]
+
+
+def read_manifests(paths: Sequence[str]) -> List[Tuple[str, dict]]:
+    """Читает секции job из манифестов.
+
+    Каталог раскрывается в отсортированный список YAML файлов, файл может содержать
+    несколько документов. Без путей используется Mls.yaml из текущего каталога, если он есть.
+
+    :return: Пары (источник, секция job); источник документа многодокументного файла - путь#номер.
+    :raises click.ClickException: Файл указан несколько раз (явно или через каталог) или не читается.
+    """
+    if not paths:
+        paths = [DEFAULT_MANIFEST] if os.path.isfile(DEFAULT_MANIFEST) else []
+        if not paths:
+            return [('', {})]
+
+    files: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(
+                os.path.join(path, name) for name in os.listdir(path) if name.endswith(MANIFEST_EXTENSIONS)
+            ))
+        else:
+            files.append(path)
+
+    seen = set()
+    for file_path in files:
+        real_path = os.path.realpath(file_path)
+        if real_path in seen:
+            raise click.ClickException(f"Манифест '{file_path}' указан несколько раз")
+        seen.add(real_path)
+
+    manifests = []
+    for file_path in files:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                documents = [document for document in yaml.safe_load_all(file) if document is not None]
+        except Exception as e:
+            raise click.ClickException(f"Ошибка чтения YAML файла '{file_path}': {e}")
+        for index, document in enumerate(documents):
+            source = file_path if len(documents) == 1 else f'{file_path}#{index + 1}'
+            manifests.append((source, (document or {}).get('job', {})))
+    return manifests
+
+
+def select_jobs(
+    api_job: TrainingJobApi, region: str, queue: Optional[str], allocation_name: Optional[str], status, pattern: Optional[str],
+) -> List[str]:
+    """Имена задач, подходящих под фильтры списка задач и шаблон имени (fnmatch)."""
+    response = api_job.jobs(region, queue, allocation_name, status, SELECT_LIMIT, 0)
+    names = [job.get('job_name', '') for job in response.get('jobs', [])]
+    return [name for name in names if name and (not pattern or fnmatch.fnmatchcase(name, pattern))]
+
+
+def unique(names: Iterable[str]) -> List[str]:
+    """Имена без повторов в порядке первого появления."""
+    return list(dict.fromkeys(names))
+
+
+def _message(result) -> str:
+    if isinstance(result, dict):
+        result = result.get('message') or result.get('detail') or result.get('status') or json.dumps(result, ensure_ascii=False)
+    text = ' '.join(str(result).split())
+    return text if len(text) <= MESSAGE_WIDTH else text[:MESSAGE_WIDTH - 3] + '...'
+
+
+def _error_message(error: requests.exceptions.RequestException) -> str:
+    response = error.response
+    if response is None:
+        return _message(error)
+    try:
+        body = response.json()
+    except ValueError:
+        body = response.text
+    return _message(f'{response.status_code}: {_message(body)}')
+
+
+def run_bulk(action: Callable[[str], object], names: List[str], workers: int) -> List[BulkResult]:
+    """Параллельно выполняет действие для каждой задачи.
+
+    :param action: Функция, вызываемая с именем задачи; ошибка HTTP означает неудачу.
+    :param names: Имена задач.
+    :param workers: Число одновременно выполняемых запросов.
+    :return: Результаты в порядке имён.
+    """
+    def run(name: str) -> BulkResult:
+        try:
+            return BulkResult(name, True, _message(action(name)))
+        except requests.exceptions.RequestException as error:
+            return BulkResult(name, False, _error_message(error))
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(names) or 1))) as executor:
+        return list(executor.map(run, names))
+
+
+def results_table(results: List[BulkResult], headers: Sequence[str] = ('Задача', 'Результат', 'Сообщение')) -> str:
+    """Сводная таблица результатов с итоговой строкой."""
+    rows = [(result.name, 'успешно' if result.ok else 'ошибка', result.message) for result in results]
+    failed = sum(not result.ok for result in results)
+    table = tabulate(rows, headers, tablefmt='pretty', colalign=('left', 'left', 'left'))
+    return f'{table}\nВсего: {len(results)}, успешно: {len(results) - failed}, с ошибкой: {failed}'
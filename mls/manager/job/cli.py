@@ -1,20 +1,42 @@
 """Описание интерфейса запуска распределённых задач обучения."""
-import copy
+import functools
+import itertools
+import logging
+import shutil
+import sys
 import time
 from typing import Callable
+from typing import Iterator
+from typing import List
+from typing import Optional
 
 import click
-
+import requests
+
+from .archive import ARCHIVE_BATCH
+from .archive import LogArchive
+from .bulk import read_names
+from .bulk import results_table
+from .bulk import run_bulk
+from .bulk import select_jobs
+from .bulk import unique
+from .constants import active_job_statuses
 from .constants import cluster_keys
+from .constants import job_query_params
+from .constants import job_statuses
 from .constants import job_types
 from .custom_types import filter_sort_choice
 from .custom_types import FilterOptions
 from .custom_types import JobRecommenderOptions
 from .custom_types import SortOptions
 from .dataclasses import Job
+from .decorators import bulk_selected
+from .decorators import columns_selected
 from .decorators import limit_selected
 from .decorators import offset_selected
+from .decorators import opt_list_output_format
 from .decorators import opt_output_format
+from .decorators import page_size_selected
 from .decorators import queue_selected
 from .decorators import regions_selected
 from .decorators import status_of_task
@@ -29,13 +51,45 @@ from .help import RunHelp
 from .help import StatusHelp
 from .help import TableHelp
 from .help import TypeHelp
+from .help import WaitHelp
 from .help import YamlHelp
+from .paging import prefetch
+from .sinks import open_sink
+from .sinks import SINKS
 from .utils import apply_options
 from .utils import job_client
+from .wait import AdaptiveInterval
+from .wait import EXIT_TIMEOUT
+from .wait import StatusPoller
+from .wait import TERMINAL_STATUSES
+from .wait import wait_jobs
+from .wait import WATCH_INTERVAL
+from .wait import WATCH_MAX_INTERVAL
 from mls.schema import JobTableView
+from mls.schema import LiveTable
+from mls.schema.live import SCREEN_ENTER
+from mls.schema.live import SCREEN_EXIT
+from mls.schema.planner import plan_query
+from mls.schema.stream import render_table
+from mls.schema.table import JOB_HEADERS
+from mls.schema.table import job_row
+from mls.schema.table import TableView
 from mls.utils.common_types import Path
 from mls.utils.common_types import PositiveIntWithZeroView
+from mls.utils.common_types import RegexView
+from mls.utils.common_types import RussianChoice
+from mls.utils.common_types import WhereView
+from mls.utils.output import echo_list
+from mls.utils.output import echo_result
+from mls.utils.output import render
+from mls.utils.output import STREAM_FORMATS
+from mls.utils.style import error_format
+from mls.utils.style import message_format
 from mls.utils.style import success_format
+from mls_core.logs import LogFollower
+from mls_core.logs import multiplex
+from mls_core.setting import JOB_PAGE_SIZE
+from mls_core.setting import LOG_CHUNK_SIZE
 
 
 @click.group(cls=JobHelp)
@@ -48,90 +102,253 @@ def job():
 
 
 @job.command(cls=LogHelp)
-@click.argument('name')
+@click.argument('names', nargs=-1, required=True)
 @click.option('-t', '--tail', type=PositiveIntWithZeroView(), help='Отображает последнюю часть файла логов', default=0)
 @click.option('-v', '--verbose', is_flag=True, help='Подробный вывод журнала логов', default=False)
 @click.option('-w', '--wait', is_flag=True, help='Флаг ожидания смены статуса с pending', default=False)
+@click.option('--archive', is_flag=True, help='Сохранить логи завершённой задачи локально и читать их с диска', default=False)
+@click.option('--grep', type=RegexView(), help='Регулярное выражение для отбора строк (с --archive)', default=None)
+@click.option('--since', type=click.DateTime(), help='Строки не раньше указанного времени (с --archive)', default=None)
+@click.option('--until', type=click.DateTime(), help='Строки не позже указанного времени (с --archive)', default=None)
+@click.option(
+    '--sink', type=RussianChoice(SINKS), default='stdout',
+    help='Приёмник строк: stdout, file (с ротацией), gzip или jsonl (с временем получения)',
+)
+@click.option('--sink_path', type=Path(dir_okay=False), help='Файл приёмника file, gzip или jsonl', default=None)
+@click.option('--rotate_bytes', type=PositiveIntWithZeroView(), help='Размер файла для ротации приёмника file (0 - без ротации)', default=0)
+@click.option('--rotate_count', type=PositiveIntWithZeroView(), help='Число сохраняемых предыдущих файлов приёмника file', default=5)
+@click.option('--chunk_size', type=click.IntRange(min=1), help='Размер части потока логов в байтах', default=LOG_CHUNK_SIZE)
 @job_client
-def logs(api_job, name, tail, verbose, region, wait):
+def logs(
+    api_job, names, tail, verbose, region, wait, archive, grep, since, until,
+    sink, sink_path, rotate_bytes, rotate_count, chunk_size,
+):
     """Команда получения журнала логов.
 
-    Синтаксис: mls job logs [name] [options]
+    Синтаксис: mls job logs [name ...] [options]
 
     Пример: mls job logs lm-mpi-job-00000000-0000-0000-0000-000000000000 -w
 
-    """
-    copy_client = copy.deepcopy(api_job)
-    copy_client.USER_OUTPUT_PREFERENCE = None
-    status__: Callable = lambda: copy_client.get_job_status(name).get('status')
+    Пример: mls job logs lm-mpi-job-00000000-0000-0000-0000-000000000000 --archive --grep 'loss' --since '2024-01-31 12:00:00'
+
+    Пример: mls job logs lm-mpi-job-00000000-0000-0000-0000-000000000000 --sink file --sink_path train.log --rotate_bytes 104857600
 
+    Логи нескольких задач выводятся одновременно, строка начинается с имени задачи.
+    С --archive журнал завершённой задачи загружается один раз, повторные запросы выполняются без обращения к API.
+    """
+    if (grep or since or until) and not archive:
+        raise click.UsageError('Опции --grep, --since и --until используются вместе с --archive')
+    if archive and len(names) != 1:
+        raise click.UsageError('С --archive укажите одну задачу')
+
+    with open_sink(sink, sink_path, rotate_bytes, rotate_count) as output:
+        if archive:
+            lines = _archived_logs(api_job, names[0], region, tail, verbose, grep, since, until)
+            while batch := list(itertools.islice(lines, ARCHIVE_BATCH)):
+                output.write(batch)
+            return
+
+        if len(names) == 1:
+            for batch in _job_logs(api_job, names[0], region, tail, verbose, wait, chunk_size):
+                output.write(batch)
+            return
+
+        sources = {
+            name: functools.partial(_job_lines, api_job, name, region, tail, verbose, wait, chunk_size) for name in names
+        }
+        api_job.set_pool_maxsize(len(sources) + 1)
+        for source, line in multiplex(sources):
+            output.write([line], source)
+
+
+def _archived_logs(api_job, name, region, tail, verbose, grep, since, until):
+    """Строки журнала из локального архива; журнал загружается, если задача ещё не сохранена."""
+    store = LogArchive(workspace=api_job.workspace_id, region=region or '')
+    if store.ref(name) is None:
+        status_ = api_job.get_job_status(name).get('status') or ''
+        if status_.lower() in active_job_statuses:
+            raise click.ClickException(f'Архивируются только завершённые задачи, статус задачи {name}: {status_}')
+        try:
+            store.save(name, api_job.download_logs(name, region, verbose))
+        except requests.exceptions.HTTPError as error:
+            raise click.ClickException(f'Не удалось загрузить логи задачи {name}: {error}') from error
+    return store.query(name, tail, grep, since, until)
+
+
+def _wait_pending(status__: Callable):
+    """Ожидание смены статуса с pending; выдаёт статус при каждой проверке."""
+    iteration = 0
+    while True:
+        current_status = status__()
+        if current_status == 'pending':
+            time.sleep(1 * (iteration + 0.2))
+            iteration += 1
+            yield current_status
+        else:
+            break
+
+
+def _job_logs(api_job, name, region, tail, verbose, wait, chunk_size):
+    """Логи задачи частями строк: поток работающей задачи в байтах или весь журнал завершённой.
+
+    Статус ожидания (--wait) выводится в stderr и не попадает в приёмник строк.
+    """
+    status__: Callable = lambda: api_job.get_job_status(name).get('status')
     if wait:
-        iteration = 0
-        while True:
-            current_status = status__()
-            if current_status == 'pending':
-                time.sleep(1 * (iteration + 0.2))
-                iteration += 1
-                click.echo(success_format(current_status))
-            else:
-                break
+        for current_status in _wait_pending(status__):
+            click.echo(message_format(current_status), err=True)
 
     if status__() == 'running':
-        generator = api_job.stream_logs(name, region, tail, verbose)
-        counter = 0
-        last_position = 0
-        while True:
-            try:
-                value = next(generator)
-            except StopIteration:
-                last_position = counter
-                if status__() == 'running':
-                    generator = api_job.stream_logs(name, region, tail, verbose)
-                else:
-                    break
-            else:
-                if last_position > 0:
-                    last_position -= 1
-                    continue
-                counter += 1
-                click.echo(success_format(value))
-
+        yield from LogFollower(
+            lambda tail_: api_job.stream_logs(name, region, tail_, verbose, chunk_size, True), lambda: status__() == 'running', tail,
+        ).batches()
     else:
-        click.echo(success_format(api_job.get_job_logs(name, region, tail, verbose)))
+        yield str(render(api_job.get_job_logs(name, region, tail, verbose), api_job.USER_OUTPUT_PREFERENCE)).splitlines()
+
+
+def _job_lines(api_job, name, region, tail, verbose, wait, chunk_size):
+    """Строки логов задачи по одной (источник multiplex)."""
+    return itertools.chain.from_iterable(_job_logs(api_job, name, region, tail, verbose, wait, chunk_size))
 
 
 @job.command(cls=KillHelp)
-@click.argument('name')
+@click.argument('names', nargs=-1)
+@bulk_selected
 @opt_output_format
 @job_client
-def kill(api_job, name, region):
-    """Команда остановки задачи обучения в регионе.
+def kill(api_job, names, region, **selectors):
+    """Команда остановки задач обучения в регионе.
 
-    Синтаксис: mls job kill [name] [options]
+    Синтаксис: mls job kill [name ...] [options]
 
     Пример: mls job kill lm-mpi-job-00000000-0000-0000-0000-000000000000
 
+    Пример: mls job kill --status Failed --name_pattern 'sweep-*' --workers 16
+
+    """
+    if len(names) == 1 and not _has_selectors(**selectors):
+        echo_result(api_job.delete_job(names[0], region), api_job.USER_OUTPUT_PREFERENCE)
+    else:
+        _bulk(api_job, lambda name: api_job.kill(name, region), names, region, **selectors)
+
+
+def _has_selectors(from_file, status, queue, allocation_name, name_pattern, **_):
+    """Признак выбора задач файлом или фильтрами."""
+    return bool(from_file or status or queue or allocation_name or name_pattern)
 
+
+def _bulk(api_job, action, names, region, from_file, status, queue, allocation_name, name_pattern, workers):
+    """Выполняет действие над набором задач и выводит сводную таблицу.
+
+    Код завершения 1, если действие не удалось хотя бы для одной задачи.
     """
-    click.echo(success_format(api_job.delete_job(name, region)))
+    names = [*names, *read_names(from_file)]
+    if status or queue or allocation_name or name_pattern:
+        names.extend(select_jobs(api_job, region, queue, allocation_name, status, name_pattern))
+    names = unique(names)
+    if not names:
+        if _has_selectors(from_file, status, queue, allocation_name, name_pattern):
+            click.echo(success_format('Нет задач, подходящих под условия'))
+            return
+        raise click.UsageError('Укажите имена задач, --from_file или фильтры выбора задач')
+
+    api_job.set_pool_maxsize(max(workers, 1))
+    results = run_bulk(action, names, workers)
+    table = results_table(results)
+    if all(result.ok for result in results):
+        click.echo(success_format(table))
+    else:
+        click.echo(error_format(table))
+        sys.exit(1)
 
 
 @job.command(cls=RunHelp)
 @click.option(
-    '-c', '--config', cls=JobRecommenderOptions, type=Path(exists=True), help='Путь к YAML манифесту с описанием задачи', default=None,
+    '-c', '--config', cls=JobRecommenderOptions, type=Path(exists=True), multiple=True,
+    help='Путь к YAML манифесту с описанием задачи или к каталогу манифестов (можно указать несколько раз, повтор файла - ошибка)',
+)
+@click.option(
+    '-W', '--parallel', cls=JobRecommenderOptions, type=PositiveIntWithZeroView(), default=8,
+    help='Число одновременно отправляемых задач при нескольких манифестах',
+)
+@click.option(
+    '--rate', cls=JobRecommenderOptions, type=click.FloatRange(min=0), default=0,
+    help='Не более указанного числа отправок задач в секунду (0 - без ограничения)',
 )
 @regions_selected
 @opt_output_format
 @apply_options
 @job_client
-def submit(api_job, region, type_job, *_, **__):
+def submit(api_job, region, type_job, type_jobs, parallel, rate, *_, **__):
     """Команда для отправки задачи в очередь на выполнение.
 
     Синтаксис: mls job submit [options]
 
     Пример: mls job submit --config ./binary.yaml
+
+    Пример: mls job submit --config ./sweep/ --parallel 16 --rate 5
+
+    Манифесты каталога и документы многодокументного YAML отправляются параллельно
+    после проверки всех манифестов. Код завершения 1, если хотя бы одна задача не отправлена.
     """
-    click.echo(success_format(api_job.run_job(type_job.to_json(region))))
+    if len(type_jobs) <= 1:
+        echo_result(api_job.run_job(type_job.to_json(region)), api_job.USER_OUTPUT_PREFERENCE)
+        return
+
+    payloads = {source: type_job_.to_json(region) for source, type_job_ in type_jobs}
+
+    def send(source: str):
+        response = api_job.submit(payloads[source])
+        return (response.get('job_name') or response) if isinstance(response, dict) else response
+
+    api_job.set_pool_maxsize(max(parallel, 1))
+    if rate:
+        # Запас 1: отправки идут не чаще rate в секунду и без начального всплеска.
+        api_job.set_rate_limit(f'write={rate}:1')
+    results = run_bulk(send, list(payloads), parallel)
+    table = results_table(results, ('Манифест', 'Результат', 'Задача'))
+    if all(result.ok for result in results):
+        click.echo(success_format(table))
+    else:
+        click.echo(error_format(table))
+        sys.exit(1)
+
+
+@job.command(cls=WaitHelp)
+@click.argument('names', nargs=-1, required=True)
+@click.option(
+    '-u', '--until', 'until_statuses', type=RussianChoice(job_statuses), multiple=True,
+    help='Ожидаемый статус задачи (можно указать несколько раз)',
+)
+@click.option('-T', '--until_terminal', is_flag=True, help='Ожидать завершения задачи (по умолчанию)', default=False)
+@click.option('--any/--all', 'wait_any', help='Достаточно одной задачи / ожидать все задачи (по умолчанию)', default=False)
+@click.option('-F', '--fail_fast', is_flag=True, help='Завершить ожидание при первой задаче с ошибкой', default=False)
+@click.option('--timeout', type=PositiveIntWithZeroView(), help='Максимальное время ожидания в секундах (0 - без ограничения)', default=0)
+@job_client
+def wait(api_job, names, region, until_statuses, until_terminal, wait_any, fail_fast, timeout):
+    """Команда ожидания статусов задач обучения.
+
+    Синтаксис: mls job wait [name ...] [options]
+
+    Пример: mls job wait lm-mpi-job-00000000-0000-0000-0000-000000000000 --until Running
+
+    Пример: mls job wait job-1 job-2 --until_terminal --all --fail_fast --timeout 3600
+
+    Код завершения: 0 - условие выполнено, 1 - задача завершилась с ошибкой, 3 - задача остановлена или удалена,
+    4 - истекло время ожидания, 5 - задача не найдена, 6 - задача завершилась, не достигнув ожидаемого статуса.
+    """
+    targets = {status.lower() for status in until_statuses}
+    if until_terminal or not targets:
+        targets.update(TERMINAL_STATUSES)
+
+    result = wait_jobs(
+        StatusPoller(api_job, region, unique(names)), targets, wait_any, fail_fast, timeout,
+        on_change=lambda name, status_: click.echo(success_format(f'{name}: {status_ or "не найдена"}')),
+    )
+    if result.code == EXIT_TIMEOUT:
+        click.echo(error_format(f'Истекло время ожидания: {", ".join(result.names)}'))
+    if result.code:
+        sys.exit(result.code)
 
 
 @job.command(cls=StatusHelp, name='status')
@@ -147,7 +364,7 @@ def status_(api_job, name, *_, **__):
 
 
     """
-    click.echo(success_format(api_job.get_job_status(name)))
+    echo_result(api_job.get_job_status(name), api_job.USER_OUTPUT_PREFERENCE)
 
 
 @job.command(cls=ListPodsHelp)
@@ -162,7 +379,7 @@ def pods(api_job, name, *_, **__):
     Пример: mls job pods lm-mpi-job-00000000-0000-0000-0000-000000000000
 
     """
-    click.echo(success_format(api_job.get_pods(name)))
+    echo_result(api_job.get_pods(name), api_job.USER_OUTPUT_PREFERENCE)
 
 
 @job.command(cls=ListHelp, name='list')
@@ -171,33 +388,57 @@ def pods(api_job, name, *_, **__):
 @regions_selected
 @limit_selected
 @offset_selected
+@page_size_selected
 @queue_selected
-@opt_output_format
+@columns_selected
+@opt_list_output_format
 @job_client
-def list_(api_job, region, queue, allocation_name, status, limit, offset):
+def list_(api_job, region, queue, allocation_name, status, limit, offset, page_size, columns):
     """Команда просмотра списка задач.
 
     Синтаксис: mls job list [options]
 
     Пример: mls job list --status Pending --status Running --queue 00000000-0000-0000-0000-000000000000 --limit 10
 
+    Пример: mls job list --page_size 100 | head -n 50
+
+    Пример: mls job list -O csv --columns job_name,status,gpu_count > jobs.csv
+
+    С форматами ndjson и csv, опцией --columns или --page_size задачи загружаются страницами
+    и выводятся по мере загрузки.
+
     """
-    click.echo(success_format(api_job.get_list_jobs(region, queue, allocation_name, status, limit, offset)))
+    output = api_job.USER_OUTPUT_PREFERENCE
+    if not page_size and not columns and output not in STREAM_FORMATS:
+        echo_result(api_job.get_list_jobs(region, queue, allocation_name, status, limit, offset), api_job.USER_OUTPUT_PREFERENCE)
+        return
+
+    pages = api_job.get_job_pages(region, queue, allocation_name, status, limit, offset, page_size or JOB_PAGE_SIZE)
+    if not isinstance(pages, Iterator):
+        echo_result(pages, output)
+        return
+    echo_list(itertools.chain.from_iterable(pages), output, columns or (), key='jobs')
 
 
 @job.command(cls=RestartHelp)
-@click.argument('name')
+@click.argument('names', nargs=-1)
+@bulk_selected
 @opt_output_format
 @job_client
-def restart(api_job, name, *_, **__):
-    """Команда перезапуска задачи по имени.
+def restart(api_job, names, region, **selectors):
+    """Команда перезапуска задач по имени.
 
-    Синтаксис: mls job restart [name] [options]
+    Синтаксис: mls job restart [name ...] [options]
 
     Пример: mls job restart lm-mpi-job-00000000-0000-0000-0000-000000000000
 
+    Пример: mls job restart --from_file failed.txt --workers 16
+
     """
-    click.echo(success_format(api_job.restart_job(name)))
+    if len(names) == 1 and not _has_selectors(**selectors):
+        echo_result(api_job.restart_job(names[0]), api_job.USER_OUTPUT_PREFERENCE)
+    else:
+        _bulk(api_job, api_job.restart, names, region, **selectors)
 
 
 @job.command(cls=YamlHelp)
@@ -248,6 +489,10 @@ def regions():
 @click.option('-i', '--instance_type', cls=FilterOptions, index=1, help='Тип сервера')
 @click.option('-d', '--description', cls=FilterOptions, index=2, help='Пользовательское описание задачи')
 @click.option('-j', '--job_name', cls=FilterOptions, index=2, help='Название задачи')
+@click.option(
+    '--where', cls=FilterOptions, index=3, type=WhereView(),
+    help='Условие отбора строк, например "gpu_count>=8 and status in (Running,Pending) and duration>2h"',
+)
 @click.option(
     '--asc_sort', multiple=True, cls=SortOptions, type=filter_sort_choice,
     help=f'Сортировка загруженной информации в таблицу. {filter_sort_choice.options}',
@@ -256,14 +501,29 @@ def regions():
     '--desc_sort', multiple=True, cls=SortOptions, type=filter_sort_choice,
     help=f'Сортировка загруженной информации в таблицу. {filter_sort_choice.options}',
 )
+@click.option('-w', '--watch', is_flag=True, help='Обновлять таблицу на месте, перерисовывая только изменившиеся строки')
+@page_size_selected
 @job_client
-def table(api_job, region, queue, gpu_count, instance_type, description, allocation, job_name, status, limit, offset, asc_sort, desc_sort):
+def table(
+    api_job, region, queue, gpu_count, instance_type, description, allocation, job_name, status, limit, offset, asc_sort, desc_sort,
+    watch, page_size, where,
+):
     """Команда просмотра таблицы с задачами.
 
     Синтаксис: mls job table [options]
 
     Пример:  mls job table --status Running --status Pending --queue 00000000-0000-0000-0000-000000000000 --limit 10
 
+    Пример:  mls job table --where "gpu_count>=8 and status in (Running,Pending) and duration>2h"
+
+    С опцией --watch таблица обновляется до нажатия Ctrl+C. С опцией --page_size без сортировки
+    строки выводятся одной таблицей по мере загрузки страниц: ширина столбцов определяется по первым
+    строкам, не поместившиеся значения обрезаются.
+
+    Условия --where на статус, очередь и аллокацию (status, queue_id, allocation_name), объединённые
+    через and, передаются в запрос к API; остальные фильтры и сортировка применяются к загруженному
+    списку. С опцией --debug выводится, как разделён запрос.
+
     """
     filters = [
         *([{'field': 'gpu_count', 'values': gpu_count, 'type': 'eq'}] if gpu_count else []),
@@ -276,7 +536,60 @@ def table(api_job, region, queue, gpu_count, instance_type, description, allocat
         *[{'field': desc,  'direction': 'desc'} for desc in desc_sort],
     ]
 
-    api_job.USER_OUTPUT_PREFERENCE = None
+    plan = plan_query(
+        {'region': region, 'queue': queue, 'allocation_name': allocation, 'status': status}, job_query_params, filters, where, sort,
+    )
+    logging.getLogger(f'{api_job.__class__.__name__}.planner').debug(plan.describe())
+    region, queue, allocation, status = (plan.params[name] for name in ('region', 'queue', 'allocation_name', 'status'))
+    filters, sort, where = plan.filters, plan.sorters, plan.where
+
+    if watch:
+        _watch_table(lambda: api_job.jobs(region, queue, allocation, status, limit, offset).get('jobs', []), filters, sort, where)
+        return
+
+    if page_size:
+        loaded = api_job.get_job_pages(region, queue, allocation, status, limit, offset, page_size)
+        if not isinstance(loaded, Iterator):
+            echo_result(loaded, api_job.USER_OUTPUT_PREFERENCE)
+            return
+        pages = prefetch(loaded)
+        if sort:
+            # Сортировка выполняется по всему списку, таблица выводится после загрузки всех страниц.
+            pages = iter([list(itertools.chain.from_iterable(pages))])
+        jobs = itertools.chain.from_iterable(JobTableView(page, filters, sort, where=where).apply() for page in pages)
+        for line in render_table(JOB_HEADERS, map(job_row, jobs)):
+            click.echo(success_format(line))
+        return
+
     data_source = api_job.get_list_jobs(region, queue, allocation, status, limit, offset).get('jobs', [])
-    result = JobTableView(data_source, filters, sort).display()
+    result = JobTableView(data_source, filters, sort, where=where).display()
     click.echo(success_format(result))
+
+
+def _watch_table(fetch: Callable[[], List[dict]], filters: List[dict], sort: List[dict], where: Optional[Callable[[dict], bool]]):
+    """Обновляет таблицу задач до прерывания пользователем.
+
+    Все запросы выполняются одним клиентом. Интервал опроса растёт, пока у задач
+    не меняются статусы и состав, и сбрасывается при изменениях; рост длительности
+    работающих задач изменением не считается.
+    """
+    tty = click.get_text_stream('stdout').isatty()
+    live = LiveTable(JOB_HEADERS, tty=tty)
+    interval = AdaptiveInterval(WATCH_INTERVAL, WATCH_MAX_INTERVAL)
+    duration = JOB_HEADERS.index('Длительность')
+    if tty:
+        click.echo(SCREEN_ENTER, nl=False)
+    try:
+        while True:
+            rows = TableView(fetch(), filters, sort, lambda data: map(job_row, data), where=where).display()
+            size = shutil.get_terminal_size() if tty else None
+            click.echo(live.update(
+                rows, size and size.lines, footer=f'Обновлено {time.strftime("%H:%M:%S")}', width=size and size.columns,
+            ), nl=False)
+            changed = live.reordered or any(columns - {duration} for columns in live.changes.values())
+            time.sleep(interval.next(changed))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if tty:
+            click.echo(SCREEN_EXIT, nl=False)
@@ -1,4 +1,5 @@
 """Модуль содержит константы приложения для задач обучения."""
+from mls.schema.planner import ServerParam
 from mls.utils.settings import REGIONS
 
 priority = 'low', 'medium', 'high'
@@ -6,4 +7,12 @@ table_sort_filter_fields = 'gpu_count', 'instance_type', 'job_desc', 'job_name'
 job_types = 'binary', 'horovod', 'pytorch', 'pytorch2', 'pytorch_elastic', 'binary_exp'
 cluster_keys = ['A100-MT', 'SR003', 'SR004', 'SR005', 'SR006', 'SR008'] + REGIONS
 job_statuses = 'Completed', 'Completing', 'Deleted', 'Failed', 'Pending', 'Running', 'Stopped', 'Succeeded', 'Terminated'
+active_job_statuses = 'pending', 'running', 'completing'
 job_actions_in_fail = 'delete', 'restart'
+
+# Поля задачи, по которым список задач отбирается на стороне API (параметры get_list_jobs).
+job_query_params = {
+    'status': ServerParam('status', multiple=True, choices=job_statuses),
+    'queue_id': ServerParam('queue'),
+    'allocation_name': ServerParam('allocation_name'),
+}
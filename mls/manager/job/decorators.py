@@ -5,7 +5,10 @@ from mls.manager.job.constants import job_statuses
 from mls.manager.job.custom_types import cluster_key_input
 from mls.manager.job.custom_types import ProfileOptions
 from mls.manager.job.custom_types import status_inputs
+from mls.utils.common_types import ColumnsView
 from mls.utils.common_types import config_option_format_of_output
+from mls.utils.common_types import list_output_format
+from mls.utils.common_types import Path
 from mls.utils.common_types import PositiveIntWithZeroView
 from mls.utils.common_types import RussianChoice
 
@@ -19,6 +22,23 @@ opt_output_format = click.option(
     default='json',
 )
 
+opt_list_output_format = click.option(
+    '-O',
+    '--output',
+    cls=ProfileOptions,
+    index=1,
+    type=list_output_format,
+    help=f'Формат вывода в консоль. {list_output_format.options}',
+    default='json',
+)
+
+columns_selected = click.option(
+    '--columns',
+    help='Поля элементов списка для вывода через запятую, вложенные - через точку (job_name,status)',
+    type=ColumnsView(),
+    default=None,
+)
+
 status_of_task = click.option(
     '-s',
     '--status',
@@ -50,6 +70,12 @@ offset_selected = click.option(
     default=0, type=PositiveIntWithZeroView(),
 )
 
+page_size_selected = click.option(
+    '--page_size',
+    help='Загружать задачи страницами указанного размера и выводить их по мере загрузки (0 - одним запросом)',
+    default=0, type=PositiveIntWithZeroView(),
+)
+
 
 queue_selected = click.option(
     '-q',
@@ -58,3 +84,22 @@ queue_selected = click.option(
     help='ID очереди',
     default=None,
 )
+
+
+def bulk_selected(func):
+    """Декоратор опций выбора задач для групповых операций.
+
+    Задачи задаются аргументами, файлом и фильтрами списка задач; действие
+    выполняется параллельно в одной авторизованной сессии.
+    """
+    func = click.option(
+        '-W', '--workers', type=PositiveIntWithZeroView(), default=8, help='Число одновременно выполняемых запросов',
+    )(func)
+    func = click.option('-n', '--name_pattern', help='Шаблон имени задачи, например lm-mpi-job-*', default=None)(func)
+    func = click.option('-a', '--allocation_name', help='Набор выделенных ресурсов GPU и CPU', default=None)(func)
+    func = queue_selected(func)
+    func = status_of_task(func)
+    func = click.option(
+        '-f', '--from_file', type=Path(exists=True), help='Файл с именами задач, по одному в строке', default=None,
+    )(func)
+    return func
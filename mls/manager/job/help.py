@@ -58,6 +58,11 @@ class RestartHelp(CommandHelp):
     HEADING = 'Интерфейс перезапуска задачи по имени.'
 
 
+class WaitHelp(CommandHelp):
+    """Класс помощи при ожидании статусов задач обучения."""
+    HEADING = 'Ожидание статусов задач.'
+
+
 class JobHelp(CommonGroupFormatter):
     """Класс Формат Помощи MLS JOB."""
     HEADING = 'Управление задачами обучения.'
@@ -0,0 +1,29 @@
+"""Постраничный вывод списка задач.
+
+Страницы списка задач загружаются по мере вывода (TrainingJobApi.iter_job_pages):
+если вывод прерван, например `mls job list --page_size 100 | head`, следующие
+страницы не запрашиваются. Пока выводится текущая страница, следующая
+загружается в фоновом потоке. Сериализация списка по элементам - mls.utils.output.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import cast
+from typing import Iterable
+from typing import Iterator
+from typing import TypeVar
+
+T = TypeVar('T')
+
+_END = object()
+
+
+def prefetch(items: Iterable[T]) -> Iterator[T]:
+    """Элементы items; следующий элемент вычисляется в фоновом потоке, пока обрабатывается текущий."""
+    iterator = iter(items)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(next, iterator, _END)
+        while True:
+            item = pending.result()
+            if item is _END:
+                return
+            pending = executor.submit(next, iterator, _END)
+            yield cast(T, item)
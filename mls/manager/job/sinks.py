@@ -0,0 +1,145 @@
+"""Приёмники строк журнала логов для mls job logs.
+
+Строки поступают частями по мере получения из сети: приёмник записывает
+часть целиком и сбрасывает буфер один раз на часть, а не на каждую строку.
+
+    stdout - строки как есть в стандартный вывод, без стилей терминала
+    file   - файл с ротацией по размеру (name, name.1, ... name.N)
+    gzip   - сжатый файл, дописывается новым членом gzip
+    jsonl  - JSON Lines с временем получения строки, в файл или стандартный вывод
+"""
+import gzip
+import json
+import os
+import time
+from typing import BinaryIO
+from typing import Iterable
+from typing import Optional
+from typing import Union
+
+import click
+
+SINKS = 'stdout', 'file', 'gzip', 'jsonl'
+
+Line = Union[str, bytes]
+Stream = Union[BinaryIO, gzip.GzipFile]
+
+
+def _bytes(line: Line) -> bytes:
+    return line if isinstance(line, bytes) else line.encode('utf-8')
+
+
+class Sink:
+    """Приёмник строк: запись строк без перевода строки, сброс буфера и закрытие."""
+
+    def __init__(self, stream: Stream, close_stream: bool = True):
+        """Инициализация приёмника поверх двоичного потока."""
+        self.stream = stream
+        self._close_stream = close_stream
+
+    def format(self, line: Line, source: Optional[str]) -> bytes:
+        """Представление строки в приёмнике."""
+        prefix = f'[{source}] '.encode('utf-8') if source else b''
+        return prefix + _bytes(line) + b'\n'
+
+    def write(self, lines: Iterable[Line], source: Optional[str] = None):
+        """Записывает часть строк одного источника и сбрасывает буфер."""
+        data = b''.join(self.format(line, source) for line in lines)
+        if data:
+            self._write(data)
+            self.stream.flush()
+
+    def _write(self, data: bytes):
+        self.stream.write(data)
+
+    def close(self):
+        """Закрывает приёмник."""
+        if self._close_stream:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+    def __enter__(self):
+        """Вход в контекст."""
+        return self
+
+    def __exit__(self, *_):
+        """Выход из контекста с закрытием приёмника."""
+        self.close()
+
+
+class RotatingFileSink(Sink):
+    """Файл с ротацией по размеру, как logging.handlers.RotatingFileHandler."""
+
+    def __init__(self, path: str, max_bytes: int = 0, backup_count: int = 5):
+        """Инициализация.
+
+        :param path: Путь к файлу.
+        :param max_bytes: Размер файла, после которого выполняется ротация (0 - без ротации).
+        :param backup_count: Число сохраняемых предыдущих файлов.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        super().__init__(open(path, 'ab'))  # pylint: disable=consider-using-with
+
+    def _rotate(self):
+        self.stream.close()
+        for index in range(self.backup_count - 1, 0, -1):
+            if os.path.exists(f'{self.path}.{index}'):
+                os.replace(f'{self.path}.{index}', f'{self.path}.{index + 1}')
+        if self.backup_count:
+            os.replace(self.path, f'{self.path}.1')
+        else:
+            os.remove(self.path)
+        self.stream = open(self.path, 'ab')  # pylint: disable=consider-using-with
+
+    def _write(self, data: bytes):
+        if self.max_bytes and self.stream.tell() and self.stream.tell() + len(data) > self.max_bytes:
+            self._rotate()
+        self.stream.write(data)
+
+
+class GzipSink(Sink):
+    """Сжатый файл; буфер сжатия сбрасывается только при закрытии."""
+
+    def __init__(self, path: str):
+        """Инициализация приёмника в файл path."""
+        super().__init__(gzip.open(path, 'ab'))
+
+    def write(self, lines: Iterable[Line], source: Optional[str] = None):
+        """Записывает часть строк без принудительного сброса буфера сжатия."""
+        data = b''.join(self.format(line, source) for line in lines)
+        if data:
+            self.stream.write(data)
+
+
+class JsonLinesSink(Sink):
+    """JSON Lines: {"received_at": ..., "source": ..., "line": ...}."""
+
+    def format(self, line: Line, source: Optional[str]) -> bytes:
+        """Строка JSON с временем получения."""
+        record = {'received_at': round(time.time(), 6), **({'source': source} if source else {})}
+        record['line'] = line.decode('utf-8', errors='replace') if isinstance(line, bytes) else line
+        return json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+def open_sink(kind: str = 'stdout', path: Optional[str] = None, max_bytes: int = 0, backup_count: int = 5) -> Sink:
+    """Создаёт приёмник строк.
+
+    :param kind: Один из SINKS.
+    :param path: Путь к файлу; обязателен для file и gzip, для jsonl без пути используется стандартный вывод.
+    :param max_bytes: Размер файла для ротации (file).
+    :param backup_count: Число сохраняемых предыдущих файлов (file).
+    """
+    if kind == 'jsonl':
+        if path:
+            return JsonLinesSink(open(path, 'ab'))  # pylint: disable=consider-using-with
+        return JsonLinesSink(click.get_binary_stream('stdout'), close_stream=False)
+    if kind not in ('file', 'gzip'):
+        return Sink(click.get_binary_stream('stdout'), close_stream=False)
+    if not path:
+        raise click.UsageError(f'Для --sink {kind} укажите --sink_path')
+    if kind == 'file':
+        return RotatingFileSink(path, max_bytes, backup_count)
+    return GzipSink(path)
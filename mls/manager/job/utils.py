@@ -5,14 +5,13 @@
 функции для обработки данных, валидации входных значений, форматирования
 вывода и прочие общие инструменты, необходимые для выполнения задач.
 """
-import os
 from configparser import NoSectionError
 from functools import update_wrapper
 from typing import List
 
 import click
-import yaml  # type: ignore
 
+from .bulk import read_manifests
 from .custom_types import ExternalActionView
 from .custom_types import job_actions_in_fail_input
 from .custom_types import job_types_input
@@ -37,6 +36,8 @@ from mls.utils.execption import ConfigReadError
 from mls.utils.settings import DEFAULT_PROFILE
 from mls.utils.settings import SECRET_PASSWORD
 from mls_core import TrainingJobApi
+from mls_core.agent import AgentClient
+from mls_core.setting import AGENT
 
 
 def common_cli_options(func):
@@ -63,10 +64,13 @@ def job_client(func):
     @common_cli_options
     def init_client(*args, **kwargs):
         """Инициализация PublicApi client."""
-        profile = read_profile(kwargs.pop('profile'))
+        profile_name = kwargs.pop('profile')
+        profile = read_profile(profile_name)
 
         have_defaults = dict(
             debug=kwargs.pop('debug'),
+            profile=profile_name,
+            rate_limit=profile.get('rate_limit'),
         )
         stable_rules = dict(
             client_id=profile.get('key_id', ''),
@@ -88,7 +92,8 @@ def read_profile(profile_name):
     """Загружает (только существующий) профиль.
 
     Функция проверяет наличие секции профиля в файлах конфигурации и создаёт её,
-    если она отсутствует.
+    если она отсутствует. Если запущен mls agent, профиль берётся из его памяти
+    без чтения и расшифровки файлов.
 
     Аргументы:
         profile_name (str): Имя профиля, который загружается.
@@ -96,6 +101,9 @@ def read_profile(profile_name):
     Возвращает:
         dict : Собранный в словарь профиль.
     """
+    if AGENT and (profile := AgentClient().get_profile(profile_name, SECRET_PASSWORD)) is not None:
+        return profile
+
     config, credentials = load_saved_config(SECRET_PASSWORD)
     try:
         return {**dict(config.items(profile_name)), **dict(credentials.items(profile_name))}
@@ -109,17 +117,6 @@ def read_profile(profile_name):
         raise ConfigReadError(error_message) from err
 
 
-def read_yaml(file_path: str):
-    """Читает YAML файл и возвращает содержимое в виде словаря."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file)
-    except Exception as e:
-        raise click.ClickException(
-            f"Ошибка чтения YAML файла '{file_path}': {e}",
-        )
-
-
 def define_run_job_options() -> List:
     """Функция получения списка опций.
 
@@ -240,16 +237,26 @@ def apply_options(func):
         func = option(func)
 
     def forward_type_job(*args, **kwargs):
-        """Проброс в mls job submit только собранный объект для запуска задачи."""
-        config = kwargs.get('config')
-        if config:
-            from_yaml = read_yaml(kwargs.get('config')).get('job', {})
-        else:
-            default = 'Mls.yaml'
-            if os.path.isfile(default):
-                from_yaml = read_yaml(default).get('job', {})
-            else:
-                from_yaml = {}
-        return func(*args, **kwargs, type_job=Job.fabric(from_yaml, **kwargs))
+        """Проброс в mls job submit только собранных объектов для запуска задач.
+
+        Объекты собираются и проверяются для всех манифестов до отправки первой задачи:
+        type_job - задача первого манифеста, type_jobs - пары (манифест, задача).
+        """
+        manifests = read_manifests(kwargs.get('config') or ())
+        if len(manifests) == 1:
+            type_job = Job.fabric(manifests[0][1], **kwargs)
+            return func(*args, **kwargs, type_job=type_job, type_jobs=[(manifests[0][0], type_job)])
+
+        type_jobs, errors = [], []
+        for source, from_yaml in manifests:
+            try:
+                type_jobs.append((source, Job.fabric(from_yaml, **kwargs)))
+            except click.NoSuchOption as error:
+                errors.append(f'{source}: отсутствует опция {error.option_name}')
+        if not manifests:
+            raise click.UsageError('В указанных путях нет YAML манифестов')
+        if errors:
+            raise click.UsageError('\n'.join(['Задачи не отправлены, манифесты не прошли проверку:', *errors]))
+        return func(*args, **kwargs, type_job=type_jobs[0][1], type_jobs=type_jobs)
 
     return update_wrapper(forward_type_job, func)
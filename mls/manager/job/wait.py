@@ -0,0 +1,212 @@
+"""Ожидание статусов задач обучения.
+
+Статусы нескольких задач (не больше STATUS_BY_NAME) запрашиваются по имени.
+Статусы большего числа задач опрос получает одним запросом списка задач;
+статусом по имени запрашиваются только задачи, которых нет в списке. Интервал
+опроса растёт экспоненциально со случайным разбросом и сбрасывается при смене
+статуса любой из задач.
+
+Коды завершения mls job wait:
+    0 - условие выполнено, задачи в успешном или ожидаемом статусе
+    1 - задача завершилась с ошибкой (Failed)
+    3 - задача остановлена или удалена (Stopped, Terminated, Deleted)
+    4 - истекло время ожидания
+    5 - задача не найдена
+    6 - задача завершилась, не достигнув ожидаемого статуса
+"""
+import random
+import time
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Set
+
+import requests
+
+from .bulk import SELECT_LIMIT
+from mls_core import TrainingJobApi
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_STOPPED = 3
+EXIT_TIMEOUT = 4
+EXIT_NOT_FOUND = 5
+EXIT_UNREACHABLE = 6
+
+TERMINAL_STATUSES = 'completed', 'deleted', 'failed', 'stopped', 'succeeded', 'terminated'
+STATUS_EXIT_CODES = {
+    'failed': EXIT_FAILED,
+    'stopped': EXIT_STOPPED,
+    'terminated': EXIT_STOPPED,
+    'deleted': EXIT_STOPPED,
+}
+
+INITIAL_INTERVAL = 1.0
+MAX_INTERVAL = 30.0
+WATCH_INTERVAL = 2.0
+WATCH_MAX_INTERVAL = 10.0
+STATUS_BY_NAME = 3
+
+
+def status_exit_code(status: str) -> int:
+    """Код завершения, соответствующий статусу задачи."""
+    return STATUS_EXIT_CODES.get(status.lower(), EXIT_OK)
+
+
+class AdaptiveInterval:
+    """Интервал опроса: сброс при изменениях, иначе рост вдвое до максимума с разбросом ±25%."""
+
+    def __init__(self, initial: float = INITIAL_INTERVAL, maximum: float = MAX_INTERVAL):
+        """Инициализация.
+
+        :param initial: Начальный интервал в секундах.
+        :param maximum: Максимальный интервал в секундах.
+        """
+        self.initial = initial
+        self.maximum = maximum
+        self._attempt = 0
+
+    def next(self, changed: bool) -> float:
+        """Интервал до следующего опроса."""
+        self._attempt = 0 if changed else self._attempt + 1
+        interval = min(self.maximum, self.initial * 2 ** self._attempt)
+        return float(interval * random.uniform(0.75, 1.25))
+
+
+class StatusPoller:
+    """Опрос статусов набора задач с адаптивным интервалом."""
+
+    def __init__(
+        self,
+        api_job: TrainingJobApi,
+        region: str,
+        names: Iterable[str],
+        initial: float = INITIAL_INTERVAL,
+        maximum: float = MAX_INTERVAL,
+        by_name: int = STATUS_BY_NAME,
+    ):
+        """Инициализация.
+
+        :param api_job: Клиент задач обучения.
+        :param region: Регион задач.
+        :param names: Имена задач.
+        :param initial: Начальный интервал опроса в секундах.
+        :param maximum: Максимальный интервал опроса в секундах.
+        :param by_name: Наибольшее число задач, статусы которых запрашиваются по имени, а не списком задач.
+        """
+        self.api_job = api_job
+        self.region = region
+        self.names = list(names)
+        self.by_name = by_name
+        self.interval = AdaptiveInterval(initial, maximum)
+        self.requests = 0
+
+    def poll(self) -> Dict[str, Optional[str]]:
+        """Статусы задач; None - задача не найдена."""
+        if len(self.names) <= self.by_name:
+            return {name: self._status(name) for name in self.names}
+        self.requests += 1
+        response = self.api_job.jobs(self.region, None, None, None, SELECT_LIMIT, 0)
+        listed = {job.get('job_name'): job.get('status') for job in response.get('jobs', [])}
+        return {name: listed[name] if name in listed else self._status(name) for name in self.names}
+
+    def _status(self, name: str) -> Optional[str]:
+        self.requests += 1
+        try:
+            status: Optional[str] = self.api_job.status(name).get('status')
+            return status
+        except requests.exceptions.HTTPError as error:
+            if error.response is not None and error.response.status_code == 404:
+                return None
+            raise
+
+    def delay(self, changed: bool) -> float:
+        """Интервал до следующего опроса."""
+        return self.interval.next(changed)
+
+
+class WaitResult(NamedTuple):
+    """Итог ожидания."""
+    code: int
+    statuses: Dict[str, Optional[str]]
+    names: List[str]
+
+
+def decide(
+    statuses: Dict[str, Optional[str]], targets: Set[str], wait_any: bool, fail_fast: bool,
+) -> Optional[WaitResult]:
+    """Итог ожидания по текущим статусам или None, если ожидание продолжается.
+
+    :param statuses: Статусы задач.
+    :param targets: Ожидаемые статусы в нижнем регистре.
+    :param wait_any: Достаточно достижения статуса одной задачей.
+    :param fail_fast: Завершить ожидание при первой ошибке задачи.
+    """
+    missing = [name for name, status in statuses.items() if status is None]
+    if missing:
+        return WaitResult(EXIT_NOT_FOUND, statuses, missing)
+
+    normalized = {name: status.lower() for name, status in statuses.items() if status is not None}
+    if fail_fast:
+        failed = [name for name, status in normalized.items() if status_exit_code(status)]
+        if failed:
+            return WaitResult(status_exit_code(normalized[failed[0]]), statuses, failed)
+
+    reached = [name for name, status in normalized.items() if status in targets]
+    unreachable = [name for name, status in normalized.items() if status in TERMINAL_STATUSES and status not in targets]
+
+    def worst(names: List[str], default: int) -> int:
+        return max((status_exit_code(normalized[name]) for name in names), default=EXIT_OK) or default
+
+    if wait_any:
+        done = bool(reached) or len(unreachable) == len(normalized)
+        settled = reached or unreachable
+    else:
+        done = bool(unreachable) or len(reached) == len(normalized)
+        settled = unreachable or reached
+    if not done:
+        return None
+    return WaitResult(worst(settled, EXIT_OK if settled is reached else EXIT_UNREACHABLE), statuses, settled)
+
+
+def wait_jobs(
+    poller: StatusPoller,
+    targets: Set[str],
+    wait_any: bool = False,
+    fail_fast: bool = False,
+    timeout: float = 0,
+    on_change: Optional[Callable[[str, Optional[str]], None]] = None,
+) -> WaitResult:
+    """Опрашивает статусы, пока не выполнено условие ожидания или не истекло время.
+
+    :param poller: Опрос статусов.
+    :param targets: Ожидаемые статусы в нижнем регистре.
+    :param wait_any: Достаточно достижения статуса одной задачей.
+    :param fail_fast: Завершить ожидание при первой ошибке задачи.
+    :param timeout: Максимальное время ожидания в секундах (0 - без ограничения).
+    :param on_change: Вызывается при каждой смене статуса задачи.
+    """
+    deadline = time.monotonic() + timeout if timeout else None
+    last: Dict[str, Optional[str]] = {}
+    while True:
+        statuses = poller.poll()
+        changed = [name for name, status in statuses.items() if name not in last or last[name] != status]
+        if on_change is not None:
+            for name in changed:
+                on_change(name, statuses[name])
+        last = statuses
+
+        result = decide(statuses, targets, wait_any, fail_fast)
+        if result is not None:
+            return result
+        delay = poller.delay(bool(changed))
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                waiting = [name for name, status in statuses.items() if (status or '').lower() not in targets]
+                return WaitResult(EXIT_TIMEOUT, statuses, waiting)
+            delay = min(delay, remaining)
+        time.sleep(delay)
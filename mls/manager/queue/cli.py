@@ -6,9 +6,13 @@ import click
 from .help import InstTypesHelp
 from .help import ListHelp
 from .help import QueueHelp
+from mls.manager.job.decorators import columns_selected
+from mls.manager.job.decorators import opt_list_output_format
 from mls.manager.job.decorators import opt_output_format
 from mls.utils.client import api_client
-from mls.utils.style import success_format
+from mls.utils.output import echo_response
+from mls.utils.output import echo_result
+from mls.utils.output import STREAM_FORMATS
 from mls_core import QueueApi
 
 
@@ -23,17 +27,23 @@ def queue():
 
 @queue.command(cls=ListHelp, name='list')
 @click.argument('allocation_id')
-@opt_output_format
+@columns_selected
+@opt_list_output_format
 @api_client(QueueApi)
-def list_(api: QueueApi, allocation_id: uuid.UUID):
+def list_(api: QueueApi, allocation_id: uuid.UUID, columns):
     """Команда отображения доступных очередей.
 
     Синтаксис: mls queue list [allocation_id] [options]
 
     Пример: mls queue list 00000000-0000-4000-8000-000000000000
 
+    Пример: mls queue list 00000000-0000-4000-8000-000000000000 -O ndjson
+
     """
-    click.echo(success_format(api.get_list_queues(str(allocation_id))))
+    if columns or api.USER_OUTPUT_PREFERENCE in STREAM_FORMATS:
+        echo_response(api.get_list_queues(str(allocation_id)), api.USER_OUTPUT_PREFERENCE, columns or ())
+        return
+    echo_result(api.get_list_queues(str(allocation_id)), api.USER_OUTPUT_PREFERENCE)
 
 
 @queue.command(cls=InstTypesHelp)
@@ -48,4 +58,4 @@ def inst_types(api: QueueApi, queue_id: uuid.UUID):
     Пример: mls queue inst-types 00000000-0000-4000-8000-000000000000
 
     """
-    click.echo(success_format(api.get_instance_types(queue_id)))
+    echo_result(api.get_instance_types(queue_id), api.USER_OUTPUT_PREFERENCE)
@@ -2,9 +2,15 @@
 
 Этот модуль инициализирует пакет `schema` и определяет его публичный интерфейс.
 """
+from .live import LiveTable
 from .table import JobTableView
+from .where import compile_where
+from .where import WhereSyntaxError
 
 
 __all__ = [
     'JobTableView',
+    'LiveTable',
+    'WhereSyntaxError',
+    'compile_where',
 ]
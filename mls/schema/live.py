@@ -0,0 +1,134 @@
+"""Обновляемая таблица для режима наблюдения (--watch).
+
+Таблица перерисовывается частично: на каждом шаге выводятся только строки,
+значения которых изменились (изменённые ячейки выделяются), и строки,
+выделенные на прошлом шаге, чтобы снять выделение. Ширина столбцов и порядок
+строк сохраняются между шагами; полная перерисовка выполняется, только если
+изменился состав или порядок строк, размер окна или значение не помещается
+в столбец.
+
+В терминале строки обновляются на месте управляющими последовательностями ANSI,
+таблица обрезается по высоте окна и сужается до его ширины, как в
+mls.schema.stream: каждая строка таблицы занимает одну строку экрана. Вне терминала первым кадром выводится вся
+таблица, затем только изменённые строки.
+"""
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+
+from .stream import _fit
+from .stream import cell
+from .stream import center
+from .stream import shrink
+from mls.utils.style import changed_format
+
+SCREEN_ENTER = '\x1b[?1049h\x1b[?25l'
+SCREEN_EXIT = '\x1b[?25h\x1b[?1049l'
+_CLEAR = '\x1b[H\x1b[2J'
+_HEADER_LINES = 3
+_FOOTER_LINES = 2
+
+
+class LiveTable:
+    """Таблица, которая выводит разницу между соседними кадрами."""
+
+    def __init__(self, headers: Sequence[str], tty: bool = True):
+        """Инициализация.
+
+        :param headers: Заголовки столбцов; первый столбец - ключ строки.
+        :param tty: Вывод в терминал с обновлением строк на месте.
+        """
+        self.headers = tuple(headers)
+        self.tty = tty
+        self.keys: List[str] = []
+        self.rows: Dict[str, Tuple[str, ...]] = {}
+        self.widths: List[int] = []
+        self.height: Optional[int] = None
+        self.width: Optional[int] = None
+        self._natural: List[int] = []
+        self.changes: Dict[str, Set[int]] = {}
+        self.reordered = False
+        self._highlighted: Dict[str, Set[int]] = {}
+        self._drawn = False
+
+    def _border(self) -> str:
+        return '+' + '+'.join('-' * (width + 2) for width in self.widths) + '+'
+
+    def _line(self, values: Sequence[str], highlight: Iterable[int] = ()) -> str:
+        cells = [center(_fit(value, width), width) for value, width in zip(values, self.widths)]
+        for column in highlight:
+            cells[column] = changed_format(cells[column])
+        return '| ' + ' | '.join(cells) + ' |'
+
+    def _visible(self, total: int) -> int:
+        if not self.tty or self.height is None:
+            return total
+        return max(0, min(total, self.height - _HEADER_LINES - _FOOTER_LINES))
+
+    def update(self, rows: Iterable[Sequence], height: Optional[int] = None, footer: str = '', width: Optional[int] = None) -> str:
+        """Принимает строки очередного шага и возвращает текст для вывода.
+
+        :param rows: Строки таблицы; значения приводятся к строкам.
+        :param height: Высота окна терминала в строках.
+        :param footer: Строка состояния под таблицей (только в терминале).
+        :param width: Ширина окна терминала в символах; None - без ограничения.
+        """
+        keys: List[str] = []
+        current: Dict[str, Tuple[str, ...]] = {}
+        changes: Dict[str, Set[int]] = {}
+        for row in rows:
+            values = tuple(cell(value) for value in row)
+            key = values[0]
+            keys.append(key)
+            current[key] = values
+            previous = self.rows.get(key)
+            if previous is not None and previous != values:
+                changes[key] = {index for index, (old, new) in enumerate(zip(previous, values)) if old != new}
+
+        self.reordered = keys != self.keys
+        full = not self._drawn or self.reordered or height != self.height or width != self.width
+        self.keys, self.rows, self.changes, self.height, self.width = keys, current, changes, height, width
+        shown = self._visible(len(keys))
+        if not full:
+            full = any(len(value) > limit for key in changes for value, limit in zip(current[key], self._natural))
+
+        if full:
+            self._natural = [len(header) for header in self.headers]
+            for key in keys[:shown]:
+                self._natural = [max(limit, len(value)) for limit, value in zip(self._natural, current[key])]
+            self.widths = shrink(self._natural, width) if self.tty and width else list(self._natural)
+            frame = self._full(shown, footer)
+        else:
+            frame = self._partial(shown, footer)
+        self._highlighted = changes
+        self._drawn = True
+        return frame
+
+    def _footer(self, shown: int, footer: str) -> str:
+        if shown < len(self.keys):
+            footer = f'{footer} Показано {shown} из {len(self.keys)}.'.strip()
+        return _fit(footer, self.width) if self.width else footer
+
+    def _full(self, shown: int, footer: str) -> str:
+        border = self._border()
+        lines = [border, self._line(self.headers), border]
+        lines.extend(self._line(self.rows[key], self.changes.get(key, ())) for key in self.keys[:shown])
+        lines.append(border)
+        if not self.tty:
+            return '\n'.join(lines) + '\n'
+        return _CLEAR + '\n'.join(lines) + '\n' + self._footer(shown, footer)
+
+    def _partial(self, shown: int, footer: str) -> str:
+        if not self.tty:
+            return ''.join(self._line(self.rows[key]) + '\n' for key in self.keys if key in self.changes)
+        parts = [
+            f'\x1b[{index + _HEADER_LINES + 1};1H\x1b[2K' + self._line(self.rows[key], self.changes.get(key, ()))
+            for index, key in enumerate(self.keys[:shown])
+            if key in self.changes or key in self._highlighted
+        ]
+        parts.append(f'\x1b[{shown + _HEADER_LINES + 2};1H\x1b[2K{self._footer(shown, footer)}')
+        return ''.join(parts)
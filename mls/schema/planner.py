@@ -0,0 +1,157 @@
+"""Планировщик запроса списка: что отбирает API, а что - клиент.
+
+Фильтры таблицы и условия --where верхнего уровня (объединённые через and),
+которые поддерживает endpoint списка, переносятся в параметры запроса;
+остальное применяется к загруженным строкам. Чем больше условий выполняет
+API, тем меньше строк передаётся по сети.
+
+Условие переносится, если это равенство или список значений (in) для поля,
+которое endpoint принимает параметром. Если параметр уже задан опцией
+командной строки, в запрос попадает пересечение значений; при пустом
+пересечении условие остаётся на стороне клиента. Сортировку endpoint не
+поддерживает, она всегда выполняется клиентом.
+"""
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+
+from .where import And
+from .where import Compare
+from .where import format_node
+from .where import Literal
+from .where import Member
+from .where import Node
+from .where import Where
+
+
+class ServerParam(NamedTuple):
+    """Параметр запроса, которым API отбирает строки по полю.
+
+    :param name: Имя параметра запроса.
+    :param multiple: Параметр принимает несколько значений.
+    :param choices: Допустимые значения; значения условия приводятся к ним без учёта регистра.
+    """
+    name: str
+    multiple: bool = False
+    choices: Sequence[str] = ()
+
+
+class QueryPlan(NamedTuple):
+    """Разделение запроса между API и клиентом."""
+    params: Dict[str, Any]
+    filters: List[dict]
+    where: Optional[Where]
+    sorters: List[dict]
+    pushed: List[str]
+
+    def describe(self) -> str:
+        """Текстовое описание плана для отладочного вывода."""
+        params = ', '.join(f'{name}={_format_value(value)}' for name, value in self.params.items() if value not in (None, '', (), []))
+        client = [
+            *(f'{option["field"]} {option["type"]} {option["values"]}' for option in self.filters),
+            *([f'where {self.where}'] if self.where is not None else []),
+            *(f'сортировка {option["field"]} {option["direction"]}' for option in self.sorters),
+        ]
+        return (
+            f'План запроса: API - {params or "без условий"}'
+            f'{"; перенесено в API: " + ", ".join(self.pushed) if self.pushed else ""}'
+            f'; клиент - {", ".join(client) or "без условий"}'
+        )
+
+
+def _format_value(value) -> str:
+    return ','.join(map(str, value)) if isinstance(value, (list, tuple)) else str(value)
+
+
+def _values(literals: Iterable[Literal], spec: ServerParam) -> Optional[List[str]]:
+    """Значения условия для параметра запроса или None, если их нельзя передать API."""
+    values = []
+    canonical = {choice.casefold(): choice for choice in spec.choices}
+    for literal in literals:
+        if literal.convert is None:
+            return None
+        if canonical:
+            if literal.raw.casefold() not in canonical:
+                return None
+            values.append(canonical[literal.raw.casefold()])
+        else:
+            values.append(literal.raw)
+    return values
+
+
+def _push(params: Dict[str, Any], spec: ServerParam, values: Optional[List[str]]) -> bool:
+    """Добавляет значения в параметры запроса; False, если условие остаётся клиенту."""
+    if not values:
+        return False
+    current = params.get(spec.name)
+    if spec.multiple:
+        if current:
+            allowed = {value.casefold() for value in values}
+            values = [value for value in current if value.casefold() in allowed]
+            if not values:
+                return False
+        params[spec.name] = list(values)
+        return True
+    if len(values) != 1 or (current and current.casefold() != values[0].casefold()):
+        return False
+    params[spec.name] = values[0]
+    return True
+
+
+def _push_node(params: Dict[str, Any], server: Mapping[str, ServerParam], node: Node) -> bool:
+    if isinstance(node, Compare) and node.operator == '=':
+        spec = server.get(node.field.replace('-', '_'))
+        return spec is not None and _push(params, spec, _values([node.literal], spec))
+    if isinstance(node, Member):
+        spec = server.get(node.field.replace('-', '_'))
+        return spec is not None and _push(params, spec, _values(node.literals, spec))
+    return False
+
+
+def plan_query(
+    params: Mapping[str, Any],
+    server: Mapping[str, ServerParam],
+    filters: Iterable[dict] = (),
+    where: Optional[Where] = None,
+    sorters: Iterable[dict] = (),
+) -> QueryPlan:
+    """Разделяет фильтры и условие --where между параметрами запроса и остатком на стороне клиента.
+
+    :param params: Параметры запроса, заданные опциями команды.
+    :param server: Поля строк, по которым API отбирает строки, и соответствующие параметры.
+    :param filters: Фильтры вида {'field': ..., 'values': ..., 'type': 'eq' | 'like'}.
+    :param where: Скомпилированное выражение --where.
+    :param sorters: Сортировки; выполняются клиентом.
+    """
+    planned = dict(params)
+    pushed: List[str] = []
+
+    residual_filters = []
+    for option in filters:
+        spec = server.get(option['field'])
+        values = [option['values']] if isinstance(option['values'], str) else None
+        if option['type'] == 'eq' and spec is not None and values is not None and _push(planned, spec, values):
+            pushed.append(f'{option["field"]}={option["values"]}')
+        else:
+            residual_filters.append(option)
+
+    residual_where = where
+    if where is not None:
+        conjuncts = where.conjuncts()
+        residual = []
+        for node in conjuncts:
+            if _push_node(planned, server, node):
+                pushed.append(format_node(node))
+            else:
+                residual.append(node)
+        if not residual:
+            residual_where = None
+        elif len(residual) < len(conjuncts):
+            residual_where = Where(residual[0] if len(residual) == 1 else And(tuple(residual)))
+
+    return QueryPlan(planned, residual_filters, residual_where, list(sorters), pushed)
@@ -0,0 +1,119 @@
+"""Потоковый вывод таблиц в формате tabulate 'pretty'.
+
+Ширина столбцов определяется по заголовкам и первым строкам (выборке), после
+чего строки выводятся по мере поступления: таблица не собирается в памяти
+целиком, первая строка выводится, как только получена выборка. Значения,
+не поместившиеся в столбец, обрезаются с многоточием. При выводе в терминал
+таблица сужается до его ширины за счёт самых широких столбцов.
+
+Если все строки попали в выборку и ширина не ограничена, вывод совпадает
+с tabulate(rows, headers, tablefmt='pretty').
+"""
+import itertools
+import shutil
+import sys
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+SAMPLE_ROWS = 200
+MIN_WIDTH = 3
+ELLIPSIS = '…'
+
+
+def center(value: str, width: int) -> str:
+    """Выравнивание по центру как в tabulate: лишний пробел справа."""
+    left = (width - len(value)) // 2
+    return ' ' * left + value + ' ' * (width - len(value) - left)
+
+
+def cell(value) -> str:
+    """Текст ячейки: None - пустая строка, пробелы по краям отбрасываются."""
+    return '' if value is None else str(value).strip()
+
+
+def terminal_width() -> Optional[int]:
+    """Ширина терминала или None, если вывод не в терминал."""
+    return shutil.get_terminal_size().columns if sys.stdout.isatty() else None
+
+
+def _fit(value: str, width: int) -> str:
+    return value if len(value) <= width else value[:width - 1] + ELLIPSIS
+
+
+def shrink(widths: Sequence[int], limit: int) -> List[int]:
+    """Ширины столбцов, при которых строка таблицы не длиннее limit.
+
+    Сужаются самые широкие столбцы, но не меньше MIN_WIDTH.
+    """
+    widths = list(widths)
+    excess = sum(widths) + 3 * len(widths) + 1 - limit
+    while excess > 0:
+        widest = max(range(len(widths)), key=widths.__getitem__)
+        if widths[widest] <= MIN_WIDTH:
+            break
+        widths[widest] -= 1
+        excess -= 1
+    return widths
+
+
+class StreamTable:
+    """Таблица с шириной столбцов, зафиксированной по выборке строк."""
+
+    def __init__(self, headers: Sequence, sample: int = SAMPLE_ROWS, width: Optional[int] = -1):
+        """Инициализация.
+
+        :param headers: Заголовки столбцов.
+        :param sample: Число первых строк, по которым определяется ширина столбцов (0 - только по заголовкам).
+        :param width: Максимальная ширина таблицы; -1 - ширина терминала, None - без ограничения.
+        """
+        self.headers = ['None' if header is None else str(header) for header in headers]
+        self.sample = sample
+        self.width = terminal_width() if width == -1 else width
+        self.widths: List[int] = []
+
+    def _line(self, values: Sequence[str]) -> str:
+        return '| ' + ' | '.join(center(_fit(value, width), width) for value, width in zip(values, self.widths)) + ' |'
+
+    def _lines(self, row: Sequence[str]) -> Iterator[str]:
+        if not any('\n' in value for value in row):
+            yield self._line(row)
+            return
+        parts = [value.split('\n') for value in row]
+        for values in itertools.zip_longest(*parts, fillvalue=''):
+            yield self._line(values)
+
+    def _border(self) -> str:
+        return '+' + '+'.join('-' * (width + 2) for width in self.widths) + '+'
+
+    def render(self, rows: Iterable[Sequence]) -> Iterator[str]:
+        """Строки вывода таблицы; строки данных читаются из rows по мере вывода."""
+        size = len(self.headers)
+        iterator = ((*map(cell, row), *('',) * (size - len(row))) for row in rows)
+        sampled = list(itertools.islice(iterator, self.sample))
+        self.widths = [len(header) for header in self.headers]
+        for row in sampled:
+            self.widths = [max(width, *map(len, value.split('\n'))) for width, value in zip(self.widths, row)]
+        if self.width is not None:
+            self.widths = shrink(self.widths, self.width)
+
+        border = self._border()
+        yield border
+        yield from self._lines(self.headers)
+        yield border
+        for row in itertools.chain(sampled, iterator):
+            yield from self._lines(row)
+        yield border
+
+
+def render_table(headers: Sequence, rows: Iterable[Sequence], sample: int = SAMPLE_ROWS, width: Optional[int] = -1) -> Iterator[str]:
+    """Строки вывода таблицы (см. StreamTable)."""
+    return StreamTable(headers, sample, width).render(rows)
+
+
+def format_table(headers: Sequence, rows: Iterable[Sequence], width: Optional[int] = None) -> str:
+    """Таблица целиком: ширина столбцов по всем строкам, как в tabulate 'pretty'; по умолчанию значения не обрезаются."""
+    rows = list(rows)
+    return '\n'.join(render_table(headers, rows, sample=len(rows), width=width))
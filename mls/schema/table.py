@@ -1,10 +1,146 @@
 """Модуль хранения представлений ML Space (MLS).
 
 Данный модуль устанавливает схему для отображения в табличном виде.
+Фильтры и сортировки работают с колоночным представлением ответа API (Columns):
+значения поля собираются в список один раз, строки выбираются и упорядочиваются по индексам.
 """
+from collections.abc import Mapping
+from datetime import datetime
 from datetime import timedelta
+from datetime import timezone
+from operator import methodcaller
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
 
-from tabulate import tabulate   # type: ignore
+from .stream import format_table
+
+
+def _number(value) -> float:
+    if isinstance(value, (int, float, str)):
+        return float(value)
+    raise TypeError(value)
+
+
+def _duration(value) -> float:
+    if not value.endswith('s'):
+        raise ValueError(value)
+    return float(value[:-1])
+
+
+def _timestamp(value) -> float:
+    moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return (moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)).timestamp()
+
+
+def _text(value) -> str:
+    return str(value).casefold()
+
+
+def _distinct(values: Sequence) -> Optional[set]:
+    """Различные значения столбца без None или None, если среди значений есть нехешируемые."""
+    try:
+        distinct = set(values)
+    except TypeError:
+        return None
+    distinct.discard(None)
+    return distinct
+
+
+def sort_keys(values: Sequence) -> list:
+    """Ключи сортировки столбца с определением типа по всем значениям.
+
+    Числа (и строки с числами) сравниваются как числа, '761461s' - как длительность
+    в секундах, строки ISO 8601 - как моменты времени, остальное - как строки без учёта
+    регистра. None остаётся None. Каждое различное значение преобразуется один раз.
+    """
+    distinct = _distinct(values)
+    for convert in (_number, _duration, _timestamp, str.casefold, _text):
+        try:
+            if distinct is None:
+                return [None if value is None else convert(value) for value in values]
+            converted = dict(zip(distinct, map(convert, distinct)))
+        except (TypeError, ValueError, AttributeError):
+            continue
+        converted[None] = None
+        return list(map(converted.__getitem__, values))
+    raise AssertionError('_text преобразует любое значение')
+
+
+def _predicate(option) -> Callable[[object], bool]:
+    values = option['values']
+    type_filter = option['type']
+    if type_filter == 'eq':
+        return lambda value: value == values
+    if type_filter == 'like':
+        return lambda value: value is not None and values in str(value)
+    return lambda value: True
+
+
+class Columns:
+    """Колоночное представление списка словарей.
+
+    Значения поля собираются в отдельный список один раз, при первом обращении;
+    фильтры и сортировки работают с индексами строк и этими списками.
+    """
+
+    def __init__(self, rows: Iterable):
+        """Инициализация по списку словарей ответа API."""
+        self.rows = rows if isinstance(rows, list) else list(rows)
+        self._columns: Dict[str, list] = {}
+
+    def __len__(self) -> int:
+        """Число строк."""
+        return len(self.rows)
+
+    def column(self, field: str) -> list:
+        """Значения поля во всех строках (None, если поля нет)."""
+        values = self._columns.get(field)
+        if values is None:
+            try:
+                values = list(map(methodcaller('get', field), self.rows))
+            except AttributeError:
+                values = [row.get(field) if isinstance(row, Mapping) else None for row in self.rows]
+            self._columns[field] = values
+        return values
+
+    def select(
+        self, filters: Iterable[dict], indices: Optional[List[int]] = None, where: Optional[Callable[[dict], bool]] = None,
+    ) -> List[int]:
+        """Индексы строк, подходящих под все фильтры и условие where (см. mls.schema.where)."""
+        selected = list(range(len(self.rows))) if indices is None else indices
+        for option in filters:
+            test = _predicate(option)
+            values = self.column(option['field'])
+            selected = [index for index in selected if test(values[index])]
+        if where is not None:
+            rows = self.rows
+            selected = [index for index in selected if isinstance(rows[index], Mapping) and where(rows[index])]
+        return selected
+
+    def order(self, indices: Iterable[int], sorters: Iterable[dict]) -> List[int]:
+        """Индексы строк, упорядоченные устойчиво по нескольким полям; None - в конце.
+
+        Ключи сортировки вычисляются только для переданных строк.
+        """
+        ordered = list(indices)
+        for option in reversed(list(sorters)):
+            column = self.column(option['field'])
+            keys = sort_keys([column[index] for index in ordered])
+            descending = option['direction'] == 'desc'
+            if None in keys:
+                fill = next((key for key in keys if key is not None), 0)
+                keys = [((key is None) != descending, fill if key is None else key) for key in keys]
+            positions = sorted(range(len(ordered)), key=keys.__getitem__, reverse=descending)
+            ordered = [ordered[position] for position in positions]
+        return ordered
+
+    def take(self, indices: Iterable[int]) -> list:
+        """Строки по индексам."""
+        return [self.rows[index] for index in indices]
 
 
 def sort_by(json_data, options):
@@ -15,22 +151,8 @@ def sort_by(json_data, options):
                    [{'field': 'имя_поля', 'direction': 'asc/desc'}]
     :return: Отсортированный список.
     """
-
-    def _sort_key(item):
-        """Генерирует ключ для сортировки на основе критериев."""
-        sort_key = []
-        for opt in options:
-            field = opt['field']
-            direction = opt['direction']
-            value = item.get(field)
-            if isinstance(value, (int, float)):
-                sort_key.append(-value if direction == 'desc' else value)
-            else:
-
-                sort_key.append(-hash(value) if direction == 'desc' else hash(value))
-        return tuple(sort_key)
-
-    return sorted(json_data, key=_sort_key)
+    columns = Columns(json_data)
+    return columns.take(columns.order(range(len(columns)), options))
 
 
 def filter_by(json_data, options):
@@ -41,64 +163,68 @@ def filter_by(json_data, options):
                    [{'field': 'имя_поля', 'values': 'Any', 'type': 'FilterTypes'}]. # TODO Вынести в класс
     :return: Отфильтрованный список.
     """
-    key = options['field']
-    values = options['values']
-    type_filter = options['type']
-    if type_filter == 'eq':
-        return filter(lambda x: x[key] == values, json_data)
-    if type_filter == 'like':
-        return filter(lambda x: values in x[key], json_data)
-    return json_data
+    columns = Columns(json_data)
+    return columns.take(columns.select([options]))
+
+
+JOB_HEADERS = (
+    'Имя задачи', 'Статус', ' Регион', 'Instance Type', 'Описание задачи', 'Количество GPU', 'Длительность', 'ID очереди',
+    'Название очереди', 'Название аллокации',
+)
+# "Дата Создания", "Дата обновления", "Дата Завершения", "Цена", "Namespace"
+
+
+def job_row(job):
+    """Строка таблицы задач."""
+    duration_seconds = int(job.get('duration', '0s').rstrip('s'))
+    duration = timedelta(seconds=duration_seconds)
+    return (
+        job.get('job_name'),
+        job.get('status'),
+        job.get('region'),
+        job.get('instance_type'),
+        job.get('job_desc') or '-',
+        job.get('gpu_count'),
+        f'{duration}',
+        job.get('queue_id'),
+        job.get('queue_name'),
+        job.get('allocation_name'),
+        # job.get("created_dt"),
+        # job.get("updated_dt"),
+        # job.get("completed_dt") or '-',
+        # job.get("cost"),
+        # job.get("namespace"),
+    )
 
 
 def display_jobs(json_data):
-    """Выборка из json данных и отображение tabulate."""
-    headers = [
-        'Имя задачи', 'Статус', ' Регион', 'Instance Type', 'Описание задачи', 'Количество GPU', 'Длительность', 'ID очереди',
-        'Название очереди', 'Название аллокации',
-    ]
-    # "Дата Создания", "Дата обновления", "Дата Завершения", "Цена", "Namespace"
-    table_data = []
-    for job in json_data:
-        duration_seconds = int(job.get('duration', '0s').rstrip('s'))
-        duration = timedelta(seconds=duration_seconds)
-        table_data.append([
-            job.get('job_name'),
-            job.get('status'),
-            job.get('region'),
-            job.get('instance_type'),
-            job.get('job_desc') or '-',
-            job.get('gpu_count'),
-            f'{duration}',
-            job.get('queue_id'),
-            job.get('queue_name'),
-            job.get('allocation_name'),
-            # job.get("created_dt"),
-            # job.get("updated_dt"),
-            # job.get("completed_dt") or '-',
-            # job.get("cost"),
-            # job.get("namespace"),
-        ])
-
-    return tabulate(table_data, headers, tablefmt='pretty')
+    """Выборка из json данных и отображение таблицей (см. mls.schema.stream)."""
+    return format_table(JOB_HEADERS, map(job_row, json_data))
 
 
 class TableView:
     """Табличное представление для отображения json ответа."""
 
-    def __init__(self, data, filters, sorters, schema):
-        """Инициализация класса TableView."""
+    def __init__(self, data, filters, sorters, schema, where=None):
+        """Инициализация класса TableView.
+
+        :param where: Предикат отбора строк, скомпилированный из выражения --where.
+        """
         self.filters = filters
         self.sorters = sorters
         self.schema = schema
         self.data = data
+        self.where = where
+
+    def apply(self):
+        """Применяет фильтры и сортировки к колоночному представлению данных."""
+        columns = Columns(self.data)
+        self.data = columns.take(columns.order(columns.select(self.filters, where=self.where), self.sorters))
+        return self.data
 
     def display(self):
         """Применяет фильтры и сортировки."""
-        for apply in self.filters:
-            self.data = filter_by(self.data, apply)
-        self.data = sort_by(self.data, self.sorters)
-        return self.schema(self.data)
+        return self.schema(self.apply())
 
 
 class JobTableView(TableView):
@@ -113,8 +239,10 @@ class JobTableView(TableView):
             Конфигурация сортировки (объекты с полями 'field' и 'direction').
         schema (DisplaySchema, optional):
             Схема отображения столбцов. По умолчанию используется display_jobs.
+        where (Predicate, optional):
+            Условие отбора строк, скомпилированное из выражения --where.
     """
 
-    def __init__(self, data, filters, sorters, schema=None):
+    def __init__(self, data, filters, sorters, schema=None, where=None):
         """Инициализация класса JobTableView."""
-        super().__init__(data, filters, sorters, schema=display_jobs)
+        super().__init__(data, filters, sorters, schema=display_jobs, where=where)
@@ -0,0 +1,426 @@
+"""Язык условий отбора строк таблиц (--where).
+
+Выражение компилируется один раз в функцию-предикат над строкой ответа API
+(словарём) и затем применяется к каждой строке за один проход.
+
+Синтаксис:
+    условие   := сравнение | not условие | условие and условие | условие or условие | ( условие )
+    сравнение := поле оператор значение
+               | поле [not] in ( значение, ... )
+    оператор  := = == != < <= > >= ~ (регулярное выражение) !~
+
+Значения:
+    8, 0.5                        - числа
+    90s, 30m, 2h, 1d, 1w, 1h30m   - длительности
+    2025-02-01, 2025-02-01T10:00  - дата и время (UTC, если часовой пояс не указан)
+    Running, 'текст с пробелами'  - строки; сравниваются без учёта регистра
+    true, false, null             - логические значения и отсутствие значения
+
+Поле - имя ключа словаря; '-' в имени равнозначен '_', вложенные ключи
+указываются через точку (query.source). Сравнение с полем, значение которого
+отсутствует или не приводится к типу значения, ложно (а != и not in - истинны).
+
+Пример:
+    gpu_count>=8 and status in (Running,Pending) and duration>2h
+"""
+import re
+from collections.abc import Mapping
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from .table import _duration
+from .table import _number
+from .table import _timestamp
+
+Predicate = Callable[[dict], bool]
+
+_TOKEN = re.compile(r'''
+    \s*(?:
+        (?P<op><=|>=|!=|==|!~|=|<|>|~)
+      | (?P<punct>[(),])
+      | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<word>[^\s(),=<>!~'"]+)
+    )''', re.VERBOSE)
+_NUMBER = re.compile(r'^[-+]?\d+(?:\.\d+)?$')
+_DURATION_LITERAL = re.compile(r'^(?:\d+(?:\.\d+)?[smhdw])+$')
+_DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)([smhdw])')
+_DATE = re.compile(r'^\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?$')
+_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 7 * 86400}
+_KEYWORDS = {'and', 'or', 'not', 'in'}
+_CONSTANTS = {'true': True, 'false': False, 'null': None, 'none': None}
+
+
+class WhereSyntaxError(ValueError):
+    """Ошибка разбора выражения --where."""
+
+
+class _Token(NamedTuple):
+    kind: str
+    text: str
+    position: int
+
+
+def _tokenize(text: str) -> List[_Token]:
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None or match.end() == position:
+            raise WhereSyntaxError(f'Неожиданный символ в позиции {position + 1}: {text[position:position + 10]!r}')
+        kind = match.lastgroup or ''
+        value = match[kind]
+        start = match.start(kind) + 1
+        if kind == 'word' and value.lower() in _KEYWORDS:
+            kind, value = 'keyword', value.lower()
+        tokens.append(_Token(kind, value, start))
+        position = match.end()
+    return tokens
+
+
+def _unquote(text: str) -> str:
+    r"""Строка без кавычек; экранируются только кавычки и обратная косая черта, остальное (\d) не меняется."""
+    return re.sub(r'\\([\'"\\])', r'\1', text[1:-1])
+
+
+def _seconds(value) -> float:
+    """Длительность поля в секундах: '761461s' или число."""
+    try:
+        return _duration(value)
+    except (TypeError, ValueError, AttributeError):
+        return _number(value)
+
+
+def _text(value) -> str:
+    return (str(value).lower() if isinstance(value, bool) else str(value)).casefold()
+
+
+class Literal(NamedTuple):
+    """Значение выражения: приведённое значение, приведение значения поля к его типу и исходный текст.
+
+    convert равен None для null; raw - значение без кавычек, source - как в выражении.
+    """
+    value: Any
+    convert: Optional[Callable[[Any], Any]]
+    raw: str
+    source: str
+
+
+def _literal(token: _Token) -> Literal:
+    text = token.text
+    if token.kind == 'string':
+        raw = _unquote(text)
+        return Literal(raw.casefold(), _text, raw, text)
+    if text.lower() in _CONSTANTS:
+        constant = _CONSTANTS[text.lower()]
+        return Literal(None, None, text, text) if constant is None else Literal(str(constant).lower(), _text, text, text)
+    if _NUMBER.match(text):
+        return Literal(float(text), _number, text, text)
+    if _DURATION_LITERAL.match(text):
+        return Literal(sum(float(amount) * _UNITS[unit] for amount, unit in _DURATION_PART.findall(text)), _seconds, text, text)
+    if _DATE.match(text):
+        try:
+            return Literal(_timestamp(text), _timestamp, text, text)
+        except ValueError as error:
+            raise WhereSyntaxError(f'Недопустимые дата и время {text!r} в позиции {token.position}: {error}') from error
+    return Literal(text.casefold(), _text, text, text)
+
+
+class Compare(NamedTuple):
+    """Сравнение поля со значением: операторы = < <= > >=."""
+    field: str
+    operator: str
+    literal: Literal
+
+
+class Member(NamedTuple):
+    """Принадлежность значения поля списку."""
+    field: str
+    literals: Tuple[Literal, ...]
+
+
+class Match(NamedTuple):
+    """Поиск регулярного выражения в значении поля."""
+    field: str
+    pattern: Literal
+
+
+class Not(NamedTuple):
+    """Отрицание условия."""
+    node: Any
+
+
+class And(NamedTuple):
+    """Все условия."""
+    parts: Tuple[Any, ...]
+
+
+class Or(NamedTuple):
+    """Хотя бы одно из условий."""
+    parts: Tuple[Any, ...]
+
+
+def _getter(name: str) -> Callable[[dict], Any]:
+    path = [part.replace('-', '_') for part in name.split('.')]
+    if len(path) == 1:
+        key = path[0]
+        return lambda row: row.get(key)
+
+    def get(row):
+        value = row
+        for key in path:
+            if not isinstance(value, Mapping):
+                return None
+            value = value.get(key)
+        return value
+    return get
+
+
+_ORDERING: Dict[str, Callable[[Any, Any], bool]] = {
+    '=': lambda left, right: left == right,
+    '<': lambda left, right: left < right,
+    '<=': lambda left, right: left <= right,
+    '>': lambda left, right: left > right,
+    '>=': lambda left, right: left >= right,
+}
+
+
+def _compare(get: Callable[[dict], Any], operator: str, literal: Literal) -> Predicate:
+    if literal.convert is None:
+        return lambda row: get(row) is None
+    compare, convert, expected = _ORDERING[operator], literal.convert, literal.value
+
+    def predicate(row):
+        value = get(row)
+        if value is None:
+            return False
+        try:
+            return compare(convert(value), expected)
+        except (TypeError, ValueError, AttributeError):
+            return False
+    return predicate
+
+
+def _member(get: Callable[[dict], Any], literals: Iterable[Literal]) -> Predicate:
+    groups: Dict[Any, set] = {}
+    match_none = False
+    for literal in literals:
+        if literal.convert is None:
+            match_none = True
+        else:
+            groups.setdefault(literal.convert, set()).add(literal.value)
+
+    def predicate(row):
+        value = get(row)
+        if value is None:
+            return match_none
+        for convert, values in groups.items():
+            try:
+                if convert(value) in values:
+                    return True
+            except (TypeError, ValueError, AttributeError):
+                continue
+        return False
+    return predicate
+
+
+def _regex(get: Callable[[dict], Any], pattern: Literal) -> Predicate:
+    try:
+        search = re.compile(pattern.raw).search
+    except re.error as error:
+        raise WhereSyntaxError(f'Недопустимое регулярное выражение {pattern.raw!r}: {error}') from error
+
+    def predicate(row):
+        value = get(row)
+        return value is not None and search(str(value)) is not None
+    return predicate
+
+
+def _negate(predicate: Predicate) -> Predicate:
+    return lambda row: not predicate(row)
+
+
+Node = Union[Compare, Member, Match, Not, And, Or]
+
+
+def _compile(node: Node) -> Predicate:
+    """Предикат узла дерева выражения."""
+    if isinstance(node, Compare):
+        return _compare(_getter(node.field), node.operator, node.literal)
+    if isinstance(node, Member):
+        return _member(_getter(node.field), node.literals)
+    if isinstance(node, Match):
+        return _regex(_getter(node.field), node.pattern)
+    if isinstance(node, Not):
+        return _negate(_compile(node.node))
+    parts = [_compile(part) for part in node.parts]
+    if isinstance(node, And):
+        return lambda row: all(part(row) for part in parts)
+    return lambda row: any(part(row) for part in parts)
+
+
+def format_node(node: Node) -> str:
+    """Текст выражения по дереву."""
+    if isinstance(node, Compare):
+        return f'{node.field}{node.operator}{node.literal.source}'
+    if isinstance(node, Member):
+        return f'{node.field} in ({", ".join(literal.source for literal in node.literals)})'
+    if isinstance(node, Match):
+        return f'{node.field}~{node.pattern.source}'
+    if isinstance(node, Not):
+        return _format_not(node.node)
+    separator = ' and ' if isinstance(node, And) else ' or '
+    return separator.join(f'({format_node(part)})' if isinstance(part, (And, Or)) else format_node(part) for part in node.parts)
+
+
+def _format_not(inner: Node) -> str:
+    """Текст отрицания условия: != и not in для сравнений и списков, иначе not (...)."""
+    if isinstance(inner, Compare) and inner.operator == '=':
+        return f'{inner.field}!={inner.literal.source}'
+    if isinstance(inner, Member):
+        return format_node(inner).replace(' in (', ' not in (', 1)
+    if isinstance(inner, Match):
+        return f'{inner.field}!~{inner.pattern.source}'
+    return f'not ({format_node(inner)})'
+
+
+class _Parser:
+    """Разбор выражения рекурсивным спуском с построением дерева."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.index = 0
+
+    def peek(self) -> Optional[_Token]:
+        """Текущая лексема или None в конце выражения."""
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def take(self, kind: Optional[str] = None, text: Optional[str] = None) -> _Token:
+        """Текущая лексема с переходом к следующей; лексема другого вида - ошибка разбора."""
+        token = self.peek()
+        if token is None:
+            raise WhereSyntaxError(f'Неожиданный конец выражения: {self.text!r}')
+        if (kind and token.kind != kind) or (text and token.text != text):
+            raise WhereSyntaxError(f'Ожидалось {text or kind} в позиции {token.position}, получено {token.text!r}')
+        self.index += 1
+        return token
+
+    def accept(self, kind: str, text: Optional[str] = None) -> bool:
+        """Пропускает текущую лексему, если она указанного вида."""
+        token = self.peek()
+        if token is not None and token.kind == kind and (text is None or token.text == text):
+            self.index += 1
+            return True
+        return False
+
+    def parse(self) -> Node:
+        """Дерево всего выражения."""
+        node = self.disjunction()
+        if (token := self.peek()) is not None:
+            raise WhereSyntaxError(f'Лишний фрагмент в позиции {token.position}: {token.text!r}')
+        return node
+
+    def disjunction(self) -> Node:
+        """Условия, объединённые через or."""
+        parts = [self.conjunction()]
+        while self.accept('keyword', 'or'):
+            parts.append(self.conjunction())
+        return parts[0] if len(parts) == 1 else Or(tuple(parts))
+
+    def conjunction(self) -> Node:
+        """Условия, объединённые через and."""
+        parts = [self.negation()]
+        while self.accept('keyword', 'and'):
+            parts.append(self.negation())
+        return parts[0] if len(parts) == 1 else And(tuple(parts))
+
+    def negation(self) -> Node:
+        """Условие с not, условие в скобках или сравнение."""
+        if self.accept('keyword', 'not'):
+            return Not(self.negation())
+        if self.accept('punct', '('):
+            node = self.disjunction()
+            self.take('punct', ')')
+            return node
+        return self.comparison()
+
+    def comparison(self) -> Node:
+        """Сравнение поля со значением, списком или регулярным выражением."""
+        field = self.take('word').text
+        if self.accept('keyword', 'not'):
+            self.take('keyword', 'in')
+            return Not(Member(field, self.values()))
+        if self.accept('keyword', 'in'):
+            return Member(field, self.values())
+        operator = self.take('op').text
+        value = self.peek()
+        if value is None or value.kind not in ('word', 'string'):
+            raise WhereSyntaxError(f'Ожидалось значение после {field}{operator}')
+        self.index += 1
+        literal = _literal(value)
+        if operator in ('~', '!~'):
+            node: Node = Match(field, literal)
+            return Not(node) if operator == '!~' else node
+        if literal.convert is None and operator not in ('=', '==', '!='):
+            raise WhereSyntaxError(f'Значение null сравнивается только операторами = и !=: {field}{operator}null')
+        node = Compare(field, '=' if operator in ('==', '!=') else operator, literal)
+        return Not(node) if operator == '!=' else node
+
+    def values(self) -> Tuple[Literal, ...]:
+        """Значения списка в скобках."""
+        self.take('punct', '(')
+        literals = []
+        while True:
+            token = self.peek()
+            if token is None or token.kind not in ('word', 'string'):
+                raise WhereSyntaxError(f'Ожидалось значение списка в выражении {self.text!r}')
+            self.index += 1
+            literals.append(_literal(token))
+            if self.accept('punct', ')'):
+                return tuple(literals)
+            self.take('punct', ',')
+
+
+class Where:
+    """Скомпилированное выражение --where: предикат над строкой ответа API и дерево выражения."""
+
+    def __init__(self, node: Node, text: Optional[str] = None):
+        """Инициализация по дереву выражения.
+
+        :param node: Дерево выражения.
+        :param text: Исходный текст выражения; по умолчанию восстанавливается по дереву.
+        """
+        self.node = node
+        self.text = text if text is not None else format_node(node)
+        self._predicate = _compile(node)
+
+    def __call__(self, row: dict) -> bool:
+        """Проверяет строку."""
+        return self._predicate(row)
+
+    def __str__(self) -> str:
+        """Текст выражения."""
+        return self.text
+
+    def conjuncts(self) -> List[Node]:
+        """Условия верхнего уровня, объединённые через and."""
+        return list(self.node.parts) if isinstance(self.node, And) else [self.node]
+
+
+def compile_where(text: str) -> Where:
+    """Компилирует выражение --where в предикат над строкой ответа API.
+
+    :param text: Выражение, например "gpu_count>=8 and status in (Running,Pending)".
+    :raises WhereSyntaxError: Выражение не разобрано.
+    """
+    if not text or not text.strip():
+        raise WhereSyntaxError('Пустое выражение')
+    return Where(_Parser(text).parse(), text.strip())
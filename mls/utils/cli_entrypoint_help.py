@@ -4,9 +4,76 @@
 Реализованные классы позволяют переопределить стандартное поведение форматирования справки, позволяя создать более подробное
 представление команд, аргументов, опций и их описаний.
 """
+import importlib
+from typing import Dict
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+import click
+
 from .fomatter import CommonGroupFormatter
+from .style import highlight_format
+from .style import text_format
+
+
+class LazyCommand(NamedTuple):
+    """Статическое описание подкоманды, модуль которой загружается по требованию.
+
+    Attributes:
+        import_path: Путь вида 'пакет.модуль:объект' к click-команде или группе.
+        help: Текст справки команды, отображаемый в mls --help без импорта модуля.
+        commands: Имена подкоманд группы; пусто для одиночной команды.
+    """
+    import_path: str
+    help: str
+    commands: Tuple[str, ...] = ()
 
 
 class MLSHelp(CommonGroupFormatter):
-    """Класс Формат Помощи MLS."""
+    """Класс Формат Помощи MLS.
+
+    Подкоманды из lazy_commands импортируются только при обращении к ним,
+    справка по группе строится из статического описания.
+    """
     HEADING = 'Интерфейс командной строки MLS:'
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, LazyCommand]] = None, **kwargs):
+        """Инициализация группы с перечнем подкоманд, загружаемых по требованию."""
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx):
+        """Список подкоманд без импорта их модулей."""
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx, cmd_name):
+        """Возвращает подкоманду, импортируя её модуль при первом обращении."""
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attr = self.lazy_commands[cmd_name].import_path.split(':')
+            self.add_command(getattr(importlib.import_module(module_name), attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands_section(self, ctx: click.Context, formatter: click.HelpFormatter):
+        """Форматирует раздел команд по статическому описанию, не импортируя модули подкоманд."""
+        commands = self.list_commands(ctx)
+        if commands:
+            with formatter.section(text_format('Команды')):
+                self.indent(2, formatter)
+                for command in commands:
+                    spec = self.lazy_commands.get(command)
+                    if spec is None:
+                        cmd = self.get_command(ctx, command)
+                        if cmd is None or cmd.hidden:
+                            continue
+                        spec = LazyCommand(
+                            '', cmd.help or '', tuple(cmd.list_commands(ctx)) if isinstance(cmd, click.Group) else (),
+                        )
+                    formatter.write_text(highlight_format(command))
+                    if spec.commands:
+                        text = spec.help.replace('[command]', f'[{"|".join(spec.commands)}]')
+                        formatter.write_text(text_format(f'{text}'))
+                        formatter.write_text('')
+                    else:
+                        formatter.write_text(text_format(spec.help) or '')
+                self.dedent(2, formatter)
@@ -53,10 +53,13 @@ def api_client(client_class: Type[T]) -> Callable[[Callable[..., Any]], Callable
         @wraps(func)
         def init_client(*args: Any, **kwargs: Any) -> Any:
             """Инициализация PublicApi client."""
-            profile = read_profile(kwargs.pop('profile', None))
+            profile_name = kwargs.pop('profile', None)
+            profile = read_profile(profile_name)
 
             have_defaults = dict(
                 debug=kwargs.pop('debug', False),
+                profile=profile_name,
+                rate_limit=profile.get('rate_limit'),
             )
             stable_rules = dict(
                 client_id=profile.get('key_id', ''),
@@ -1,11 +1,13 @@
 """Описание общих функций."""
 from configparser import ConfigParser
+from typing import Optional
 
 import click
 from click import Command
 from click import Group
 
-from .openssl import decrypt
+from .key_cache import decrypt_credentials
+from .key_cache import unlocked_credentials
 from .settings import CONFIG_FILE
 from .settings import CREDENTIALS_FILE
 from .settings import ENCRYPTED_CREDENTIALS_FILE
@@ -20,6 +22,9 @@ def load_saved_config(password=None):
             config (ConfigParser): Объект конфигурации с настройками.
             credentials (ConfigParser): Объект конфигурации с учётными данными.
             password (str): Пароль для расшифровки файла с учётными данными.
+
+    Ключ расшифровки кэшируется в keyring (см. mls.utils.key_cache). Без пароля
+    используется credentials, а при его отсутствии - разблокированный credentials.key.
     """
     config, credentials = ConfigParser(), ConfigParser()
     config.read(CONFIG_FILE)
@@ -27,19 +32,19 @@ def load_saved_config(password=None):
     try:
         if password:
             with open(ENCRYPTED_CREDENTIALS_FILE, 'rb') as cred_file:
-                credentials_data = decrypt(cred_file.read(), password)
+                credentials_data = decrypt_credentials(cred_file.read(), password)
         else:
             with open(CREDENTIALS_FILE, 'r', encoding='utf-8') as cred_file:
                 credentials_data = cred_file.read()
     except FileNotFoundError:
-        credentials_data = ''
+        credentials_data = '' if password else unlocked_credentials(ENCRYPTED_CREDENTIALS_FILE)
 
     credentials.read_string(credentials_data)
 
     return config, credentials
 
 
-def handle_click_exception(error: click.ClickException, ctx: click.Context):
+def handle_click_exception(error: click.ClickException, ctx: Optional[click.Context]):
     """Обработка исключений Click и вывод соответствующих сообщений об ошибках."""
     message = error.format_message()
 
@@ -96,10 +101,11 @@ def suggest_autocomplete(input_str, commands_dict):
 def create_autocomplete(start_point, command_or_group, mapping):
     """Рекурсивная функция наполняющая автозаполнения."""
     if isinstance(command_or_group, Group):
-        mapping[start_point] = [str(command) for command in command_or_group.commands]
-        for command_name, command_obj in command_or_group.commands.items():
+        ctx = click.Context(command_or_group)
+        mapping[start_point] = command_or_group.list_commands(ctx)
+        for command_name in mapping[start_point]:
             next_point = f'{start_point} {command_name}'.strip()
-            create_autocomplete(next_point, command_obj, mapping)
+            create_autocomplete(next_point, command_or_group.get_command(ctx, command_name), mapping)
 
     elif isinstance(command_or_group, Command):
         mapping[start_point] = [
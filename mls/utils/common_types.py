@@ -3,8 +3,13 @@
 Этот модуль содержит классы, устанавливающие поведение Click Option и Click Params.
 
 """
+import re
+
 import click
 
+from mls.schema.where import compile_where
+from mls.schema.where import WhereSyntaxError
+
 
 class Path(click.Path):
     """Класс-обертка над click.Path для кастомизации строкового представления путей."""
@@ -160,5 +165,74 @@ class RangeView(click.ParamType):
         return 'RANGE'
 
 
+class RegexView(click.ParamType):
+    """Класс преобразователь строки в регулярное выражение."""
+    name = 'regex'
+
+    def convert(self, value, param, ctx):
+        """Компилирует регулярное выражение."""
+        if isinstance(value, re.Pattern):
+            return value
+        try:
+            return re.compile(value)
+        except re.error as e:
+            self.fail(f'{value} не является допустимым регулярным выражением: {e}', param, ctx)
+            return None
+
+    def __str__(self):
+        """Метод __str__.
+
+        Возвращает строку 'REGEX'.
+        Это упрощенное представление, служащее лишь предметом кастомизации.
+        """
+        return 'regex'
+
+
+class WhereView(click.ParamType):
+    """Класс преобразователь выражения --where в предикат отбора строк."""
+    name = 'where'
+
+    def convert(self, value, param, ctx):
+        """Компилирует выражение (см. mls.schema.where)."""
+        if callable(value):
+            return value
+        try:
+            return compile_where(value)
+        except WhereSyntaxError as e:
+            self.fail(f'{value} не является допустимым выражением: {e}', param, ctx)
+            return None
+
+    def __str__(self):
+        """Метод __str__.
+
+        Возвращает строку 'WHERE'.
+        Это упрощенное представление, служащее лишь предметом кастомизации.
+        """
+        return 'where'
+
+
+class ColumnsView(click.ParamType):
+    """Класс преобразователь списка полей через запятую в кортеж имён полей."""
+    name = 'columns'
+
+    def convert(self, value, param, ctx):
+        """Разбирает список полей; вложенные поля задаются через точку."""
+        if isinstance(value, tuple):
+            return value
+        columns = tuple(column.strip() for column in value.split(',') if column.strip())
+        if not columns:
+            self.fail(f'{value!r} не содержит имён полей', param, ctx)
+        return columns
+
+    def __str__(self):
+        """Метод __str__.
+
+        Возвращает строку 'COLUMNS'.
+        Это упрощенное представление, служащее лишь предметом кастомизации.
+        """
+        return 'columns'
+
+
 out_put_format = 'json', 'text'
 config_option_format_of_output = RussianChoice(out_put_format)
+list_output_format = RussianChoice(out_put_format + ('ndjson', 'csv'))
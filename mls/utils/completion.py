@@ -0,0 +1,176 @@
+"""Модуль индекса автозаполнения.
+
+Дерево команд click обходится один раз, результат сохраняется в ~/.mls/completion.json
+вместе с версией пакета. При нажатии TAB индекс читается с диска и разбирается в префиксное
+дерево, модули подкоманд при этом не импортируются. При смене версии индекс строится заново.
+
+Вместе со словарём команд в индексе хранится построенное префиксное дерево, поэтому при
+нажатии TAB дерево не строится заново, а только читается из файла.
+"""
+import json
+import os
+import sys
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from mls import __version__
+from mls.utils.settings import COMPLETION_FILE
+
+MAX_DEPTH = 3
+
+
+class CompletionTrie:
+    """Префиксное дерево по словам команды.
+
+    Каждый узел соответствует пути команды ('mls job') и хранит посимвольное дерево
+    его подкоманд и опций для поиска по префиксу последнего слова.
+    """
+
+    __slots__ = ('children', '_chars')
+
+    def __init__(self) -> None:
+        """Инициализация пустого узла."""
+        self.children: Dict[str, 'CompletionTrie'] = {}
+        self._chars: Dict[str, Any] = {}
+
+    @classmethod
+    def from_mapping(cls, mapping: Dict[str, List[str]]) -> 'CompletionTrie':
+        """Строит дерево из словаря вида {'mls job': ['kill', 'list', ...]}."""
+        root = cls()
+        for path, items in mapping.items():
+            node = root
+            for word in path.split(' '):
+                node = node.children.setdefault(word, cls())
+            for item in items:
+                node._insert(item)
+        return root
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompletionTrie':
+        """Восстанавливает дерево, сохранённое to_dict."""
+        node = cls()
+        node._chars = data['chars']
+        node.children = {word: cls.from_dict(child) for word, child in data['children'].items()}
+        return node
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Дерево в виде словаря для сохранения в JSON."""
+        return {'chars': self._chars, 'children': {word: child.to_dict() for word, child in self.children.items()}}
+
+    def node(self, words: Iterable[str]) -> Optional['CompletionTrie']:
+        """Возвращает узел по последовательности слов."""
+        node = self
+        for word in words:
+            if word not in node.children:
+                return None
+            node = node.children[word]
+        return node
+
+    def _insert(self, word: str):
+        """Добавляет слово в посимвольное дерево узла."""
+        chars = self._chars
+        for char in word:
+            chars = chars.setdefault(char, {})
+        chars[''] = word
+
+    def complete(self, prefix: str) -> List[str]:
+        """Слова узла, начинающиеся с prefix."""
+        chars = self._chars
+        for char in prefix:
+            if char not in chars:
+                return []
+            chars = chars[char]
+
+        words: List[str] = []
+        stack = [chars]
+        while stack:
+            current = stack.pop()
+            for key, value in current.items():
+                if key:
+                    stack.append(value)
+                else:
+                    words.append(value)
+        return sorted(words)
+
+    def suggest(self, input_str: str) -> List[str]:
+        """Варианты продолжения последнего слова ввода пользователя."""
+        *path, last = input_str.split(' ')
+        node = self.node(path)
+        return node.complete(last) if node else []
+
+
+def build_mapping() -> Dict[str, List[str]]:
+    """Обходит дерево команд mls и возвращает словарь автозаполнения."""
+    # pylint: disable=import-outside-toplevel
+    from mls.cli import cli
+    from mls.utils.common import create_autocomplete
+
+    mapping: Dict[str, List[str]] = {}
+    create_autocomplete('mls', cli, mapping)
+    return mapping
+
+
+def save_index(mapping: Dict[str, List[str]], trie: CompletionTrie, path: str = COMPLETION_FILE):
+    """Атомарно сохраняет индекс автозаполнения с текущей версией пакета."""
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump({'version': __version__, 'mapping': mapping, 'trie': trie.to_dict()}, file, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Автозаполнение работает и без файла, индекс будет построен при следующем вызове.
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_index(path: str = COMPLETION_FILE) -> Tuple[Dict[str, List[str]], CompletionTrie]:
+    """Читает словарь и дерево автозаполнения, при отсутствии или смене версии строит индекс заново."""
+    try:
+        with open(path, encoding='utf-8') as file:
+            index = json.load(file)
+        if index.get('version') == __version__ and isinstance(index.get('mapping'), dict):
+            mapping: Dict[str, List[str]] = index['mapping']
+            return mapping, CompletionTrie.from_dict(index['trie'])
+    except (OSError, ValueError, AttributeError, KeyError, TypeError):
+        pass
+
+    mapping = build_mapping()
+    trie = CompletionTrie.from_mapping(mapping)
+    save_index(mapping, trie, path)
+    return mapping, trie
+
+
+def complete(args: List[str], mapping: Dict[str, List[str]], trie: Optional[CompletionTrie] = None) -> str:
+    """Возвращает текст автозаполнения для аргументов командной строки.
+
+    :param trie: Дерево, построенное по mapping; без него дерево строится при вызове.
+    """
+    cleaned_arg = ' '.join([arg.strip() for arg in args if arg.strip()][1:][:MAX_DEPTH])
+    help_options = mapping.get(cleaned_arg, [])
+
+    if help_options:
+        return '\n\u00A0\n' + '\n'.join(help_options)
+    if trie is None:
+        trie = CompletionTrie.from_mapping(mapping)
+    return '\n'.join(trie.suggest(cleaned_arg))
+
+
+def autocomplete():
+    """Входная точка для запуска autocomplete.
+
+    Используется как complete entrypoint.
+
+    _mls_completion() {
+        autocomplete "${COMP_WORDS[@]}"
+    }
+    complete -F _mls_completion mls
+    """
+    try:
+        sys.stdout.write(complete(sys.argv, *load_index()))
+    except Exception:  # pylint: disable=broad-exception-caught
+        pass
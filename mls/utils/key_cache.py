@@ -0,0 +1,164 @@
+"""Модуль кэша ключа расшифровки учётных данных.
+
+Генерация ключа из пароля (PBKDF2, 10000 итераций) выполняется один раз,
+ключ сохраняется в keyring на KEYRING_TTL секунд и используется следующими
+вызовами mls для расшифровки credentials.key.
+
+Ключ привязан к соли файла: после перезаписи credentials.key он генерируется заново.
+Сохранённый при заданном MLS_PASSWORD ключ используется только с тем же паролем.
+После mls configure --unlock ключ используется и без MLS_PASSWORD до истечения
+срока или mls configure --lock.
+
+Кэш включается явно (MLS_KEYRING_CACHE=true) и работает только с системным
+хранилищем секретов. Файловые хранилища не используются: ключ в файле рядом с
+credentials.key сделал бы шифрование бесполезным. Без системного хранилища
+ключ генерируется при каждом вызове.
+"""
+import base64
+import hashlib
+import hmac
+import json
+import os
+import time
+from typing import Optional
+
+from .openssl import decrypt
+from .openssl import decrypt_with_key
+from .openssl import derive_key
+from .openssl import message_salt
+from .settings import ENCRYPTED_CREDENTIALS_FILE
+from .settings import KEYRING_CACHE
+from .settings import KEYRING_TTL
+
+KEYRING_SERVICE = 'mls'
+
+
+def _system(backend) -> bool:
+    """Признак системного хранилища: файловые хранилища keyrings.alt и заглушки keyring не подходят."""
+    module = type(backend).__module__
+    return not module.startswith(('keyrings.alt', 'keyring.backends.fail', 'keyring.backends.null'))
+
+
+def _backend():
+    """Системное хранилище keyring (или заданное PYTHON_KEYRING_BACKEND) или None, если его нет."""
+    # pylint: disable=import-outside-toplevel
+    try:
+        import keyring
+        from keyring.backends import chainer
+    except ImportError:
+        return None
+
+    backend = keyring.get_keyring()
+    if isinstance(backend, chainer.ChainerBackend):
+        system = [item for item in backend.backends if _system(item)]
+        return system[0] if system else None
+    return backend if _system(backend) else None
+
+
+def _username(path: str) -> str:
+    return 'credentials:' + hashlib.sha256(os.path.abspath(path).encode('utf-8')).hexdigest()
+
+
+def _password_check(dkey: bytes, password: str) -> str:
+    return hmac.new(dkey, password.encode('utf-8'), hashlib.sha256).hexdigest()
+
+
+class DerivedKeyCache:
+    """Кэш ключа расшифровки для файла зашифрованных учётных данных."""
+
+    def __init__(self, path: str = ENCRYPTED_CREDENTIALS_FILE, ttl: int = KEYRING_TTL, backend=None):
+        """Инициализация кэша.
+
+        :param path: Путь к файлу с зашифрованными учётными данными.
+        :param ttl: Время жизни ключа в секундах.
+        :param backend: Хранилище keyring, по умолчанию выбирается автоматически.
+        """
+        self.path = path
+        self.ttl = ttl
+        self._username = _username(path)
+        self._backend = backend if backend is not None else _backend()
+
+    @property
+    def available(self) -> bool:
+        """Признак доступности хранилища keyring."""
+        return self._backend is not None
+
+    def _load(self, salt: bytes) -> Optional[dict]:
+        if self._backend is None:
+            return None
+        try:
+            entry: Optional[dict] = json.loads(self._backend.get_password(KEYRING_SERVICE, self._username) or 'null')
+            if entry and entry['salt'] == salt.hex() and float(entry['expires_at']) > time.time():
+                return entry
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Недоступный или повреждённый keyring равнозначен пустому кэшу.
+            pass
+        return None
+
+    def _save(self, salt: bytes, dkey: bytes, password: Optional[str], unlocked: bool = False, ttl: Optional[int] = None):
+        if self._backend is None:
+            return
+        entry = {
+            'salt': salt.hex(),
+            'dkey': base64.b64encode(dkey).decode('ascii'),
+            'check': _password_check(dkey, password) if password else None,
+            'unlocked': unlocked,
+            'expires_at': time.time() + (self.ttl if ttl is None else ttl),
+        }
+        try:
+            self._backend.set_password(KEYRING_SERVICE, self._username, json.dumps(entry))
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
+
+    def decrypt(self, msg: bytes, password: str) -> str:
+        """Расшифровывает учётные данные, используя сохранённый ключ для этого пароля, если он есть."""
+        salt = message_salt(msg)
+        entry = self._load(salt)
+        if entry and entry['check']:
+            dkey = base64.b64decode(entry['dkey'])
+            if hmac.compare_digest(entry['check'], _password_check(dkey, password)):
+                return decrypt_with_key(msg, dkey)
+
+        dkey = derive_key(password, salt)
+        result = decrypt_with_key(msg, dkey)
+        if not entry or not entry['unlocked']:
+            self._save(salt, dkey, password)
+        return result
+
+    def decrypt_unlocked(self, msg: bytes) -> Optional[str]:
+        """Расшифровывает учётные данные ключом, сохранённым mls configure --unlock, или возвращает None."""
+        entry = self._load(message_salt(msg))
+        if not entry or not entry['unlocked']:
+            return None
+        return decrypt_with_key(msg, base64.b64decode(entry['dkey']))
+
+    def unlock(self, msg: bytes, password: str, ttl: Optional[int] = None):
+        """Проверяет пароль и сохраняет ключ для работы без MLS_PASSWORD."""
+        salt = message_salt(msg)
+        dkey = derive_key(password, salt)
+        decrypt_with_key(msg, dkey)
+        self._save(salt, dkey, password, unlocked=True, ttl=ttl)
+
+    def lock(self):
+        """Удаляет сохранённый ключ."""
+        if self._backend is None:
+            return
+        try:
+            self._backend.delete_password(KEYRING_SERVICE, self._username)
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
+
+
+def decrypt_credentials(msg: bytes, password: str) -> str:
+    """Расшифровывает credentials.key с кэшированием ключа, если кэш включён."""
+    if not KEYRING_CACHE:
+        return decrypt(msg, password)
+    return DerivedKeyCache().decrypt(msg, password)
+
+
+def unlocked_credentials(path: str = ENCRYPTED_CREDENTIALS_FILE) -> str:
+    """Учётные данные из credentials.key, если он разблокирован mls configure --unlock, иначе пустая строка."""
+    if not KEYRING_CACHE or not os.path.exists(path):
+        return ''
+    with open(path, 'rb') as cred_file:
+        return DerivedKeyCache(path).decrypt_unlocked(cred_file.read()) or ''
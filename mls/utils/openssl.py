@@ -25,6 +25,7 @@ import base64
 import os
 from functools import partial
 from itertools import islice
+from typing import Tuple
 
 from Crypto.Cipher import AES
 from Crypto.Hash import SHA256
@@ -73,7 +74,7 @@ def encrypt(data: str, password: str) -> bytes:
     :param password: Пароль для генерации ключа.
     """
     salt = os.urandom(SALT_LENGTH)
-    dkey = _get_dkey(password.encode('utf-8'), salt)
+    dkey = derive_key(password, salt)
     key = dkey[:KEY_LENGTH]
     iv = dkey[KEY_LENGTH:]
 
@@ -90,12 +91,25 @@ def encrypt(data: str, password: str) -> bytes:
     return _format_output(result)
 
 
-def decrypt(msg: bytes, password: str) -> str:
-    """Расшифровывает данные с использованием сгенерированного ключа.
+def derive_key(password: str, salt: bytes) -> bytes:
+    """Генерирует ключ (derived key) вида KEY+IV по паролю и соли.
 
-    :param msg: Зашифрованное сообщение в формате base64.
     :param password: Пароль для генерации ключа.
+    :param salt: Соль из зашифрованного сообщения.
+    """
+    return _get_dkey(password.encode('utf-8'), salt)
+
+
+def message_salt(msg: bytes) -> bytes:
+    """Возвращает соль зашифрованного сообщения.
+
+    :param msg: Зашифрованное сообщение в формате base64.
     """
+    return _split_message(msg)[0]
+
+
+def _split_message(msg: bytes) -> Tuple[bytes, bytes]:
+    """Разбирает зашифрованное сообщение на соль и зашифрованные данные."""
     try:
         data = base64.b64decode(msg)
     except ValueError as e:
@@ -105,17 +119,32 @@ def decrypt(msg: bytes, password: str) -> str:
         raise DecryptionError('Invalid message structure')
 
     data = data.removeprefix(SALTED_LITERAL)
-    salt = data[:SALT_LENGTH]
-    dkey = _get_dkey(password.encode('utf-8'), salt)
+    return data[:SALT_LENGTH], data[SALT_LENGTH:]
+
+
+def decrypt_with_key(msg: bytes, dkey: bytes) -> str:
+    """Расшифровывает данные готовым ключом без повторной генерации ключа из пароля.
+
+    :param msg: Зашифрованное сообщение в формате base64.
+    :param dkey: Ключ вида KEY+IV, полученный derive_key для соли сообщения.
+    """
+    _, encrypted_data = _split_message(msg)
     key = dkey[:KEY_LENGTH]
     iv = dkey[KEY_LENGTH:]
 
     cipher = AES.new(key, AES.MODE_CBC, iv)
 
-    encrypted_data = data[SALT_LENGTH:]
-
     try:
         padded_data = cipher.decrypt(encrypted_data)
         return str(unpad(padded_data, PADDING_BLOCK_SIZE).decode('utf-8'))
     except ValueError as e:
         raise DecryptionError('Unable to decrypt data') from e
+
+
+def decrypt(msg: bytes, password: str) -> str:
+    """Расшифровывает данные с использованием сгенерированного ключа.
+
+    :param msg: Зашифрованное сообщение в формате base64.
+    :param password: Пароль для генерации ключа.
+    """
+    return decrypt_with_key(msg, derive_key(password, message_salt(msg)))
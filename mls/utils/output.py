@@ -0,0 +1,164 @@
+"""Вывод ответов API в CLI.
+
+Клиенты mls_core возвращают разобранные ответы; формат вывода применяется
+здесь один раз: render - для ответа целиком, echo_list - для списков.
+
+Элементы сериализуются и выводятся по одному, по мере получения: документ
+целиком в памяти не собирается, вывод начинается с первого элемента. Опция
+--columns оставляет в элементах только перечисленные поля до сериализации;
+вложенные поля задаются через точку (query.source).
+
+Форматы:
+    json   - тот же документ, что json.dumps(..., indent=4, ensure_ascii=False)
+    ndjson - по одному элементу в строке (JSON Lines)
+    csv    - строка заголовка и строки значений; вложенные значения - JSON
+    text   - по одному элементу в строке в текстовом виде
+"""
+import csv
+import io
+import itertools
+import json
+from collections.abc import Mapping
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import click
+
+from mls.utils.style import success_format
+
+STREAM_FORMATS = 'ndjson', 'csv'
+
+
+def render(result, output: Optional[str]):
+    """Ответ API в формате вывода: для json словари и списки сериализуются с отступами, остальное - как есть."""
+    if output == 'json' and isinstance(result, (dict, list)):
+        return json.dumps(result, indent=4, ensure_ascii=False)
+    return result
+
+
+def echo_result(result, output: Optional[str]):
+    """Выводит ответ API в формате output."""
+    click.echo(success_format(render(result, output)))
+
+
+def split_items(response) -> Tuple[Optional[str], Optional[list]]:
+    """Ключ и элементы списка в ответе API.
+
+    Ответ - список: (None, список). Словарь с единственным полем-списком: (имя поля, список).
+    Иначе (None, None).
+    """
+    if isinstance(response, list):
+        return None, response
+    if isinstance(response, dict):
+        keys = [key for key, value in response.items() if isinstance(value, list)]
+        if len(keys) == 1:
+            return keys[0], response[keys[0]]
+    return None, None
+
+
+def _field(item, path: str):
+    for name in path.split('.'):
+        if not isinstance(item, Mapping):
+            return None
+        item = item.get(name)
+    return item
+
+
+def project(items: Iterable, columns: Sequence[str]) -> Iterator[dict]:
+    """Элементы, в которых оставлены только поля columns (None - нет поля)."""
+    for item in items:
+        yield {column: _field(item, column) for column in columns}
+
+
+def json_chunks(items: Iterable, key: Optional[str] = None) -> Iterator[str]:
+    """Части документа [items] или {key: [items]} в том же виде, что json.dumps(..., indent=4, ensure_ascii=False)."""
+    indent = ' ' * (8 if key is not None else 4)
+    outer = indent[4:]
+    if key is not None:
+        yield '{\n' + ' ' * 4 + json.dumps(key, ensure_ascii=False) + ': ['
+    else:
+        yield '['
+    separator = '\n'
+    for item in items:
+        text = json.dumps(item, indent=4, ensure_ascii=False).replace('\n', '\n' + indent)
+        yield separator + indent + text
+        separator = ',\n'
+    yield ('\n' + outer if separator == ',\n' else '') + ']' + ('\n}' if key is not None else '')
+
+
+def ndjson_lines(items: Iterable) -> Iterator[str]:
+    """Строки JSON Lines: один элемент - одна строка."""
+    for item in items:
+        yield json.dumps(item, ensure_ascii=False) + '\n'
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def csv_lines(items: Iterable, columns: Sequence[str] = ()) -> Iterator[str]:
+    """Строки CSV; без columns заголовок - поля первого элемента."""
+    iterator = iter(items)
+    if not columns:
+        first = next(iterator, None)
+        if first is None:
+            return
+        columns = list(first) if isinstance(first, dict) else ['value']
+        iterator = itertools.chain([first], iterator)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+
+    def line(values) -> str:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(values)
+        return buffer.getvalue()
+
+    yield line(columns)
+    for item in iterator:
+        if isinstance(item, dict):
+            yield line([_csv_value(item.get(column)) for column in columns])
+        else:
+            yield line([_csv_value(item)])
+
+
+def echo_list(items: Iterable, output: Optional[str], columns: Sequence[str] = (), key: Optional[str] = None):
+    """Выводит элементы списка по мере получения.
+
+    :param items: Элементы списка.
+    :param output: Формат вывода: json, ndjson, csv или text.
+    :param columns: Поля элементов для вывода (пусто - все поля).
+    :param key: Имя поля-списка в документе json ({key: [...]}).
+    """
+    if columns:
+        items = project(items, columns)
+    if output == 'ndjson':
+        chunks = ndjson_lines(items)
+    elif output == 'csv':
+        chunks = csv_lines(items, columns)
+    elif output == 'json':
+        chunks = itertools.chain(json_chunks(items, key), ['\n'])
+    else:
+        chunks = (f'{item}\n' for item in items)
+    for chunk in chunks:
+        click.echo(success_format(chunk), nl=False)
+
+
+def echo_response(response, output: Optional[str], columns: Sequence[str] = ()):
+    """Выводит ответ API со списком в формате output (см. echo_list).
+
+    Ответ без списка (например, сообщение об ошибке) выводится как есть.
+    """
+    key, items = split_items(response)
+    if items is None:
+        echo_result(response, 'json')
+        return
+    echo_list(items, output, columns, key)
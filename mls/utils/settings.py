@@ -26,6 +26,16 @@ CREDENTIALS_FILE = os.path.join(PROFILE_DIR, 'credentials')
 # Путь к файлу с зашифрованными учётными данными пользователя для системы MLS.
 ENCRYPTED_CREDENTIALS_FILE = os.path.join(PROFILE_DIR, 'credentials.key')
 
+# Кэш ключа расшифровки credentials.key в системном keyring: включение (по умолчанию выключен) и время жизни (в секундах).
+KEYRING_CACHE = os.getenv('MLS_KEYRING_CACHE', 'false') in ('t', 'true', 'True')
+KEYRING_TTL = int(os.getenv('MLS_KEYRING_TTL', 15 * 60))
+
+# Путь к индексу автозаполнения, перестраивается при смене версии пакета.
+COMPLETION_FILE = os.path.join(PROFILE_DIR, 'completion.json')
+
+# Каталог локального архива логов завершённых задач (mls job logs --archive).
+LOG_ARCHIVE_DIR = os.path.join(PROFILE_DIR, 'logs')
+
 # Имя профиля по умолчанию. Если переменная окружения `ML_PROFILE` не установлена,
 # используется значение 'default'.
 DEFAULT_PROFILE = os.getenv('MLS_PROFILE_DEFAULT', 'default')
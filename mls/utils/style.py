@@ -7,6 +7,7 @@ import click
 message_format = partial(click.style, fg='cyan', bold=True)
 success_format = partial(click.style, fg='green', bold=True)
 error_format = partial(click.style, fg='red', bold=True)
+changed_format = partial(click.style, fg='yellow', bold=True, reverse=True)
 
 # Настройка форматирования сообщений help
 text_format = partial(click.style, bold=False)
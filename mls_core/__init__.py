@@ -1,13 +1,19 @@
 """API client module."""
 from .client import DTSApi
 from .client import TrainingJobApi
+from .records import ConnectorRecord
+from .records import JobRecord
+from .records import TransferRecord
 from mls_core.allocation.client import AllocationApi
 from mls_core.queue.client import QueueApi
 
 
 __all__ = [
     'AllocationApi',
+    'ConnectorRecord',
     'DTSApi',
+    'JobRecord',
     'QueueApi',
     'TrainingJobApi',
+    'TransferRecord',
 ]
@@ -0,0 +1,230 @@
+"""Модуль взаимодействия с фоновым процессом mls agent.
+
+Агент держит в памяти сессии requests, токены доступа и расшифрованные профили
+и принимает запросы через unix-сокет, доступный только владельцу.
+
+Протокол: одно соединение на запрос, сообщения в формате JSON, по одному в строке.
+Ответ на HTTP-запрос начинается с заголовка (статус, заголовки ответа); тело
+передаётся в нём целиком либо, для потоковых запросов, последовательностью
+сообщений {'chunk': ...}, завершающейся {'end': true}.
+
+Если агент не запущен, методы клиента возвращают None и вызывающий код
+выполняет запрос самостоятельно.
+
+Зашифрованный профиль агент передаёт, только если вызывающий процесс знает
+пароль агента: клиент отправляет HMAC-SHA256 от своего пароля (см. password_digest),
+агент сравнивает его с HMAC своего пароля. Сам пароль через сокет не передаётся.
+"""
+import base64
+import hashlib
+import hmac
+import json
+import os
+import socket
+from typing import Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from urllib3.exceptions import ProtocolError
+
+from .exceptions import AgentError
+from .exceptions import AgentUnavailable
+from .exceptions import AuthorizationError
+from .exceptions import CircuitOpenError
+from .exceptions import InvalidAuthorizationToken
+from .setting import AGENT_SOCKET
+
+# Параметры запроса, которые можно передать агенту.
+FORWARDED_KWARGS = ('params', 'json', 'data', 'headers', 'timeout')
+
+# Исключения, которые агент передаёт клиенту по имени класса.
+FORWARDED_ERRORS = {
+    error.__name__: error for error in (
+        AuthorizationError,
+        CircuitOpenError,
+        InvalidAuthorizationToken,
+        requests.exceptions.ChunkedEncodingError,
+        requests.exceptions.ConnectionError,
+        requests.exceptions.InvalidURL,
+        requests.exceptions.MissingSchema,
+        requests.exceptions.RetryError,
+        requests.exceptions.Timeout,
+    )
+}
+
+
+def write_message(file, message: dict):
+    """Записывает сообщение протокола в поток."""
+    file.write(json.dumps(message, ensure_ascii=False).encode('utf-8') + b'\n')
+    file.flush()
+
+
+def read_message(file) -> dict:
+    """Читает сообщение протокола из потока."""
+    line = file.readline()
+    if not line:
+        raise ConnectionError('Соединение с mls agent закрыто')
+    message: dict = json.loads(line)
+    return message
+
+
+def encode_bytes(data: bytes) -> str:
+    """Кодирует двоичные данные для передачи в JSON."""
+    return base64.b64encode(data).decode('ascii')
+
+
+def decode_bytes(data: str) -> bytes:
+    """Декодирует двоичные данные, полученные в JSON."""
+    return base64.b64decode(data)
+
+
+def password_digest(password: str) -> str:
+    """Проверочное значение пароля расшифровки credentials.key для запроса профиля у агента."""
+    return hmac.new(password.encode('utf-8'), b'mls agent profile', hashlib.sha256).hexdigest()
+
+
+def raise_forwarded_error(message: dict):
+    """Возбуждает исключение, переданное агентом."""
+    error = FORWARDED_ERRORS.get(message.get('error', ''), AgentError)
+    raise error(message.get('message', ''))
+
+
+class _AgentStream:
+    """Источник данных потокового ответа (аналог urllib3 response для requests.Response.raw)."""
+
+    def __init__(self, sock: socket.socket, file):
+        self._sock = sock
+        self._file = file
+
+    def stream(self, amt=None, decode_content=None):  # pylint: disable=unused-argument
+        """Генератор частей ответа в порядке их получения агентом."""
+        try:
+            while True:
+                message = read_message(self._file)
+                if 'chunk' in message:
+                    yield decode_bytes(message['chunk'])
+                elif message.get('end'):
+                    return
+                else:
+                    raise ProtocolError(message.get('message', 'Ошибка потоковой передачи mls agent'))
+        except (OSError, ValueError) as error:
+            raise ProtocolError(error) from error
+        finally:
+            self.close()
+
+    def close(self):
+        """Закрывает соединение с агентом."""
+        self._file.close()
+        self._sock.close()
+
+
+class AgentClient:
+    """Клиент mls agent."""
+
+    def __init__(self, path: Optional[str] = None):
+        """Инициализация клиента.
+
+        :param path: Путь к unix-сокету агента, по умолчанию ~/.mls/agent.sock.
+        """
+        self.path = path or AGENT_SOCKET
+
+    def _connect(self) -> socket.socket:
+        if not os.path.exists(self.path):
+            raise AgentUnavailable(self.path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.path)
+        except OSError as error:
+            sock.close()
+            raise AgentUnavailable(self.path) from error
+        return sock
+
+    def call(self, message: dict) -> Optional[dict]:
+        """Отправляет служебное сообщение и возвращает ответ или None, если агент недоступен."""
+        try:
+            sock = self._connect()
+        except AgentUnavailable:
+            return None
+        with sock, sock.makefile('rwb') as file:
+            try:
+                write_message(file, message)
+                return read_message(file)
+            except (OSError, ValueError):
+                return None
+
+    def ping(self) -> Optional[dict]:
+        """Состояние агента или None, если агент не запущен."""
+        return self.call({'op': 'ping'})
+
+    def stop(self) -> bool:
+        """Останавливает агент; возвращает False, если агент не был запущен."""
+        return self.call({'op': 'stop'}) is not None
+
+    def get_profile(self, name: str, password: Optional[str]) -> Optional[dict]:
+        """Профиль пользователя из памяти агента.
+
+        :param name: Имя профиля.
+        :param password: Пароль зашифрованных учётных данных (MLS_PASSWORD) или None.
+        :return: Профиль или None, если агент не запущен, профиль ему неизвестен или пароль не совпал с паролем агента.
+        """
+        digest = password_digest(password) if password else None
+        reply = self.call({'op': 'profile', 'name': name, 'password': digest})
+        if reply and reply.get('ok'):
+            profile: dict = reply['profile']
+            return profile
+        return None
+
+    def forward(self, options: dict, method: str, path: str, stream: bool = False, **kwargs) -> Optional[requests.Response]:
+        """Выполняет HTTP-запрос через агент.
+
+        :param options: Параметры клиента, по которым агент выбирает сессию.
+        :param method: HTTP метод запроса.
+        :param path: Путь запроса относительно базового URL.
+        :param stream: Потоковое чтение ответа.
+        :param kwargs: Параметры запроса requests.
+        :return: Ответ или None, если агент недоступен или запрос нельзя передать агенту.
+        """
+        if set(kwargs) - set(FORWARDED_KWARGS):
+            return None
+        if isinstance(kwargs.get('data'), bytes):
+            kwargs['data'] = {'bytes': encode_bytes(kwargs['data'])}
+        try:
+            message = json.dumps({
+                'op': 'request', 'client': options, 'method': method, 'path': path, 'stream': stream, 'kwargs': kwargs,
+            })
+        except (TypeError, ValueError):
+            return None
+
+        try:
+            sock = self._connect()
+        except AgentUnavailable:
+            return None
+
+        file = sock.makefile('rwb')
+        try:
+            file.write(message.encode('utf-8') + b'\n')
+            file.flush()
+            header = read_message(file)
+        except (OSError, ValueError):
+            file.close()
+            sock.close()
+            return None
+
+        if not header.get('ok'):
+            file.close()
+            sock.close()
+            raise_forwarded_error(header)
+
+        response = requests.Response()
+        response.status_code = header['status']
+        response.reason = header.get('reason', '')
+        response.headers = CaseInsensitiveDict(header.get('headers', {}))
+        response.url = header.get('url', '')
+        response.encoding = header.get('encoding')
+        if stream:
+            response.raw = _AgentStream(sock, file)
+        else:
+            response._content = decode_bytes(header.get('body', ''))  # pylint: disable=protected-access
+            file.close()
+            sock.close()
+        return response
@@ -0,0 +1,130 @@
+"""Асинхронные клиенты для работы с платформой MLSPACE.
+
+Клиенты повторяют методы синхронных TrainingJobApi, DTSApi, AllocationApi и QueueApi:
+методы экземпляра возвращают корутины, генераторы (stream_logs, stream) - асинхронные
+генераторы, статические методы остаются синхронными.
+
+Запросы выполняет один синхронный клиент в пуле потоков ограниченного размера,
+поэтому токен доступа, сессия с пулом соединений и политика повторов urllib3
+общие для всех одновременных вызовов.
+
+Пример:
+    async with AsyncTrainingJobApi(endpoint_url, client_id, client_secret, x_workspace_id, x_api_key) as api:
+        statuses = await asyncio.gather(*(api.get_job_status(name) for name in names))
+"""
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from typing import Type
+
+from .allocation.client import AllocationApi
+from .client import CommonPublicApiInterface
+from .client import DTSApi
+from .client import TrainingJobApi
+from .queue.client import QueueApi
+from .setting import ASYNC_MAX_CONCURRENCY
+
+_END = object()
+
+
+class AsyncPublicApiInterface:
+    """Базовый асинхронный клиент поверх синхронного клиента SYNC_CLIENT."""
+
+    SYNC_CLIENT: Type[CommonPublicApiInterface] = CommonPublicApiInterface
+
+    def __init__(self, *args, max_concurrency: int = ASYNC_MAX_CONCURRENCY, **kwargs):
+        """Инициализация клиента.
+
+        :param args: Параметры синхронного клиента.
+        :param max_concurrency: Максимальное число одновременно выполняемых запросов.
+        :param kwargs: Параметры синхронного клиента.
+        """
+        kwargs.setdefault('pool_maxsize', max_concurrency)
+        self.client = self.SYNC_CLIENT(*args, **kwargs)
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix=type(self).__name__)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Ограничение одновременных вызовов (создаётся в работающем цикле событий)."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def run(self, func, *args, **kwargs):
+        """Выполняет синхронную функцию в пуле потоков клиента."""
+        async with self.semaphore:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def iterate(self, generator):
+        """Асинхронно перебирает синхронный генератор, получая каждый элемент в пуле потоков.
+
+        Слот ограничения занимается на всё время потока, как и соединение.
+        """
+        loop = asyncio.get_running_loop()
+        async with self.semaphore:
+            try:
+                while (item := await loop.run_in_executor(self._executor, next, generator, _END)) is not _END:
+                    yield item
+            finally:
+                await loop.run_in_executor(self._executor, generator.close)
+
+    def __getattr__(self, name: str):
+        """Асинхронный вариант метода синхронного клиента; прочие атрибуты возвращаются как есть."""
+        if name.startswith('_') or name == 'client':
+            raise AttributeError(name)
+        method = getattr(self.client, name)
+        attribute = inspect.getattr_static(self.SYNC_CLIENT, name, None)
+        if not callable(method) or isinstance(attribute, staticmethod):
+            return method
+
+        if inspect.isgeneratorfunction(inspect.unwrap(attribute)):
+            @functools.wraps(method)
+            def stream(*args, **kwargs):
+                return self.iterate(method(*args, **kwargs))
+            return stream
+
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            return await self.run(method, *args, **kwargs)
+        return call
+
+    async def aclose(self):
+        """Завершает пул потоков и закрывает сессию."""
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        self.client._session.close()  # pylint: disable=protected-access
+
+    async def __aenter__(self):
+        """Вход в асинхронный контекст."""
+        return self
+
+    async def __aexit__(self, *_):
+        """Выход из асинхронного контекста с освобождением ресурсов."""
+        await self.aclose()
+
+
+class AsyncTrainingJobApi(AsyncPublicApiInterface):
+    """Асинхронный клиент задач обучения."""
+
+    SYNC_CLIENT = TrainingJobApi
+
+
+class AsyncDTSApi(AsyncPublicApiInterface):
+    """Асинхронный клиент коннекторов и правил переноса."""
+
+    SYNC_CLIENT = DTSApi
+
+
+class AsyncAllocationApi(AsyncPublicApiInterface):
+    """Асинхронный клиент аллокаций."""
+
+    SYNC_CLIENT = AllocationApi
+
+
+class AsyncQueueApi(AsyncPublicApiInterface):
+    """Асинхронный клиент очередей."""
+
+    SYNC_CLIENT = QueueApi
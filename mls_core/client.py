@@ -1,29 +1,45 @@
 """Модуль содержащий клиентов для работы с платформой MLSPACE."""
 import http.client
-import json
+import itertools
 import logging
 import sys
+import threading
 import time
+from collections.abc import Mapping
 from dataclasses import asdict
 from datetime import datetime
 from functools import wraps
 from typing import Optional
+from typing import Tuple
 from uuid import UUID
 
 import click
 import requests
+from requests.adapters import DEFAULT_POOLSIZE  # type: ignore
 from requests.adapters import HTTPAdapter  # type: ignore
 from requests.sessions import ChunkedEncodingError  # type: ignore
-from urllib3.util.retry import Retry
 
+from .agent import AgentClient
 from .exceptions import AuthorizationError
 from .exceptions import DataStreamingFailure
 from .exceptions import InvalidAuthorizationToken
+from .ratelimit import RateLimiter
+from .records import as_records
+from .records import ConnectorRecord
+from .records import JobRecord
+from .records import TransferRecord
+from .retry import retry_after
+from .retry import RetryPolicy
+from .setting import AGENT
 from .setting import BACKOFF_FACTOR
 from .setting import CONNECT_TIMEOUT
+from .setting import JOB_PAGE_SIZE
 from .setting import MAX_RETRIES
+from .setting import RATE_LIMIT
 from .setting import READ_TIMEOUT
 from .setting import SSL_VERIFY
+from .setting import TOKEN_CACHE
+from .token_cache import TokenCache
 from mls.manager.dts.custom_types import ALL_CONNECTOR_TYPES
 from mls.manager.dts.custom_types import ConnectorInput
 from mls.manager.dts.custom_types import CronViewModel
@@ -36,6 +52,9 @@ class CommonPublicApiInterface:
     """API клиент."""
 
     AUTH_ENDPOINT = 'service_auth'
+    # Маршруты POST-запросов, повтор которых не создаёт новых объектов (см. mls_core.retry).
+    IDEMPOTENT_POSTS: Tuple[str, ...] = (AUTH_ENDPOINT,)
+    # Формат вывода, выбранный пользователем CLI (json, text, ...). Клиент ответы не форматирует.
     USER_OUTPUT_PREFERENCE = None
 
     def __init__(
@@ -52,6 +71,11 @@ class CommonPublicApiInterface:
         ssl_verify=SSL_VERIFY,
         debug: bool = False,
         logger: Optional[logging.Logger] = None,
+        profile: Optional[str] = None,
+        agent: bool = AGENT,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        records: bool = False,
+        rate_limit: Optional[str] = None,
     ):
         """Инициализация класса PublicApi.
 
@@ -62,55 +86,106 @@ class CommonPublicApiInterface:
         :param x_api_key: ключ доступа к воркспейсу.
         :param max_retries: Максимальное количество попыток повторного запроса.
         :param backoff_factor: Фактор экспоненциальной задержки между повторными попытками.
+            Повторы, бюджет повторов и автомат отключения описаны в mls_core.retry.
         :param connect_timeout: Таймаут подключения (в секундах).
         :param read_timeout: Таймаут чтения (в секундах).
         :param ssl_verify: Параметр проверки сертификатов.
         :param debug: Включение отладочного режима.
         :param logger: Журнал приложения.
-
+        :param profile: Имя профиля пользователя. Если задано, токен доступа кэшируется на диске.
+        :param agent: Передавать запросы запущенному mls agent. В отладочном режиме запросы выполняются напрямую.
+        :param pool_maxsize: Размер пула соединений сессии (число одновременных запросов из разных потоков).
+        :param records: Возвращать задачи, правила переноса и коннекторы записями mls_core.records вместо словарей.
+        :param rate_limit: Ограничение частоты запросов, например "read=20,write=5" (см. mls_core.ratelimit).
+            По умолчанию MLS_RATE_LIMIT. Ограничение общее для клиентов с тем же профилем и адресом API.
+
+        Авторизация выполняется при первом обращении к API, а не при создании клиента.
         """
         self._endpoint_url = endpoint_url
         self._connect_timeout = connect_timeout
         self._read_timeout = read_timeout
         self._debug = debug
+        self.records = records
 
         self._logger = (
             logger if logger is not None else self._create_logger(self._debug)
         )
-        self._init_session(backoff_factor, max_retries)
+        self._init_session(pool_maxsize)
+        self._retry = RetryPolicy(endpoint_url, max_retries, backoff_factor, self.IDEMPOTENT_POSTS, self._logger)
+        self._rate_key = f'{profile or client_id}|{endpoint_url}'
+        self._limiter = RateLimiter.from_spec(rate_limit or RATE_LIMIT, self._rate_key)
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
         self.ssl_verify = ssl_verify
         self.workspace_id = x_workspace_id
 
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self._token: Optional[str] = None
+        self._token_expires_in = None
+        self._auth_lock = threading.Lock()
+        self._token_cache = (
+            TokenCache(profile, endpoint_url, x_workspace_id, client_id, client_secret)
+            if profile and client_secret and TOKEN_CACHE else None
+        )
+
+        self._agent = AgentClient() if agent and not debug else None
+        self._agent_options = dict(
+            endpoint_url=endpoint_url,
+            client_id=client_id,
+            client_secret=client_secret,
+            x_workspace_id=x_workspace_id,
+            x_api_key=x_api_key,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            ssl_verify=ssl_verify,
+            profile=profile,
+            rate_limit=rate_limit or RATE_LIMIT,
+        )
+
         headers = {
-            'authorization': self._get_auth_token(client_id, client_secret),
             'x-workspace-id': x_workspace_id,
             'x-api-key': x_api_key,
         }
 
         self._session.headers.update(headers)
 
-    def _init_session(self, backoff_factor: float, max_retries: int):
-        session = requests.Session()
+    def __getstate__(self):
+        """Состояние клиента для копирования без блокировки авторизации."""
+        state = self.__dict__.copy()
+        state.pop('_auth_lock', None)
+        return state
 
-        retries = Retry(
-            total=max_retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=[500, 502, 503, 504],
-            allowed_methods=[
-                'HEAD',
-                'GET',
-                'PUT',
-                'DELETE',
-                'OPTIONS',
-                'POST',
-            ],
-        )
+    def __setstate__(self, state):
+        """Восстановление клиента из состояния с новой блокировкой авторизации."""
+        self.__dict__.update(state)
+        self._auth_lock = threading.Lock()
 
-        session.mount('https://', HTTPAdapter(max_retries=retries))
+    def _init_session(self, pool_maxsize: int = DEFAULT_POOLSIZE):
+        """Сессия без повторов на уровне адаптера: повторы выполняет RetryPolicy."""
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_maxsize=pool_maxsize))
         self._session = session
 
+    def set_pool_maxsize(self, pool_maxsize: int):
+        """Изменяет размер пула соединений сессии.
+
+        :param pool_maxsize: Число одновременных запросов из разных потоков.
+        """
+        self._session.mount('https://', HTTPAdapter(pool_maxsize=pool_maxsize))
+
+    def set_rate_limit(self, rate_limit: str):
+        """Дополняет ограничение частоты запросов клиента; классы адресов из rate_limit ограничиваются заново.
+
+        :param rate_limit: Ограничение, например "write=5:1" (см. mls_core.ratelimit).
+        :raises ValueError: Неверный формат ограничения.
+        """
+        spec = ','.join(filter(None, (self._agent_options['rate_limit'], rate_limit)))
+        self._limiter = RateLimiter.from_spec(spec, self._rate_key)
+        self._agent_options['rate_limit'] = spec
+
     def _create_logger(self, debug: bool):
         logger = logging.getLogger(self.__class__.__name__)
         logger.setLevel(logging.WARNING)
@@ -136,14 +211,30 @@ class CommonPublicApiInterface:
 
         return logger
 
-    def _request(self, method: str, path: str, **kwargs):
+    def _send(self, method: str, path: str, **kwargs):
+        """Отправляет запрос и возвращает объект ответа без обработки статуса.
+
+        Перед первым запросом выполняется авторизация. Если сервер ответил 401,
+        токен обновляется, а запрос повторяется ровно один раз.
+
+        Если запущен mls agent, запрос вместе с авторизацией выполняет агент.
+        Повторы при ошибках выполняются по политике клиента (см. mls_core.retry), каждая попытка
+        ожидает разрешения ограничения частоты запросов (см. mls_core.ratelimit).
+        """
         timeout = kwargs.pop(
             'timeout',
             (self._connect_timeout, self._read_timeout),
         )
-        headers = kwargs.pop('headers', {})
+        headers = dict(kwargs.pop('headers', {}))
 
-        try:
+        if self._agent is not None:
+            response = self._agent.forward(self._agent_options, method, path, headers=headers, timeout=timeout, **kwargs)
+            if response is not None:
+                return response
+
+        def send():
+            if self._limiter is not None and (delay := self._limiter.acquire(method, path)):
+                self._logger.debug(f'Ограничение частоты запросов: {method} {path} ожидал {delay:.2f} с')
             response = self._session.request(
                 method,
                 f'{self._endpoint_url}/{path}',
@@ -152,14 +243,70 @@ class CommonPublicApiInterface:
                 **kwargs,
                 verify=self.ssl_verify,
             )
-            response.raise_for_status()
-        except requests.exceptions.RetryError as ex:
-            self._logger.debug(ex)
-            return None
+            if response.status_code == 429 and self._limiter is not None:
+                self._limiter.throttled(method, path, retry_after(response) or 1.0)
+            return response
+
+        is_auth = path == self.AUTH_ENDPOINT
+        if not is_auth:
+            self._ensure_authorized()
+
+        rejected = self._token
+        response = self._retry.send(method, path, send, headers)
+        if response.status_code == 401 and not is_auth:
+            self._logger.debug('Токен доступа отклонен сервером, выполняется повторная авторизация')
+            response.close()
+            self._refresh_token(rejected)
+            response = self._retry.send(method, path, send, headers)
+        return response
+
+    def _request(self, method: str, path: str, **kwargs):
+        response = self._send(method, path, **kwargs)
+        response.raise_for_status()
         if response.headers.get('content-type') == 'application/json':
             return response.json()
         return response.text
 
+    def _ensure_authorized(self):
+        """Выполняет отложенную авторизацию, если токен ещё не получен."""
+        if self._token is not None:
+            return
+        with self._auth_lock:
+            if self._token is None:
+                self._set_token(self._authorize())
+
+    def _set_token(self, token: str):
+        self._token = token
+        self._session.headers['authorization'] = token
+
+    def _authorize(self) -> str:
+        """Возвращает токен доступа из кэша или получает новый через service_auth."""
+        if self._token_cache is not None:
+            cached = self._token_cache.load()
+            self._logger.debug(TokenCache.stats())
+            if cached:
+                return cached
+
+        token: str = self._get_auth_token(self._client_id, self._client_secret)
+        if self._token_cache is not None:
+            self._token_cache.save(token, self._token_expires_in)
+        return token
+
+    def _refresh_token(self, rejected: Optional[str]):
+        """Сбрасывает отклонённый токен и выполняет авторизацию заново.
+
+        Если токен уже обновлён параллельным запросом, повторная авторизация не выполняется.
+        """
+        with self._auth_lock:
+            if self._token != rejected:
+                return
+            if self._token_cache is not None:
+                self._token_cache.invalidate()
+            token = self._get_auth_token(self._client_id, self._client_secret)
+            if self._token_cache is not None:
+                self._token_cache.save(token, self._token_expires_in)
+            self._set_token(token)
+
     def _get_auth_token(self, client_id: str, client_secret: str):
         try:
             response: dict = self.post(
@@ -173,6 +320,7 @@ class CommonPublicApiInterface:
                 self._logger.debug(response)
                 raise InvalidAuthorizationToken()
 
+            self._token_expires_in = response['token'].get('expires_in')
             return token
         except requests.exceptions.HTTPError as ex:
             self._logger.debug(ex)
@@ -202,70 +350,51 @@ class CommonPublicApiInterface:
         """HEAD запрос."""
         return self._request('HEAD', *args, **kwargs)
 
+    def _records(self, record, data):
+        """Ответ API записями record, если клиент создан с records=True (см. mls_core.records)."""
+        return as_records(record, data) if self.records else data
+
     @staticmethod
     def _handle_api_response(method):
-        """Метод обработки ответа от API."""
+        """Метод обработки ответа от API.
+
+        Ответ с ошибкой HTTP возвращается разобранным телом ответа (см. _handle_http_error).
+        Клиент возвращает разобранные объекты; форматирование для вывода выполняет CLI (mls.utils.output).
+        """
         @wraps(method)
         def wrapper(self, *args, **kwargs):
             try:
-                response = method(self, *args, **kwargs)
+                return method(self, *args, **kwargs)
+            except AuthorizationError:
+                raise
             except requests.exceptions.HTTPError as ex:
-                response = self._handle_http_error(ex)
-            return self._user_preference_output(response)
+                return self._handle_http_error(ex)
 
         return wrapper
 
-    def _user_preference_output(self, result):
-        """Формат вывода пользователю сообщений."""
-        if self.USER_OUTPUT_PREFERENCE:
-            if self.USER_OUTPUT_PREFERENCE == 'json' and isinstance(result, (dict, list)):
-                return json.dumps(result, indent=4, ensure_ascii=False)
-            return result
-        return result
-
     def _handle_http_error(self, ex):
         """Обработка исключений HTTPError."""
         self._logger.debug(ex)
         if ex.response.headers.get('content-type') == 'application/json':
-            result = ex.response.json()
-        else:
-            result = ex.response.text
-        return self._user_preference_output(result)
+            return ex.response.json()
+        return ex.response.text
 
 
 class TrainingJobApi(CommonPublicApiInterface):
     """Выделенный клиент api содержащий логику взаимодействия с задачами обучения."""
 
-    USER_OUTPUT_PREFERENCE = None
+    _handle_api_response = CommonPublicApiInterface._handle_api_response
 
-    @staticmethod
-    def _handle_api_response(method):
-        @wraps(method)
-        def wrapper(self, *args, **kwargs):
-            try:
-                response = method(self, *args, **kwargs)
-            except requests.exceptions.HTTPError as ex:
-                response = self._handle_http_error(ex)
-            return self._user_preference_output(response)
+    def download_logs(self, name: str, region: str, verbose: bool = False, chunk_size: int = 64 * 1024):
+        """Вспомогательный метод загрузки всего журнала логов задачи по частям (bytes).
 
-        return wrapper
-
-    def _user_preference_output(self, result):
-        """Формат вывода пользователю сообщений."""
-        if self.USER_OUTPUT_PREFERENCE:
-            if self.USER_OUTPUT_PREFERENCE == 'json' and isinstance(result, dict):
-                return json.dumps(result, indent=4, ensure_ascii=False)
-            return result
-        return result
-
-    def _handle_http_error(self, ex):
-        """Обработка исключений HTTPError."""
-        self._logger.debug(ex)
-        if ex.response.headers.get('content-type') == 'application/json':
-            result = ex.response.json()
-        else:
-            result = ex.response.text
-        return self._user_preference_output(result)
+        В отличие от `stream_logs` ответ с ошибкой возбуждает `HTTPError`.
+        """
+        params = {'region': region, 'tail': 0, 'verbose': verbose}
+        response = self._send('GET', f'jobs/{name}/logs', params=params, stream=True)
+        with response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size=chunk_size)
 
     @_handle_api_response
     def get_job_logs(
@@ -275,14 +404,17 @@ class TrainingJobApi(CommonPublicApiInterface):
         params = {'region': region, 'tail': tail, 'verbose': verbose}
         return self.get(f'jobs/{name}/logs', params=params)
 
+    def status(self, name):
+        """Вспомогательный метод получения статуса задачи."""
+        return self.get(f'jobs/{name}')
+
     @_handle_api_response
     def get_job_status(self, name):
         """Получение статуса задачи."""
-        return self.get(f'jobs/{name}')
+        return self._records(JobRecord, self.status(name))
 
-    @_handle_api_response
-    def get_list_jobs(self, region, queue, allocation_name, status, limit, offset):
-        """Получение логов задачи."""
+    def jobs(self, region, queue, allocation_name, status, limit, offset):
+        """Вспомогательный метод для получения списка задач."""
         params = {
             'region': region,
             'allocation_name': allocation_name,
@@ -293,71 +425,111 @@ class TrainingJobApi(CommonPublicApiInterface):
         }
         return self.get('jobs', params=params)
 
+    @_handle_api_response
+    def get_list_jobs(self, region, queue, allocation_name, status, limit, offset):
+        """Получение логов задачи."""
+        response = self.jobs(region, queue, allocation_name, status, limit, offset)
+        if self.records and isinstance(response, dict) and 'jobs' in response:
+            response['jobs'] = as_records(JobRecord, response['jobs'])
+        return response
+
+    def iter_job_pages(self, region, queue, allocation_name, status, limit=0, offset=0, page_size=JOB_PAGE_SIZE):
+        """Страницы списка задач по limit/offset; следующая страница запрашивается, когда прочитана предыдущая.
+
+        Загрузка прекращается на неполной странице или после limit задач (0 - без ограничения).
+        """
+        fetched = 0
+        while not limit or fetched < limit:
+            size = min(page_size, limit - fetched) if limit else page_size
+            jobs = self.jobs(region, queue, allocation_name, status, size, offset + fetched).get('jobs', [])
+            if jobs:
+                yield self._records(JobRecord, jobs)
+            fetched += len(jobs)
+            if len(jobs) < size:
+                return
+
+    @_handle_api_response
+    def get_job_pages(self, region, queue, allocation_name, status, limit=0, offset=0, page_size=JOB_PAGE_SIZE):
+        """Страницы списка задач (см. iter_job_pages); первая страница загружается сразу.
+
+        Ошибка загрузки первой страницы возвращается разобранным телом ответа до начала вывода списка.
+        """
+        pages = self.iter_job_pages(region, queue, allocation_name, status, limit, offset, page_size)
+        return itertools.chain(list(itertools.islice(pages, 1)), pages)
+
+    def iter_jobs(self, region, queue, allocation_name, status, limit=0, offset=0, page_size=JOB_PAGE_SIZE):
+        """Задачи по одной с постраничной загрузкой по мере чтения (см. iter_job_pages)."""
+        for page in self.iter_job_pages(region, queue, allocation_name, status, limit, offset, page_size):
+            yield from page
+
     @_handle_api_response
     def get_pods(self, name):
         """Вызов получения списка подов для задач pytorch (elastic)."""
         return self.get(f'jobs/elastic/{name}/pods')
 
+    def kill(self, name, region):
+        """Вспомогательный метод завершения работы задачи."""
+        params = {'region': region}
+        return self.delete(f'jobs/{name}', params=params)
+
     @_handle_api_response
     def delete_job(self, name, region):
         """Вызов завершения работы задачи."""
-        params = {'region': region}
-        return self.delete(f'jobs/{name}', params=params)
+        return self.kill(name, region)
+
+    def restart(self, name):
+        """Вспомогательный метод перезапуска задачи."""
+        payload = {'job_name': name}
+        return self.post('jobs/restart', json=payload)
 
     @_handle_api_response
     def restart_job(self, name):
         """Вызов перезапуска задачи."""
-        payload = {'job_name': name}
-        return self.post('jobs/restart', json=payload)
+        return self.restart(name)
+
+    def submit(self, payload):
+        """Вспомогательный метод запуска задачи."""
+        return self.post('jobs', json=payload)
 
     @_handle_api_response
     def run_job(self, payload):
         """Вызов запуска задачи."""
-        return self.post('jobs', json=payload)
+        return self.submit(payload)
 
-    def stream(self, method: str, path: str, **kwargs):
+    def stream(self, method: str, path: str, chunk_size: int = 256, raw: bool = False, **kwargs):
         """Выполняет HTTP запрос с использованием заданного метода к указанному пути возвращает данные порционно(потоково).
 
+        Открытие (и каждое переоткрытие) потока проходит через авторизацию клиента:
+        при ответе 401 токен обновляется и поток открывается повторно.
+
+        При ошибке `ChunkedEncodingError` до получения данных запрос выполняется повторно с экспоненциальной
+        задержкой. Обрыв после получения данных возбуждает `DataStreamingFailure`: повтор запроса вернул бы
+        поток с начала, продолжение с места обрыва выполняет mls_core.logs.LogFollower.
+
         :param method: HTTP метод запроса.
         :param path: Путь запроса, который будет добавлен к базовому URL.
+        :param chunk_size: Максимальный размер части ответа в байтах.
+        :param raw: Возвращать части ответа в байтах без декодирования.
         :param kwargs: Дополнительные параметры запроса.
         :return: Генератор, который возвращает данные ответа по частям. В случае ошибки запроса возвращает статус ответа с описанием ошибки.
         """
-        timeout = kwargs.pop('timeout', (self._connect_timeout, self._read_timeout))
-        headers = kwargs.pop('headers', {})
-        try:
-            response = self._session.request(
-                method,
-                f'{self._endpoint_url}/{path}',
-                headers=headers,
-                timeout=timeout,
-                stream=True,
-                **kwargs,
-                verify=self.ssl_verify,
-            )
-        except requests.exceptions.RetryError as ex:
-            self._logger.debug(ex)
-        else:
-            if response.status_code == 200:
-                yield from self._stream_data_with_retry(response)
-            else:
-                yield f'{response.status_code}, {response.text}'
-
-    def _stream_data_with_retry(self, response):
-        """Потоково читает данные ответа, пытаясь снова при возникновении ошибки `ChunkedEncodingError`.
-
-        :param response: Объект ответа `requests. Response`, из которого будут читаться данные.
-        :return: Генератор, возвращающий данные ответа по частям.
-
-        В случае повторяющихся ошибок `ChunkedEncodingError` до достижения максимального количества попыток
-        инициирует исключение `DataStreamingFailure`.
-        """
         last_error = None
-        for attempt in range(1, self.max_retries + 1):
+        for attempt in range(1, self.max_retries + 2):
+            response = self._send(method, path, stream=True, **kwargs)
+            if response.status_code != 200:
+                message = f'{response.status_code}, {response.text}'
+                yield message.encode('utf-8') if raw else message
+                return
+
+            received = False
             try:
-                yield from response.iter_content(chunk_size=256, decode_unicode=True)
+                for chunk in response.iter_content(chunk_size=chunk_size, decode_unicode=not raw):
+                    received = True
+                    yield chunk
                 return
             except ChunkedEncodingError as er:
+                if received:
+                    raise DataStreamingFailure(f'Поток данных прерван: {er}') from er
                 sleep_time = self.backoff_factor * (2 ** (attempt - 1))
                 self._logger.debug(
                     f'Обработка ошибки потоковой передачи данных: {er}. Ожидаем {sleep_time} секунд перед следующей попыткой.',
@@ -372,17 +544,19 @@ class TrainingJobApi(CommonPublicApiInterface):
             f'повторных попыток из-за ошибки кодирования Chunk. Последняя ошибка: {last_error}',
         )
 
-    def stream_logs(self, name, region, tail=0, verbose=False):
+    def stream_logs(self, name, region, tail=0, verbose=False, chunk_size=256, raw=False):
         """Выполняет потоковую загрузку логов для указанной задачи с использованием заданных параметров.
 
         :param name: Имя задачи, для которой запрашиваются логи.
         :param region: Регион, в котором выполнена задача.
         :param tail: Количество последних строк лога для отображения.
         :param verbose: Флаг, указывающий на необходимость вывода подробных логов.
+        :param chunk_size: Максимальный размер части ответа в байтах.
+        :param raw: Возвращать части ответа в байтах без декодирования.
         :return: Вызывает функцию `stream`, чтобы выполнить потоковую загрузку логов задачи.
         """
         params = {'region': region, 'tail': tail, 'verbose': verbose}
-        yield from self.stream('GET', f'jobs/{name}/logs', params=params)
+        yield from self.stream('GET', f'jobs/{name}/logs', chunk_size, raw, params=params)
 
 
 class ConnectorRoutes:
@@ -415,39 +589,16 @@ class TransferRoutes:
 class DTSApi(CommonPublicApiInterface):
     """Выделенный API-клиент, содержащий логику взаимодействия с коннекторами, правилами переноса и их историей."""
 
-    USER_OUTPUT_PREFERENCE = None
-
-    @staticmethod
-    def _handle_api_response(method):
-        """Метод обработки ответа от API."""
-        @wraps(method)
-        def wrapper(self, *args, **kwargs):
-            try:
-                response = method(self, *args, **kwargs)
-            except requests.exceptions.HTTPError as ex:
-                response = self._handle_http_error(ex)
-            return self._user_preference_output(response)
-
-        return wrapper
+    _handle_api_response = CommonPublicApiInterface._handle_api_response
 
-    def _user_preference_output(self, result):
-        """Формат вывода пользователю сообщений."""
-        if self.USER_OUTPUT_PREFERENCE:
-            if self.USER_OUTPUT_PREFERENCE == 'json' and isinstance(
-                result, (dict, list),
-            ):
-                return json.dumps(result, indent=4, ensure_ascii=False)
-            return result
-        return result
-
-    def _handle_http_error(self, ex):
-        """Обработка исключений HTTPError."""
-        self._logger.debug(ex)
-        if ex.response.headers.get('content-type') == 'application/json':
-            result = ex.response.json()
-        else:
-            result = ex.response.text
-        return self._user_preference_output(result)
+    IDEMPOTENT_POSTS = CommonPublicApiInterface.IDEMPOTENT_POSTS + (
+        ConnectorRoutes.UPDATE,
+        ConnectorRoutes.TRY,
+        ConnectorRoutes.HALT,
+        TransferRoutes.SWITCH,
+        TransferRoutes.CANCEL,
+        TransferRoutes.UPDATE,
+    )
 
     @staticmethod
     def is_type_valid(typ):
@@ -477,12 +628,12 @@ class DTSApi(CommonPublicApiInterface):
         if not self.is_type_valid(typ):
             return []
 
-        return list(filter(lambda d: d['source_type'] == typ, connectors))
+        return [connector for connector in connectors if connector['source_type'] == typ]
 
     @staticmethod
     def filter_by_connector_ids(connectors, connector_ids) -> list:
         """Фильтрация коннекторов по ids."""
-        return list(filter(lambda d: d['connector_id'] in connector_ids, connectors))
+        return [connector for connector in connectors if connector['connector_id'] in connector_ids]
 
     @_handle_api_response
     def conn_sources(self):
@@ -492,7 +643,7 @@ class DTSApi(CommonPublicApiInterface):
     @_handle_api_response
     def conn_list(self, connector_ids=None, typ=None):
         """Получение одного или списка коннекторов."""
-        connectors = self.get(ConnectorRoutes.LIST)
+        connectors = self._records(ConnectorRecord, self.get(ConnectorRoutes.LIST))
         by_type = self.filter_by_type(connectors, typ)
 
         if not connector_ids:
@@ -569,7 +720,7 @@ class DTSApi(CommonPublicApiInterface):
     @_handle_api_response
     def transfer_list(self):
         """Получение списка всех правил переноса с обработкой вывода."""
-        return self.get_transfers()
+        return self._records(TransferRecord, self.get_transfers())
 
     def transfer(self, transfer_id: str):
         """Вспомогательный метод для получения провила переноса."""
@@ -578,7 +729,7 @@ class DTSApi(CommonPublicApiInterface):
     @_handle_api_response
     def transfer_get(self, transfer_id: str):
         """Получение информации о провиле переноса."""
-        return self.transfer(transfer_id=transfer_id)
+        return self._records(TransferRecord, self.transfer(transfer_id=transfer_id))
 
     @_handle_api_response
     def transfer_switch(self, transfer_id: str, state: bool):
@@ -610,7 +761,7 @@ class DTSApi(CommonPublicApiInterface):
     @_handle_api_response
     def transfer_update(self, transfer_id: str, params: dict):
         """Обновление периодического правила переноса."""
-        t = {}
+        t: Mapping = {}
         try:
             if not self.is_periodic(transfer_id):
                 raise click.exceptions.BadParameter(
@@ -618,10 +769,7 @@ class DTSApi(CommonPublicApiInterface):
                 )
 
             transfer = self.transfer_get(transfer_id)
-            if isinstance(transfer, str):
-                t = json.loads(transfer)
-
-            elif isinstance(transfer, dict):
+            if isinstance(transfer, Mapping):
                 t = transfer
         except Exception as e:
             raise click.ClickException(
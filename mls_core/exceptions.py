@@ -15,3 +15,15 @@ class DataStreamingFailure(Exception):
 
 class InvalidAuthorizationToken(Exception):
     """Ошибка при чтении токена авторизации."""
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """API недоступно: автомат отключения временно не пропускает запросы (см. mls_core.retry)."""
+
+
+class AgentError(Exception):
+    """Ошибка выполнения запроса на стороне mls agent."""
+
+
+class AgentUnavailable(Exception):
+    """mls agent не запущен или недоступен, запрос выполняется напрямую."""
@@ -0,0 +1,232 @@
+"""Возобновляемое чтение журнала логов задачи.
+
+Поток логов обрывается по таймауту сервера или при сбое сети. LogFollower
+переоткрывает его с окном tail последних строк и пропускает строки, которые
+уже были выданы: хэши последних строк сравниваются с началом нового окна.
+Повторно загружается не весь журнал, а только окно, поэтому слежение за
+длинными логами не дорожает со временем.
+
+multiplex объединяет строки нескольких источников (задач) в порядке
+поступления. Каждый источник читается в своём потоке и накапливает не больше
+buffer строк, поэтому медленный или слишком многословный источник не задерживает
+вывод остальных.
+
+Пример:
+    follower = LogFollower(lambda tail: api.stream_logs(name, region, tail), lambda: is_running(name))
+    for line in follower:
+        print(line)
+"""
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import AnyStr
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Generic
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import requests
+
+from .exceptions import DataStreamingFailure
+from .setting import LOG_FOLLOW_WINDOW
+from .setting import LOG_RECONNECT_BACKOFF
+from .setting import LOG_RECONNECT_MAX_BACKOFF
+from .setting import LOG_SOURCE_BUFFER
+from .setting import MAX_RETRIES
+
+
+_END = object()
+
+
+class _Resync:
+    """Поиск места продолжения в окне переоткрытого потока.
+
+    Окно - последние строки журнала. Его начало совпадает с окончанием уже
+    выданных строк; строки после наибольшего такого совпадения - новые.
+    """
+
+    def __init__(self, history: List[int]):
+        self.history = history
+        self.candidates = list(range(len(history)))
+        self.buffer: list = []
+        self.matched = 0
+
+    def feed(self, line, key: int) -> Optional[list]:
+        """Принимает строку окна; возвращает новые строки, когда место продолжения найдено."""
+        index = len(self.buffer)
+        self.buffer.append(line)
+        alive = []
+        for position in self.candidates:
+            if self.history[position + index] != key:
+                continue
+            if position + index + 1 == len(self.history):
+                self.matched = index + 1
+            else:
+                alive.append(position)
+        self.candidates = alive
+        return None if alive else self.resolve()
+
+    def resolve(self) -> list:
+        """Новые строки окна с учётом найденного совпадения."""
+        return self.buffer[self.matched:]
+
+
+class LogFollower(Generic[AnyStr]):
+    """Итератор строк журнала с переподключением без повторов."""
+
+    def __init__(
+        self,
+        open_stream: Callable[[int], Iterable[AnyStr]],
+        is_running: Callable[[], bool],
+        tail: int = 0,
+        window: int = LOG_FOLLOW_WINDOW,
+        backoff_factor: float = LOG_RECONNECT_BACKOFF,
+        max_backoff: float = LOG_RECONNECT_MAX_BACKOFF,
+        max_errors: int = MAX_RETRIES,
+    ):
+        """Инициализация.
+
+        :param open_stream: Открывает поток логов с указанным числом последних строк (0 - весь журнал).
+        :param is_running: Признак того, что задача продолжает писать логи.
+        :param tail: Число последних строк при первом подключении.
+        :param window: Число последних строк при переподключении и размер истории хэшей.
+        :param backoff_factor: Начальная задержка переподключения без новых строк, секунды.
+        :param max_backoff: Максимальная задержка переподключения, секунды.
+        :param max_errors: Число сбоев подряд, после которого ошибка передаётся вызывающему.
+        """
+        self.open_stream: Callable[[int], Iterable[AnyStr]] = open_stream
+        self.is_running = is_running
+        self.tail = tail
+        self.window = window
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_errors = max_errors
+        self.history: Deque[int] = deque(maxlen=window)
+        self.reconnects = 0
+        self.rest: Optional[AnyStr] = None
+        self._logger = logging.getLogger(type(self).__name__)
+
+    def _emit(self, lines: List[AnyStr]) -> List[AnyStr]:
+        for line in lines:
+            self.history.append(hash(line))
+        return lines
+
+    def _read(self, tail: int) -> Iterator[List[AnyStr]]:
+        """Новые завершённые строки каждой части одного подключения; незавершённая строка сохраняется в self.rest."""
+        resync = _Resync(list(self.history)) if self.history else None
+        self.rest = None
+        for chunk in self.open_stream(tail):
+            if self.rest is None:
+                self.rest = chunk[:0]
+            lines = (self.rest + chunk).split(b'\n' if isinstance(chunk, bytes) else '\n')
+            self.rest = lines.pop()
+            if resync is None:
+                new = lines
+            else:
+                new = []
+                for index, line in enumerate(lines):
+                    if (resolved := resync.feed(line, hash(line))) is not None:
+                        resync = None
+                        new = resolved + lines[index + 1:]
+                        break
+            if new:
+                yield self._emit(new)
+        if resync is not None:
+            if not resync.matched:
+                self._logger.debug('Окно переподключения не пересекается с выданными строками, часть логов могла быть пропущена')
+            if new := resync.resolve():
+                yield self._emit(new)
+
+    def batches(self) -> Iterator[List[AnyStr]]:
+        """Новые строки журнала частями по мере получения, до завершения задачи.
+
+        Строки без символа перевода строки; тип строк (str или bytes) совпадает с типом частей потока.
+        """
+        tail, idle, errors = self.tail, 0, 0
+        while True:
+            count = 0
+            try:
+                for batch in self._read(tail):
+                    count += len(batch)
+                    yield batch
+                errors = 0
+            except (requests.exceptions.RequestException, DataStreamingFailure) as error:
+                errors += 1
+                if errors >= self.max_errors:
+                    raise
+                self._logger.debug(f'Поток логов прерван: {error}')
+
+            if not self.is_running():
+                # Незавершённая строка оборванного потока придёт целиком в окне переподключения,
+                # а у завершённой задачи это последняя строка журнала.
+                if self.rest:
+                    yield self._emit([self.rest])
+                return
+            idle = 0 if count else idle + 1
+            if idle:
+                time.sleep(min(self.max_backoff, self.backoff_factor * 2 ** (idle - 1)))
+            tail = self.window
+            self.reconnects += 1
+
+    def __iter__(self) -> Iterator[AnyStr]:
+        """Строки журнала до завершения задачи."""
+        for batch in self.batches():
+            yield from batch
+
+
+def _put(buffer: queue.Queue, item, stop: threading.Event) -> bool:
+    """Помещает элемент в буфер источника, ожидая места; False, если чтение остановлено."""
+    while not stop.is_set():
+        try:
+            buffer.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def multiplex(sources: Dict[str, Callable[[], Iterable[str]]], buffer: int = LOG_SOURCE_BUFFER) -> Iterator[Tuple[str, str]]:
+    """Объединяет строки нескольких источников в порядке поступления.
+
+    :param sources: Источник строк по имени; вызывается в отдельном потоке.
+    :param buffer: Максимальное число невыведенных строк одного источника.
+    :return: Пары (имя источника, строка). Ошибка источника выдаётся его последней строкой.
+    """
+    stop = threading.Event()
+    ready: queue.Queue = queue.Queue()
+    buffers: Dict[str, queue.Queue] = {key: queue.Queue(maxsize=max(buffer, 1)) for key in sources}
+
+    def produce(key: str, open_lines: Callable[[], Iterable[str]]):
+        try:
+            for line in open_lines():
+                if not _put(buffers[key], line, stop):
+                    return
+                ready.put(key)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            if _put(buffers[key], f'Ошибка чтения логов: {error}', stop):
+                ready.put(key)
+        finally:
+            if _put(buffers[key], _END, stop):
+                ready.put(key)
+
+    for key, open_lines in sources.items():
+        threading.Thread(target=produce, args=(key, open_lines), name=f'logs-{key}', daemon=True).start()
+
+    remaining = len(sources)
+    try:
+        while remaining:
+            key = ready.get()
+            item = buffers[key].get_nowait()
+            if item is _END:
+                remaining -= 1
+            else:
+                yield key, item
+    finally:
+        stop.set()
@@ -0,0 +1,222 @@
+"""Ограничение частоты запросов к API на стороне клиента.
+
+Запросы делятся на классы адресов: read (GET, HEAD, OPTIONS), write (POST,
+PUT, DELETE) и logs (потоки логов). Для каждого класса задаются частота
+(запросов в секунду) и запас (burst) - число запросов, которые выполняются
+подряд без ожидания после простоя.
+
+Ограничение работает по алгоритму token bucket с резервированием: запрос
+сразу забирает маркер, а при нехватке ждёт, пока маркер накопится.
+Одновременные запросы выстраиваются в очередь и идут с наибольшей допустимой
+частотой, не получая 429. Если ответ 429 всё же пришёл, корзина класса
+опустошается на время Retry-After: ждут и остальные потоки.
+
+Корзины общие для всех клиентов процесса с одним профилем и адресом API и
+защищены блокировкой потоков. Состояние корзины хранится в файле в
+~/.mls/ratelimit, файл блокируется через fcntl.flock. Поэтому параллельные
+процессы mls с одним профилем делят общий лимит. Без fcntl (Windows) или при
+MLS_RATE_LIMIT_SHARED=false ограничение действует только внутри процесса.
+
+Формат настройки (MLS_RATE_LIMIT или rate_limit в профиле):
+    read=20,write=5:10,logs=2 - частота и, после двоеточия, запас для классов;
+    10                        - одна частота для всех классов.
+Частота 0 или пустая настройка означают отсутствие ограничения.
+"""
+import hashlib
+import math
+import os
+import threading
+import time
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from .setting import RATE_LIMIT_DIR
+from .setting import RATE_LIMIT_SHARED
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+READ = 'read'
+WRITE = 'write'
+LOGS = 'logs'
+ENDPOINT_CLASSES = (READ, WRITE, LOGS)
+READ_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS'))
+
+
+def endpoint_class(method: str, path: str) -> str:
+    """Класс адреса запроса."""
+    if method.upper() not in READ_METHODS:
+        return WRITE
+    return LOGS if path.rstrip('/').endswith('/logs') else READ
+
+
+def parse_limits(spec: Optional[str]) -> Dict[str, Tuple[float, int]]:
+    """Частота и запас по классам адресов из строки настройки.
+
+    :param spec: Настройка, например "read=20,write=5:10".
+    :raises ValueError: Неверный формат настройки.
+    """
+    limits: Dict[str, Tuple[float, int]] = {}
+    for part in (item.strip() for item in (spec or '').split(',')):
+        if not part:
+            continue
+        name, separator, value = part.rpartition('=')
+        names = (name.strip(),) if separator else ENDPOINT_CLASSES
+        if not set(names) <= set(ENDPOINT_CLASSES):
+            raise ValueError(f'Неизвестный класс адресов {name!r} в ограничении частоты запросов {spec!r}')
+        rate_text, _, burst_text = value.partition(':')
+        try:
+            rate = float(rate_text)
+            burst = int(burst_text) if burst_text else max(1, math.ceil(rate))
+        except ValueError:
+            raise ValueError(f'Неверное ограничение частоты запросов {part!r}') from None
+        if rate < 0 or burst < 1:
+            raise ValueError(f'Неверное ограничение частоты запросов {part!r}')
+        for item in names:
+            if rate:
+                limits[item] = (rate, burst)
+            else:
+                limits.pop(item, None)
+    return limits
+
+
+class TokenBucket:
+    """Корзина маркеров с резервированием; состояние может храниться в файле, общем для процессов."""
+
+    def __init__(self, rate: float, burst: int, path: Optional[str] = None, clock: Callable[[], float] = time.time):
+        """Инициализация.
+
+        :param rate: Маркеров в секунду.
+        :param burst: Вместимость корзины.
+        :param path: Файл состояния, общий для процессов; None - состояние только в памяти.
+        :param clock: Источник времени (общий для процессов).
+        """
+        self.rate = rate
+        self.burst = burst
+        self.path = path
+        self.clock = clock
+        self.tokens = float(burst)
+        self.updated = clock()
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._pid = 0
+
+    def _open(self) -> Optional[int]:
+        """Дескриптор файла состояния; после fork файл открывается заново, чтобы не делить блокировку с родителем."""
+        if self.path is None or fcntl is None:
+            return None
+        if self._fd is None or self._pid != os.getpid():
+            try:
+                os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+                self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+                self._pid = os.getpid()
+            except OSError:
+                # Ограничение не должно ломать работу команды: без файла корзина работает внутри процесса.
+                self.path = None
+                return None
+        return self._fd
+
+    def _load(self, fd: int):
+        try:
+            tokens, updated = os.pread(fd, 64, 0).split()
+            self.tokens, self.updated = min(float(tokens), self.burst), float(updated)
+        except ValueError:
+            pass
+
+    def _store(self, fd: int):
+        data = f'{self.tokens!r} {self.updated!r}'.encode('ascii')
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, data, 0)
+
+    def _update(self, change: Callable[[], float]) -> float:
+        """Пополняет корзину по прошедшему времени и применяет change под блокировкой потоков и файла."""
+        with self._lock:
+            fd = self._open()
+            if fd is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if fd is not None:
+                    self._load(fd)
+                now = self.clock()
+                self.tokens = min(float(self.burst), self.tokens + max(0.0, now - self.updated) * self.rate)
+                self.updated = now
+                result = change()
+                if fd is not None:
+                    self._store(fd)
+                return result
+            finally:
+                if fd is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def reserve(self) -> float:
+        """Забирает маркер и возвращает время ожидания в секундах, после которого можно выполнить запрос."""
+        def take() -> float:
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+        return self._update(take)
+
+    def drain(self, delay: float):
+        """Опустошает корзину так, чтобы следующий маркер появился не раньше чем через delay секунд."""
+        def empty() -> float:
+            self.tokens = min(self.tokens, -delay * self.rate)
+            return 0.0
+        self._update(empty)
+
+
+_buckets: Dict[Tuple[str, str], TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def bucket_for(key: str, name: str, rate: float, burst: int) -> TokenBucket:
+    """Корзина класса адресов name, общая для клиентов процесса с ключом key."""
+    with _buckets_lock:
+        bucket = _buckets.get((key, name))
+        if bucket is None or (bucket.rate, bucket.burst) != (rate, burst):
+            path = os.path.join(RATE_LIMIT_DIR, f'{key}.{name}') if RATE_LIMIT_SHARED else None
+            bucket = _buckets[(key, name)] = TokenBucket(rate, burst, path)
+        return bucket
+
+
+class RateLimiter:
+    """Ограничение частоты запросов клиента по классам адресов."""
+
+    sleep = staticmethod(time.sleep)
+
+    def __init__(self, limits: Dict[str, Tuple[float, int]], key: str):
+        """Инициализация.
+
+        :param limits: Частота и запас по классам адресов (см. parse_limits).
+        :param key: Ключ общих корзин: профиль и адрес API.
+        """
+        self.limits = limits
+        self.key = hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def from_spec(cls, spec: Optional[str], key: str) -> Optional['RateLimiter']:
+        """Ограничение по строке настройки или None, если ограничение не задано."""
+        limits = parse_limits(spec)
+        return cls(limits, key) if limits else None
+
+    def _bucket(self, method: str, path: str) -> Optional[TokenBucket]:
+        name = endpoint_class(method, path)
+        if name not in self.limits:
+            return None
+        return bucket_for(self.key, name, *self.limits[name])
+
+    def acquire(self, method: str, path: str) -> float:
+        """Ожидает возможности выполнить запрос и возвращает время ожидания в секундах."""
+        bucket = self._bucket(method, path)
+        delay = bucket.reserve() if bucket is not None else 0.0
+        if delay:
+            self.sleep(delay)
+        return delay
+
+    def throttled(self, method: str, path: str, delay: float):
+        """Учитывает ответ 429: запросы класса приостанавливаются на delay секунд."""
+        bucket = self._bucket(method, path)
+        if bucket is not None:
+            bucket.drain(delay)
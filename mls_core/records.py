@@ -0,0 +1,216 @@
+"""Компактные записи ответов API: задачи, правила переноса и коннекторы.
+
+По умолчанию клиенты возвращают ответы API словарями. Клиент, созданный
+с records=True, возвращает задачи, правила переноса и коннекторы записями:
+поля хранятся в __slots__ без словаря на каждый объект, поэтому длинный
+список занимает в несколько раз меньше памяти, а чтение атрибута быстрее
+поиска по ключу.
+
+Редко используемые вложенные поля (parameters, crontab, query) хранятся
+JSON в байтах (UTF-8, без пробелов) и разбираются при первом обращении:
+такая строка в несколько раз меньше словаря со списками внутри.
+
+Запись - неизменяемое отображение (Mapping) над ответом API: record['status'],
+record.get('status') и dict(record) работают так же, как для словаря, поэтому
+таблицы, --where и --columns принимают записи без изменений. Поля ответа,
+не описанные в записи, доступны только по ключу.
+"""
+import json
+from collections.abc import Mapping
+from typing import Any
+from typing import ClassVar
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+
+_SEPARATORS = (',', ':')
+
+
+class _Lazy:
+    """Атрибут вложенного поля: значение разбирается при первом чтении и сохраняется в слоте."""
+    __slots__ = ('slot',)
+
+    def __init__(self, slot: str):
+        self.slot = slot
+
+    def __get__(self, record, owner=None):
+        if record is None:
+            return self
+        value = getattr(record, self.slot, None)
+        if isinstance(value, bytes):
+            value = json.loads(value)
+            setattr(record, self.slot, value)
+        return value
+
+
+def _slots(fields: Tuple[str, ...], lazy: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(f'_{name}' if name in lazy else name for name in fields)
+
+
+class Record(Mapping):
+    """Запись ответа API с полями в __slots__.
+
+    :cvar FIELDS: Поля записи в порядке ответа API.
+    :cvar LAZY: Вложенные поля, разбираемые при первом обращении.
+    """
+    __slots__ = ('_extra',)
+
+    FIELDS: ClassVar[Tuple[str, ...]] = ()
+    LAZY: ClassVar[Tuple[str, ...]] = ()
+    _SLOTS: ClassVar[Dict[str, str]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Сопоставляет поля слотам и добавляет атрибуты вложенных полей."""
+        super().__init_subclass__(**kwargs)
+        cls._SLOTS = dict(zip(cls.FIELDS, _slots(cls.FIELDS, cls.LAZY)))
+        for name in cls.LAZY:
+            setattr(cls, name, _Lazy(f'_{name}'))
+
+    def __init__(self, data: Mapping):
+        """Инициализация.
+
+        :param data: Объект из ответа API.
+        """
+        slots = self._SLOTS
+        extra = None
+        for key, value in data.items():
+            slot = slots.get(key)
+            if slot is None:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+            elif slot != key and isinstance(value, (dict, list)):
+                setattr(self, slot, json.dumps(value, ensure_ascii=False, separators=_SEPARATORS).encode())
+            else:
+                setattr(self, slot, value)
+        self._extra = extra
+
+    def __getattr__(self, name: str):
+        """Поле записи, отсутствующее в ответе API, читается как None."""
+        if name in self._SLOTS:
+            return None
+        raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+
+    def _has(self, name: str) -> bool:
+        try:
+            object.__getattribute__(self, self._SLOTS[name])
+        except AttributeError:
+            return False
+        return True
+
+    def __getitem__(self, key: str) -> Any:
+        """Значение поля как в ответе API."""
+        if key in self._SLOTS:
+            if self._has(key):
+                return getattr(self, key)
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Поля ответа API: описанные в записи, затем остальные."""
+        yield from (name for name in self.FIELDS if self._has(name))
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        """Число полей ответа API."""
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        """Представление записи с полями ответа API."""
+        return f'{type(self).__name__}({self.to_dict()!r})'
+
+    def to_dict(self) -> dict:
+        """Словарь ответа API."""
+        return dict(self)
+
+
+class JobRecord(Record):
+    """Задача обучения."""
+    FIELDS = (
+        'uid', 'job_name', 'status', 'region', 'instance_type', 'job_desc', 'created_dt', 'updated_dt', 'completed_dt',
+        'cost', 'gpu_count', 'duration', 'namespace', 'queue_name', 'queue_id', 'allocation_name',
+    )
+    __slots__ = _slots(FIELDS, ())
+
+    uid: str
+    job_name: str
+    status: str
+    region: str
+    instance_type: str
+    job_desc: Optional[str]
+    created_dt: str
+    updated_dt: Optional[str]
+    completed_dt: Optional[str]
+    cost: str
+    gpu_count: int
+    duration: str
+    namespace: str
+    queue_name: Optional[str]
+    queue_id: Optional[str]
+    allocation_name: Optional[str]
+
+
+class ConnectorRecord(Record):
+    """Коннектор."""
+    FIELDS = (
+        'connector_id', 'workspace_id', 'name', 'source_type', 'system', 'favorite', 'status', 'type_status', 'created',
+        'modified', 'uid', 'parameters',
+    )
+    LAZY = ('parameters',)
+    __slots__ = _slots(FIELDS, LAZY)
+
+    connector_id: str
+    workspace_id: str
+    name: str
+    source_type: str
+    system: bool
+    favorite: bool
+    status: str
+    type_status: Optional[str]
+    created: str
+    modified: str
+    uid: str
+    parameters: Optional[dict]
+
+
+class TransferRecord(Record):
+    """Правило переноса."""
+    FIELDS = (
+        'transfer_id', 'uid', 'cluster_name', 'connector_id', 'destination_connector_id', 'workspace_id', 'name',
+        'description', 'source_category', 'destination_source_category', 'strategy', 'crontab', 'system', 'favorite',
+        'query', 'active', 'created', 'modified', 'execution_date',
+    )
+    LAZY = ('crontab', 'query')
+    __slots__ = _slots(FIELDS, LAZY)
+
+    transfer_id: str
+    uid: str
+    cluster_name: str
+    connector_id: str
+    destination_connector_id: str
+    workspace_id: str
+    name: str
+    description: Optional[str]
+    source_category: str
+    destination_source_category: str
+    strategy: str
+    crontab: Optional[dict]
+    system: bool
+    favorite: bool
+    query: Optional[dict]
+    active: bool
+    created: str
+    modified: str
+    execution_date: Optional[str]
+
+
+def as_records(record, data):
+    """Объекты ответа API записями record: список - списком записей, объект - записью, остальное как есть."""
+    if isinstance(data, list):
+        return [record(item) if isinstance(item, Mapping) else item for item in data]
+    if isinstance(data, Mapping):
+        return record(data)
+    return data
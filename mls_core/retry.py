@@ -0,0 +1,376 @@
+"""Политика повторов запросов к API.
+
+Повторы выполняет клиент, а не адаптер urllib3: повтор любого запроса, включая
+POST, при ответе 5xx мог дважды создать задачу или правило переноса, а
+задержки между попытками растягивали одну команду больше чем на минуту.
+
+Классы идемпотентности:
+    IDEMPOTENT     - GET, HEAD, OPTIONS, PUT, DELETE и POST на адреса из списка
+                     идемпотентных у клиента (IDEMPOTENT_POSTS). Повторяются при
+                     ошибках соединения, таймаутах и ответах 429, 500, 502, 503, 504.
+    NON_IDEMPOTENT - остальные POST. Запросу назначается заголовок Idempotency-Key,
+                     общий для всех попыток. Повтор выполняется, только если
+                     запрос заведомо не обработан: соединение не установлено или
+                     сервер ответил 429 или 503.
+
+Задержка перед повтором берётся из заголовка Retry-After (секунды или дата).
+Без заголовка задержка экспоненциальная со случайным разбросом и не больше
+RETRY_MAX_BACKOFF. Если сервер просит ждать дольше RETRY_AFTER_MAX, запрос
+не повторяется.
+
+Бюджет повторов (RetryBudget) общий для процесса. Каждый запрос пополняет его
+на RETRY_BUDGET_RATIO, каждый повтор расходует единицу, запас не больше
+RETRY_BUDGET_MIN. При недоступности API повторы добавляют к нагрузке не больше
+этой доли.
+
+Автомат отключения (CircuitBreaker) общий для адреса API. После BREAKER_THRESHOLD
+неудачных попыток подряд (ошибка соединения, таймаут или 5xx) запросы
+BREAKER_RESET_TIMEOUT секунд сразу завершаются ошибкой CircuitOpenError. Затем
+выполняется одна пробная попытка: при успехе автомат закрывается. Пробная
+попытка, прерванная другим исключением (не ответом API), возвращает автомат в
+открытое состояние, и следующая попытка снова пробная. Если автомат открылся
+во время повторов запроса, повторы прекращаются с последней ошибкой.
+
+Счётчики повторов и состояние автомата выводятся в режиме --debug (см. stats).
+"""
+import email.utils
+import logging
+import random
+import re
+import threading
+import time
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from uuid import uuid4
+
+import requests
+import urllib3
+
+from .exceptions import CircuitOpenError
+from .setting import BACKOFF_FACTOR
+from .setting import BREAKER_RESET_TIMEOUT
+from .setting import BREAKER_THRESHOLD
+from .setting import MAX_RETRIES
+from .setting import RETRY_AFTER_MAX
+from .setting import RETRY_BUDGET_MIN
+from .setting import RETRY_BUDGET_RATIO
+from .setting import RETRY_MAX_BACKOFF
+
+IDEMPOTENT = 'idempotent'
+NON_IDEMPOTENT = 'non-idempotent'
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+# Ответы, после которых запрос заведомо не обработан сервером.
+REJECTED_STATUSES = frozenset((429, 503))
+FAILURE_STATUSES = frozenset((500, 502, 503, 504))
+
+
+class RetryMetrics:
+    """Счётчики политики повторов."""
+
+    def __init__(self):
+        """Инициализация нулевых счётчиков."""
+        self.requests = 0
+        self.retries = 0
+        self.retry_after = 0
+        self.budget_exhausted = 0
+        self.fast_failures = 0
+        self.breaker_opened = 0
+        self.slept = 0.0
+
+
+def stats() -> str:
+    """Строка со счётчиками повторов и состоянием автоматов отключения для отладочного вывода."""
+    breakers = ', '.join(f'{name} - {breaker.state}' for name, breaker in _breakers.items()) or 'нет'
+    return (
+        f'Повторы: запросов {METRICS.requests}, повторов {METRICS.retries} '
+        f'(по Retry-After {METRICS.retry_after}), ожидание {METRICS.slept:.1f} с, '
+        f'бюджет исчерпан {METRICS.budget_exhausted}, бюджет {BUDGET.tokens:.1f}; '
+        f'автомат отключения: открыт {METRICS.breaker_opened}, отклонено {METRICS.fast_failures}, '
+        f'состояние: {breakers}'
+    )
+
+
+def route_pattern(route: str) -> re.Pattern:
+    """Регулярное выражение адреса по шаблону маршрута: {параметр} - один сегмент пути."""
+    return re.compile(re.sub(r'\\{[^}]*\\}', '[^/]+', re.escape(route)))
+
+
+def retry_after(response: requests.Response) -> Optional[float]:
+    """Задержка из заголовка Retry-After в секундах или None."""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
+
+
+def not_sent(error: requests.exceptions.ConnectionError) -> bool:
+    """Соединение не установлено: запрос не был отправлен серверу."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, (urllib3.exceptions.NewConnectionError, urllib3.exceptions.ConnectTimeoutError))
+
+
+class RetryBudget:
+    """Бюджет повторов: запросы пополняют его на долю ratio, повтор расходует единицу."""
+
+    def __init__(self, ratio: float = RETRY_BUDGET_RATIO, minimum: int = RETRY_BUDGET_MIN):
+        """Инициализация.
+
+        :param ratio: Доля повторов от числа запросов.
+        :param minimum: Запас повторов; бюджет не превышает это значение.
+        """
+        self.ratio = ratio
+        self.minimum = minimum
+        self.tokens = float(minimum)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        """Учитывает новый запрос."""
+        with self._lock:
+            self.tokens = min(float(self.minimum), self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Расходует единицу бюджета на повтор; False, если бюджет исчерпан."""
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    """Автомат отключения запросов к недоступному API."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(
+        self,
+        threshold: int = BREAKER_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Инициализация.
+
+        :param threshold: Число неудачных попыток подряд, после которого автомат открывается (0 - не открывается).
+        :param reset_timeout: Время в секундах, на которое запросы приостанавливаются.
+        :param clock: Источник времени.
+        """
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        """Секунды до пробной попытки."""
+        return max(0.0, self.opened_at + self.reset_timeout - self.clock())
+
+    def allow(self) -> bool:
+        """Можно ли выполнить попытку. В полуоткрытом состоянии разрешается одна пробная попытка."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and self.remaining() <= 0:
+                self.state = self.HALF_OPEN
+                self._trial = threading.get_ident()
+                return True
+            return False
+
+    def success(self):
+        """Учитывает успешную попытку: автомат закрывается."""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def failure(self):
+        """Учитывает неудачную попытку: после threshold подряд или неудачной пробной попытки автомат открывается."""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (self.threshold and self.failures >= self.threshold):
+                if self.state != self.OPEN:
+                    METRICS.breaker_opened += 1
+                self.state = self.OPEN
+                self.opened_at = self.clock()
+
+    def abort(self):
+        """Учитывает попытку, прерванную без ответа API: пробная попытка потока снимается, автомат снова открыт."""
+        with self._lock:
+            if self.state == self.HALF_OPEN and self._trial == threading.get_ident():
+                self.state = self.OPEN
+
+
+# Счётчики и бюджет повторов, общие для процесса.
+METRICS = RetryMetrics()
+BUDGET = RetryBudget()
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(endpoint_url: str) -> CircuitBreaker:
+    """Автомат отключения адреса API, общий для клиентов процесса."""
+    with _breakers_lock:
+        if endpoint_url not in _breakers:
+            _breakers[endpoint_url] = CircuitBreaker()
+        return _breakers[endpoint_url]
+
+
+class RetryPolicy:
+    """Повторы запросов клиента к одному адресу API."""
+
+    sleep = staticmethod(time.sleep)
+
+    def __init__(
+        self,
+        endpoint_url: str,
+        max_retries: int = MAX_RETRIES,
+        backoff_factor: float = BACKOFF_FACTOR,
+        idempotent_posts: Iterable[str] = (),
+        logger: Optional[logging.Logger] = None,
+        budget: Optional[RetryBudget] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        max_backoff: float = RETRY_MAX_BACKOFF,
+        retry_after_max: float = RETRY_AFTER_MAX,
+    ):
+        """Инициализация.
+
+        :param endpoint_url: Базовый URL API.
+        :param max_retries: Максимальное количество повторов запроса.
+        :param backoff_factor: Начальная задержка между попытками в секундах; удваивается с каждой попыткой.
+        :param idempotent_posts: Шаблоны маршрутов POST-запросов, которые можно повторять (см. route_pattern).
+        :param logger: Журнал для отладочного вывода.
+        :param budget: Бюджет повторов; по умолчанию общий для процесса.
+        :param breaker: Автомат отключения; по умолчанию общий для адреса API.
+        :param max_backoff: Наибольшая задержка между попытками без Retry-After.
+        :param retry_after_max: Наибольшее значение Retry-After, при котором запрос повторяется.
+        """
+        self.endpoint_url = endpoint_url
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.idempotent_posts = tuple(idempotent_posts)
+        self._patterns = [route_pattern(route) for route in self.idempotent_posts]
+        self.logger = logger or logging.getLogger(__name__)
+        self.budget = budget if budget is not None else BUDGET
+        self.breaker = breaker if breaker is not None else breaker_for(endpoint_url)
+        self.max_backoff = max_backoff
+        self.retry_after_max = retry_after_max
+
+    def __getstate__(self):
+        """Состояние для копирования: общие бюджет и автомат не копируются."""
+        state = self.__dict__.copy()
+        state['budget'] = None if self.budget is BUDGET else self.budget
+        state['breaker'] = None if self.breaker is _breakers.get(self.endpoint_url) else self.breaker
+        return state
+
+    def __setstate__(self, state):
+        """Восстановление с общими бюджетом и автоматом процесса."""
+        self.__dict__.update(state)
+        if self.budget is None:
+            self.budget = BUDGET
+        if self.breaker is None:
+            self.breaker = breaker_for(self.endpoint_url)
+
+    def idempotency(self, method: str, path: str) -> str:
+        """Класс идемпотентности запроса."""
+        if method.upper() in IDEMPOTENT_METHODS or any(pattern.fullmatch(path) for pattern in self._patterns):
+            return IDEMPOTENT
+        return NON_IDEMPOTENT
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** attempt))
+
+    def _delay(self, attempt: int, response: Optional[requests.Response]) -> Optional[float]:
+        """Задержка перед повтором или None, если сервер просит ждать слишком долго."""
+        after = retry_after(response) if response is not None else None
+        if after is None:
+            return self._backoff(attempt)
+        if after > self.retry_after_max:
+            return None
+        METRICS.retry_after += 1
+        return after
+
+    def send(self, method: str, path: str, request: Callable[[], requests.Response], headers: dict) -> requests.Response:
+        """Выполняет запрос с повторами.
+
+        :param method: HTTP метод запроса.
+        :param path: Путь запроса относительно базового URL.
+        :param request: Функция, отправляющая запрос с заголовками headers.
+        :param headers: Заголовки запроса; для неидемпотентных запросов добавляется Idempotency-Key.
+        :return: Ответ последней попытки.
+        :raises CircuitOpenError: Автомат отключения открыт.
+        """
+        idempotent = self.idempotency(method, path) == IDEMPOTENT
+        if not idempotent:
+            headers.setdefault(IDEMPOTENCY_HEADER, str(uuid4()))
+        self.budget.deposit()
+        METRICS.requests += 1
+
+        attempt = 0
+        rejected = False
+        try:
+            while True:
+                if not self.breaker.allow():
+                    METRICS.fast_failures += 1
+                    rejected = True
+                    raise CircuitOpenError(
+                        f'API {self.endpoint_url} недоступно: запросы приостановлены на {self.breaker.remaining():.0f} с '
+                        f'после {self.breaker.failures} неудачных попыток подряд',
+                    )
+
+                try:
+                    response = request()
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as error:
+                    self.breaker.failure()
+                    sent = not (isinstance(error, requests.exceptions.ConnectionError) and not_sent(error))
+                    if (sent and not idempotent) or not self._retry(method, path, attempt, None, error):
+                        raise
+                except BaseException:
+                    self.breaker.abort()
+                    raise
+                else:
+                    if response.status_code in FAILURE_STATUSES:
+                        self.breaker.failure()
+                    else:
+                        self.breaker.success()
+                    statuses = RETRY_STATUSES if idempotent else REJECTED_STATUSES
+                    if response.status_code not in statuses or not self._retry(method, path, attempt, response, response.status_code):
+                        return response
+                    response.close()
+                attempt += 1
+        finally:
+            if attempt or rejected:
+                self.logger.debug(stats())
+
+    def _retry(self, method: str, path: str, attempt: int, response: Optional[requests.Response], reason) -> bool:
+        """Ожидает перед повтором; False, если повторы исчерпаны или автомат отключения открылся."""
+        if attempt >= self.max_retries or self.breaker.state != CircuitBreaker.CLOSED:
+            return False
+        delay = self._delay(attempt, response)
+        if delay is None:
+            return False
+        if not self.budget.withdraw():
+            METRICS.budget_exhausted += 1
+            return False
+        METRICS.retries += 1
+        METRICS.slept += delay
+        self.logger.debug(f'Повтор {method} {path} ({attempt + 1}/{self.max_retries}) через {delay:.1f} с: {reason}')
+        self.sleep(delay)
+        return True
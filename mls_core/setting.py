@@ -1,8 +1,62 @@
 """Общая настройка api-клиентов."""
 import os
 
+from mls.utils.settings import PROFILE_DIR
+
 MAX_RETRIES: int = int(os.getenv('MLS_MAX_RETRIES', 5))
-BACKOFF_FACTOR: float = float(os.getenv('MLS_BACKOFF_FACTOR', 3.0))
+BACKOFF_FACTOR: float = float(os.getenv('MLS_BACKOFF_FACTOR', 0.5))
 CONNECT_TIMEOUT: int = int(os.getenv('MLS_MAX_RETRIES', 10))
 READ_TIMEOUT: int = int(os.getenv('MLS_READ_TIMEOUT', 10 * 60))
 SSL_VERIFY: bool = os.getenv('MLS_SSL_VERIFY', 'true') in ('t', 'true', 'True')
+
+# Повторы запросов (mls_core.retry): наибольшая задержка между попытками и наибольшее
+# значение Retry-After, которое клиент готов ждать (в секундах).
+RETRY_MAX_BACKOFF: float = float(os.getenv('MLS_RETRY_MAX_BACKOFF', 10))
+RETRY_AFTER_MAX: float = float(os.getenv('MLS_RETRY_AFTER_MAX', 30))
+# Бюджет повторов процесса: доля повторов от числа запросов и запас повторов.
+RETRY_BUDGET_RATIO: float = float(os.getenv('MLS_RETRY_BUDGET_RATIO', 0.2))
+RETRY_BUDGET_MIN: int = int(os.getenv('MLS_RETRY_BUDGET_MIN', 10))
+# Автомат отключения: число неудачных попыток подряд, после которого запросы к API
+# приостанавливаются, и время приостановки (в секундах).
+BREAKER_THRESHOLD: int = int(os.getenv('MLS_BREAKER_THRESHOLD', 5))
+BREAKER_RESET_TIMEOUT: float = float(os.getenv('MLS_BREAKER_RESET_TIMEOUT', 30))
+
+# Ограничение частоты запросов (mls_core.ratelimit), например "read=20,write=5:10,logs=2";
+# пусто - без ограничения. Значение rate_limit в профиле имеет приоритет. Состояние корзин
+# хранится в каталоге RATE_LIMIT_DIR и делится между процессами, если RATE_LIMIT_SHARED.
+RATE_LIMIT: str = os.getenv('MLS_RATE_LIMIT', '')
+RATE_LIMIT_DIR: str = os.path.join(PROFILE_DIR, 'ratelimit')
+RATE_LIMIT_SHARED: bool = os.getenv('MLS_RATE_LIMIT_SHARED', 'true') in ('t', 'true', 'True')
+
+# Кэш токенов доступа: включение, каталог хранения и время жизни токена,
+# если service_auth не сообщил срок действия (в секундах).
+TOKEN_CACHE: bool = os.getenv('MLS_TOKEN_CACHE', 'true') in ('t', 'true', 'True')
+TOKEN_CACHE_DIR: str = os.path.join(PROFILE_DIR, 'tokens')
+TOKEN_TTL: int = int(os.getenv('MLS_TOKEN_TTL', 55 * 60))
+TOKEN_EXPIRY_MARGIN: int = int(os.getenv('MLS_TOKEN_EXPIRY_MARGIN', 60))
+
+# Фоновый процесс mls agent: пересылка запросов через unix-сокет, если агент запущен,
+# и время простоя (в секундах), после которого агент завершает работу.
+AGENT: bool = os.getenv('MLS_AGENT', 'true') in ('t', 'true', 'True')
+AGENT_SOCKET: str = os.getenv('MLS_AGENT_SOCKET', os.path.join(PROFILE_DIR, 'agent.sock'))
+AGENT_IDLE_TIMEOUT: int = int(os.getenv('MLS_AGENT_IDLE_TIMEOUT', 60 * 60))
+
+# Асинхронные клиенты: максимальное число одновременно выполняемых запросов.
+ASYNC_MAX_CONCURRENCY: int = int(os.getenv('MLS_ASYNC_MAX_CONCURRENCY', 16))
+
+# Размер части потока логов в байтах: больше - меньше накладных расходов, меньше - быстрее
+# появляются строки медленно пишущей задачи.
+LOG_CHUNK_SIZE: int = int(os.getenv('MLS_LOG_CHUNK_SIZE', 16 * 1024))
+
+# Слежение за логами задачи: число последних строк, запрашиваемых при переподключении
+# (по ним же пропускаются уже выведенные строки), и задержки переподключения (в секундах).
+LOG_FOLLOW_WINDOW: int = int(os.getenv('MLS_LOG_FOLLOW_WINDOW', 1000))
+LOG_RECONNECT_BACKOFF: float = float(os.getenv('MLS_LOG_RECONNECT_BACKOFF', 0.5))
+LOG_RECONNECT_MAX_BACKOFF: float = float(os.getenv('MLS_LOG_RECONNECT_MAX_BACKOFF', 30))
+
+# Одновременное слежение за логами нескольких задач: число строк,
+# накапливаемых для одного источника, пока вывод занят строками других.
+LOG_SOURCE_BUFFER: int = int(os.getenv('MLS_LOG_SOURCE_BUFFER', 256))
+
+# Постраничная загрузка списка задач: размер страницы, если он не указан явно.
+JOB_PAGE_SIZE: int = int(os.getenv('MLS_JOB_PAGE_SIZE', 500))
@@ -0,0 +1,103 @@
+"""Модуль кэша токенов доступа.
+
+Хранит полученные от service_auth токены на диске, чтобы последовательные
+вызовы mls не выполняли авторизацию каждый раз.
+
+Токен привязан к профилю, адресу API, воркспейсу и идентификатору клиента.
+Содержимое файла шифруется функциями mls.utils.openssl, паролем служит
+секрет клиента: прочитать токен может только владелец тех же учётных данных.
+"""
+import hashlib
+import json
+import os
+import time
+from typing import Optional
+
+from .setting import TOKEN_CACHE_DIR
+from .setting import TOKEN_EXPIRY_MARGIN
+from .setting import TOKEN_TTL
+from mls.utils.execption import DecryptionError
+from mls.utils.execption import EncryptionError
+from mls.utils.openssl import decrypt
+from mls.utils.openssl import encrypt
+
+
+class TokenCache:
+    """Файловый кэш токена доступа для одного набора учётных данных.
+
+    Счётчики hits и misses общие для всех экземпляров процесса и
+    выводятся клиентом в режиме --debug.
+    """
+
+    hits = 0
+    misses = 0
+
+    def __init__(
+        self,
+        profile: str,
+        endpoint_url: str,
+        workspace_id: str,
+        client_id: str,
+        client_secret: str,
+        directory: Optional[str] = None,
+    ):
+        """Инициализация кэша.
+
+        :param profile: Имя профиля пользователя.
+        :param endpoint_url: Базовый URL API.
+        :param workspace_id: Идентификатор воркспейса.
+        :param client_id: Идентификатор клиента.
+        :param client_secret: Секрет клиента, используется как пароль шифрования.
+        :param directory: Каталог хранения, по умолчанию ~/.mls/tokens.
+        """
+        key = '|'.join(str(part) for part in (profile, endpoint_url, workspace_id, client_id))
+        self._password = client_secret
+        self._directory = directory or TOKEN_CACHE_DIR
+        self.path = os.path.join(self._directory, hashlib.sha256(key.encode('utf-8')).hexdigest())
+
+    def load(self) -> Optional[str]:
+        """Возвращает действующий токен из кэша или None."""
+        try:
+            with open(self.path, 'rb') as file:
+                entry = json.loads(decrypt(file.read(), self._password))
+            token, expires_at = entry['token'], float(entry['expires_at'])
+        except (OSError, DecryptionError, ValueError, KeyError, TypeError):
+            token, expires_at = None, 0.0
+
+        if not token or expires_at - TOKEN_EXPIRY_MARGIN <= time.time():
+            TokenCache.misses += 1
+            return None
+
+        TokenCache.hits += 1
+        return str(token)
+
+    def save(self, token: str, expires_in: Optional[float] = None):
+        """Сохраняет токен в кэш.
+
+        :param token: Токен доступа.
+        :param expires_in: Время жизни токена в секундах, если его сообщил сервер.
+        """
+        entry = {'token': token, 'expires_at': time.time() + float(expires_in or TOKEN_TTL)}
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self._directory, mode=0o700, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as file:
+                file.write(encrypt(json.dumps(entry), self._password))
+            os.replace(tmp_path, self.path)
+        except (OSError, EncryptionError):
+            # Кэш не должен ломать работу команды: при ошибке записи токен просто не сохраняется.
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def invalidate(self):
+        """Удаляет токен из кэша."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    @classmethod
+    def stats(cls) -> str:
+        """Строка со счётчиками попаданий и промахов для отладочного вывода."""
+        return f'Кэш токенов: попаданий {cls.hits}, промахов {cls.misses}'
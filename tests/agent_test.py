@@ -0,0 +1,159 @@
+"""Тесты mls agent."""
+import os
+import stat
+import threading
+from configparser import ConfigParser
+
+import pytest
+import responses
+
+from mls.manager.agent.server import AgentServer
+from mls.manager.agent.server import ProfileStore
+from mls.manager.job.utils import read_profile
+from mls_core import TrainingJobApi
+from mls_core.agent import AgentClient
+from mls_core.exceptions import AuthorizationError
+
+ENDPOINT_URL = 'https://fake.api.com'
+
+
+@pytest.fixture
+def agent_server(agent_socket):
+    """Агент, запущенный в отдельном потоке на временном сокете."""
+    server = AgentServer(str(agent_socket), idle_timeout=0, password=None)
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def client():
+    """Клиент, передающий запросы агенту."""
+    return TrainingJobApi(
+        endpoint_url=ENDPOINT_URL,
+        client_id='fake_id',
+        client_secret='fake_secret',
+        x_workspace_id='fake_workspace',
+        x_api_key='fake_key',
+    )
+
+
+def add_auth():
+    """Мок авторизации."""
+    return responses.add(responses.POST, f'{ENDPOINT_URL}/service_auth', json={'token': {'access_token': 'ABC'}})
+
+
+def test_agent_socket_permissions(agent_server, agent_socket):
+    """Сокет агента доступен только владельцу."""
+    assert stat.S_IMODE(os.stat(agent_socket).st_mode) == 0o600
+    assert AgentClient().ping()['pid'] == os.getpid()
+
+
+def test_agent_not_running(client):
+    """Без агента запросы выполняются напрямую."""
+    assert AgentClient().ping() is None
+    assert AgentClient().get_profile('default', None) is None
+    with responses.RequestsMock() as mock:
+        mock.add(responses.POST, f'{ENDPOINT_URL}/service_auth', json={'token': {'access_token': 'ABC'}})
+        mock.add(responses.GET, f'{ENDPOINT_URL}/jobs/name', json={'status': 'running'})
+        assert client.get_job_status('name') == {'status': 'running'}
+    assert client._token == 'ABC'
+
+
+@responses.activate
+def test_agent_forwards_requests(agent_server, client):
+    """Запросы выполняются агентом, авторизация выполняется один раз на все вызовы CLI."""
+    auth = add_auth()
+    responses.add(responses.GET, f'{ENDPOINT_URL}/jobs/name', json={'status': 'running'})
+
+    assert client.get_job_status('name') == {'status': 'running'}
+    second = TrainingJobApi(
+        endpoint_url=ENDPOINT_URL, client_id='fake_id', client_secret='fake_secret', x_workspace_id='fake_workspace', x_api_key='fake_key',
+    )
+    assert second.get_job_status('name') == {'status': 'running'}
+
+    assert auth.call_count == 1
+    assert client._token is None
+    assert len(agent_server.clients) == 1
+
+
+@responses.activate
+def test_agent_forwards_http_errors(agent_server, client):
+    """Ответ с ошибкой передаётся клиенту как есть."""
+    add_auth()
+    responses.add(responses.GET, f'{ENDPOINT_URL}/jobs/name', json={'detail': 'not found'}, status=404)
+
+    assert client.get_job_status('name') == {'detail': 'not found'}
+
+
+@responses.activate
+def test_agent_forwards_exceptions(agent_server, client):
+    """Ошибка авторизации на стороне агента возбуждается в клиенте."""
+    responses.add(responses.POST, f'{ENDPOINT_URL}/service_auth', json={'detail': 'denied'}, status=403)
+
+    with pytest.raises(AuthorizationError):
+        client.get_job_status('name')
+
+
+@responses.activate
+def test_agent_streams_logs(agent_server, client):
+    """Потоковые ответы передаются частями."""
+    add_auth()
+    body = 'line\n' * 200
+    responses.add(responses.GET, f'{ENDPOINT_URL}/jobs/name/logs', body=body, stream=True)
+
+    assert ''.join(client.stream_logs('name', 'region')) == body
+
+
+def test_agent_profile(agent_server, monkeypatch):
+    """Профиль читается из памяти агента."""
+    config, credentials = ConfigParser(), ConfigParser()
+    config.read_string('[dev]\nregion = A\n')
+    credentials.read_string('[dev]\nkey_id = id\n')
+    calls = []
+
+    def load(password):
+        calls.append(password)
+        return config, credentials
+
+    monkeypatch.setattr('mls.manager.agent.server.load_saved_config', load)
+    monkeypatch.setattr('mls.manager.job.utils.load_saved_config', lambda *_: pytest.fail('профиль должен прийти от агента'))
+
+    assert read_profile('dev') == {'region': 'A', 'key_id': 'id'}
+    assert read_profile('dev') == {'region': 'A', 'key_id': 'id'}
+    assert calls == [None]
+    assert AgentClient().get_profile('unknown', None) is None
+    assert AgentClient().get_profile('dev', 'password') is None
+
+
+def test_agent_encrypted_profile_password(agent_server, monkeypatch):
+    """Зашифрованный профиль агент передаёт только процессу с тем же паролем."""
+    config, credentials = ConfigParser(), ConfigParser()
+    config.read_string('[dev]\nregion = A\n')
+    credentials.read_string('[dev]\nkey_secret = secret\n')
+    calls = []
+
+    def load(password):
+        calls.append(password)
+        return config, credentials
+
+    monkeypatch.setattr('mls.manager.agent.server.load_saved_config', load)
+    agent_server.profiles = ProfileStore('password')
+
+    assert AgentClient().get_profile('dev', 'wrong') is None
+    assert AgentClient().get_profile('dev', 'password') == {'region': 'A', 'key_secret': 'secret'}
+    assert calls == ['password']
+
+    # С неверным паролем агент профиль не передаёт: он расшифровывается локально паролем вызывающего процесса.
+    monkeypatch.setattr('mls.manager.job.utils.SECRET_PASSWORD', 'wrong')
+    monkeypatch.setattr('mls.manager.job.utils.load_saved_config', load)
+    assert read_profile('dev') == {'region': 'A', 'key_secret': 'secret'}
+    assert calls == ['password', 'wrong']
+
+
+def test_agent_stop(agent_server):
+    """Остановка агента по запросу."""
+    assert AgentClient().stop()
@@ -0,0 +1,78 @@
+"""Тесты асинхронных клиентов mls-core."""
+import asyncio
+import threading
+import time
+
+import pytest
+import responses
+
+from mls_core.aio import AsyncDTSApi
+from mls_core.aio import AsyncTrainingJobApi
+
+ENDPOINT_URL = 'https://fake.api.com'
+CREDENTIALS = dict(
+    endpoint_url=ENDPOINT_URL, client_id='fake_id', client_secret='fake_secret', x_workspace_id='fake_workspace', x_api_key='fake_key',
+)
+
+
+@responses.activate
+def test_async_shared_token():
+    """Одновременные вызовы используют один токен доступа."""
+    auth = responses.post(f'{ENDPOINT_URL}/service_auth', json={'token': {'access_token': 'ABC'}})
+    for index in range(20):
+        responses.get(f'{ENDPOINT_URL}/jobs/job-{index}', json={'name': f'job-{index}'})
+
+    async def main():
+        async with AsyncTrainingJobApi(**CREDENTIALS, max_concurrency=8) as api:
+            return await asyncio.gather(*(api.get_job_status(f'job-{index}') for index in range(20)))
+
+    result = asyncio.run(main())
+    assert [item['name'] for item in result] == [f'job-{index}' for index in range(20)]
+    assert auth.call_count == 1
+
+
+def test_async_bounded_concurrency(monkeypatch):
+    """Число одновременных запросов не превышает max_concurrency."""
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def get_job_status(_, name):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        return name
+
+    monkeypatch.setattr('mls_core.client.TrainingJobApi.get_job_status', get_job_status)
+
+    async def main():
+        async with AsyncTrainingJobApi(**CREDENTIALS, max_concurrency=3) as api:
+            return await asyncio.gather(*(api.get_job_status(str(index)) for index in range(12)))
+
+    assert asyncio.run(main()) == [str(index) for index in range(12)]
+    assert peak[0] == 3
+
+
+@responses.activate
+def test_async_stream_logs():
+    """Потоковое чтение логов через асинхронный генератор."""
+    responses.post(f'{ENDPOINT_URL}/service_auth', json={'token': {'access_token': 'ABC'}})
+    body = 'line\n' * 100
+    responses.get(f'{ENDPOINT_URL}/jobs/name/logs', body=body, stream=True)
+
+    async def main():
+        async with AsyncTrainingJobApi(**CREDENTIALS) as api:
+            return ''.join([chunk async for chunk in api.stream_logs('name', 'region')])
+
+    assert asyncio.run(main()) == body
+
+
+def test_async_static_and_attributes():
+    """Статические методы и атрибуты доступны без await."""
+    api = AsyncDTSApi(**CREDENTIALS)
+    assert api.are_ids_valid(['00000000-0000-0000-0000-000000000000'])
+    assert api.USER_OUTPUT_PREFERENCE is None
+    with pytest.raises(AttributeError):
+        api._session  # pylint: disable=pointless-statement
+    asyncio.run(api.aclose())
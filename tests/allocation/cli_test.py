@@ -42,6 +42,18 @@ class TestAllocationCli:
         assert result.exit_code == 0
         assert result.output == expected
 
+    @pytest.mark.usefixtures('test_profile', 'mock_auth')
+    @responses.activate
+    def test_list_csv_columns(self, runner):
+        """Тест команды списка аллокаций с выводом выбранных полей в формате CSV."""
+        responses.get(self.list_url, json=ALLOC_LIST)
+        expected = 'id,name\n' + ''.join(f'{item["id"]},{item["name"]}\n' for item in ALLOC_LIST)
+
+        result = runner.invoke(cli, ['allocation', 'list', '-O', 'csv', '--columns', 'id,name'])
+
+        assert result.exit_code == 0
+        assert result.output == expected
+
     @pytest.mark.usefixtures('test_profile', 'mock_auth')
     @pytest.mark.parametrize('data', [INST_TYPES, []])
     @responses.activate
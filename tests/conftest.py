@@ -12,6 +12,13 @@ import pytest
 import responses
 from click.testing import CliRunner
 
+from mls_core.retry import RetryBudget
+from mls_core.retry import RetryMetrics
+from mls_core.retry import RetryPolicy
+
+# Адрес API профиля команд mls job (см. job_profile).
+ENDPOINT_URL = 'https://fake.api.com'
+
 
 @pytest.fixture
 def runner():
@@ -46,6 +53,28 @@ def mock_auth():
     yield
 
 
+@pytest.fixture
+def job_profile(monkeypatch):
+    """Подмена профиля команд mls job на тестовый; формат вывода можно изменить в тесте."""
+    profile = {
+        'key_id': 'id',
+        'key_secret': 'secret',
+        'x_workspace_id': 'workspace',
+        'x_api_key': 'key',
+        'output': 'json',
+        'region': 'region',
+        'endpoint_url': ENDPOINT_URL,
+    }
+    monkeypatch.setattr('mls.manager.job.utils.read_profile', lambda _: profile)
+    return profile
+
+
+@pytest.fixture
+def job_auth(job_profile):
+    """Мок авторизации клиента команд mls job; возвращает зарегистрированный ответ service_auth."""
+    return responses.post(f'{job_profile["endpoint_url"]}/service_auth', json={'token': {'access_token': 'ABC'}})
+
+
 @pytest.fixture
 def mock_api_client():
     """Мок апи клиента."""
@@ -53,3 +82,45 @@ def mock_api_client():
 
     with patch('mls.utils.client.create_client_instance', return_value=mock_instance):
         yield mock_instance
+
+
+@pytest.fixture(autouse=True)
+def token_cache_dir(tmp_path, monkeypatch):
+    """Перенос кэша токенов во временный каталог, чтобы тесты не затрагивали ~/.mls."""
+    directory = tmp_path / 'tokens'
+    monkeypatch.setattr('mls_core.token_cache.TOKEN_CACHE_DIR', str(directory))
+    return directory
+
+
+@pytest.fixture(autouse=True)
+def agent_socket(tmp_path, monkeypatch):
+    """Перенос сокета mls agent во временный каталог, чтобы тесты не обращались к запущенному агенту."""
+    path = tmp_path / 'agent.sock'
+    monkeypatch.setattr('mls_core.agent.AGENT_SOCKET', str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def log_archive_dir(tmp_path, monkeypatch):
+    """Перенос архива логов во временный каталог, чтобы тесты не затрагивали ~/.mls."""
+    path = tmp_path / 'logs'
+    monkeypatch.setattr('mls.manager.job.archive.LOG_ARCHIVE_DIR', str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def retry_state(monkeypatch):
+    """Отдельные счётчики, бюджет повторов и автоматы отключения для каждого теста; повторы без ожидания."""
+    monkeypatch.setattr('mls_core.retry.METRICS', RetryMetrics())
+    monkeypatch.setattr('mls_core.retry.BUDGET', RetryBudget())
+    monkeypatch.setattr('mls_core.retry._breakers', {})
+    monkeypatch.setattr(RetryPolicy, 'sleep', staticmethod(lambda _: None))
+
+
+@pytest.fixture(autouse=True)
+def rate_limit_dir(tmp_path, monkeypatch):
+    """Перенос состояния ограничения частоты запросов во временный каталог и отдельные корзины для каждого теста."""
+    path = tmp_path / 'ratelimit'
+    monkeypatch.setattr('mls_core.ratelimit.RATE_LIMIT_DIR', str(path))
+    monkeypatch.setattr('mls_core.ratelimit._buckets', {})
+    return path
@@ -1,11 +1,15 @@
 """Тесты mls-core."""
+import copy
 from unittest.mock import patch
 
 import pytest
 import responses
 from requests import ReadTimeout
+from requests.exceptions import ChunkedEncodingError
 
 from mls_core import TrainingJobApi
+from mls_core.exceptions import AuthorizationError
+from mls_core.exceptions import DataStreamingFailure
 from mls_core.exceptions import InvalidAuthorizationToken
 
 
@@ -43,6 +47,18 @@ def test_training_api(mock_request, api_client):
     assert api_client.run_job({}) == {'status': 'success'}
 
 
+@responses.activate
+def test_parsed_responses(api_client):
+    """Клиент возвращает разобранные ответы независимо от формата вывода CLI, в том числе тело ответа с ошибкой."""
+    api_client.USER_OUTPUT_PREFERENCE = 'json'
+    responses.get(f'{api_client.ENDPOINT_URL}/jobs/ok', json={'status': 'Running'})
+    responses.get(f'{api_client.ENDPOINT_URL}/jobs/missing', json={'detail': 'not found'}, status=404)
+    responses.get(f'{api_client.ENDPOINT_URL}/jobs/broken', body='Bad Request', status=400)
+    assert api_client.get_job_status('ok') == {'status': 'Running'}
+    assert api_client.get_job_status('missing') == {'detail': 'not found'}
+    assert api_client.get_job_status('broken') == 'Bad Request'
+
+
 @responses.activate
 def test_stream_data_with_success(monkeypatch, api_client):
     """Проверка работы получения логов в потоковом режиме."""
@@ -71,6 +87,28 @@ def test_stream_data_with_timeout(monkeypatch, api_client):
     assert ('Connection timed out',) == err.value.args
 
 
+@responses.activate
+def test_stream_chunked_error_reopens_request(monkeypatch, api_client):
+    """Обрыв до получения данных повторяет запрос, обрыв после - не возвращает поток с начала."""
+    monkeypatch.setattr('mls_core.client.time.sleep', lambda _: None)
+    chunks = [ChunkedEncodingError('reset'), ['line'], ['li', ChunkedEncodingError('reset')]]
+
+    def iter_content(*_, **__):
+        for chunk in chunks.pop(0) if isinstance(chunks[0], list) else [chunks.pop(0)]:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+    monkeypatch.setattr('requests.Response.iter_content', iter_content)
+    responses.add(responses.GET, f'{api_client.ENDPOINT_URL}/jobs/name/logs', body='')
+
+    assert ''.join(api_client.stream_logs('name', 'region')) == 'line'
+    assert len(responses.calls) == 2
+    with pytest.raises(DataStreamingFailure):
+        list(api_client.stream_logs('name', 'region'))
+    assert len(responses.calls) == 3
+
+
 @responses.activate
 def test_stream_without_data(monkeypatch, api_client):
     """Проверка работы получения логов с ошибкой от api."""
@@ -90,11 +128,91 @@ def test_empty_auth_token(monkeypatch, api_client):
 
     responses.add(responses.POST, f'{endpoint_url}/{auth_endpoint}', json={'token': {'access_token': ''}})
 
+    client = TrainingJobApi(
+        endpoint_url=endpoint_url,
+        client_id='fake_id',
+        client_secret='fake_secret',
+        x_workspace_id='fake_workspace',
+        x_api_key='fake_key',
+    )
     with pytest.raises(InvalidAuthorizationToken):
-        TrainingJobApi(
-            endpoint_url=endpoint_url,
-            client_id='fake_id',
-            client_secret='fake_secret',
-            x_workspace_id='fake_workspace',
-            x_api_key='fake_key',
-        )
+        client.get_job_status('name')
+
+
+@responses.activate
+def test_auth_error_not_swallowed():
+    """Отказ в авторизации не подменяется телом ответа метода API."""
+    endpoint_url = 'https://fake.api.com'
+    responses.post(f'{endpoint_url}/{TrainingJobApi.AUTH_ENDPOINT}', json={'detail': 'denied'}, status=403)
+
+    client = TrainingJobApi(
+        endpoint_url=endpoint_url, client_id='fake_id', client_secret='fake_secret', x_workspace_id='fake_workspace', x_api_key='fake_key',
+    )
+    with pytest.raises(AuthorizationError):
+        client.get_job_status('name')
+
+
+@responses.activate
+def test_lazy_auth():
+    """Авторизация не выполняется до первого запроса к API."""
+    endpoint_url = 'https://fake.api.com'
+    auth = responses.post(f'{endpoint_url}/{TrainingJobApi.AUTH_ENDPOINT}', json={'token': {'access_token': 'token'}})
+    responses.get(f'{endpoint_url}/jobs/name', json={'status': 'Running'})
+
+    client = TrainingJobApi(
+        endpoint_url=endpoint_url,
+        client_id='fake_id',
+        client_secret='fake_secret',
+        x_workspace_id='fake_workspace',
+        x_api_key='fake_key',
+    )
+    assert auth.call_count == 0
+
+    client.get_job_status('name')
+    client.get_job_status('name')
+    assert auth.call_count == 1
+
+
+@responses.activate
+def test_reauth_once_on_unauthorized():
+    """Ответ 401 приводит ровно к одной повторной авторизации и повтору запроса."""
+    endpoint_url = 'https://fake.api.com'
+    auth = responses.post(f'{endpoint_url}/{TrainingJobApi.AUTH_ENDPOINT}', json={'token': {'access_token': 'token'}})
+    jobs = responses.get(f'{endpoint_url}/jobs/name', status=401, json={'detail': 'expired'})
+
+    client = TrainingJobApi(
+        endpoint_url=endpoint_url,
+        client_id='fake_id',
+        client_secret='fake_secret',
+        x_workspace_id='fake_workspace',
+        x_api_key='fake_key',
+    )
+
+    assert client.get_job_status('name') == {'detail': 'expired'}
+    assert auth.call_count == 2
+    assert jobs.call_count == 2
+
+
+@responses.activate
+def test_stream_reauth_on_unauthorized():
+    """Поток логов переоткрывается с новым токеном после ответа 401."""
+    endpoint_url = 'https://fake.api.com'
+    responses.post(f'{endpoint_url}/{TrainingJobApi.AUTH_ENDPOINT}', json={'token': {'access_token': 'token'}})
+    responses.get(f'{endpoint_url}/jobs/name/logs', status=401)
+    responses.get(f'{endpoint_url}/jobs/name/logs', body='line')
+
+    client = TrainingJobApi(
+        endpoint_url=endpoint_url,
+        client_id='fake_id',
+        client_secret='fake_secret',
+        x_workspace_id='fake_workspace',
+        x_api_key='fake_key',
+    )
+
+    assert ''.join(client.stream_logs('name', 'region')) == 'line'
+
+
+def test_client_deepcopy(api_client):
+    """Клиент копируется вместе с сессией, блокировка создаётся заново."""
+    copy_client = copy.deepcopy(api_client)
+    assert copy_client._auth_lock is not api_client._auth_lock
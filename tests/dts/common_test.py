@@ -36,7 +36,7 @@ class TestValidateConnector:
         connector_id = str(uuid4())
         typ = 's3custom'
 
-        mock_api.conn_list.return_value = json.dumps([{'connector_id': connector_id}])
+        mock_api.conn_list.return_value = [{'connector_id': connector_id}]
 
         result = validate_connector_exists(mock_api, connector_id, typ)
 
@@ -48,7 +48,7 @@ class TestValidateConnector:
     def test_validate_connector_exists_not_found(self):
         """Коннектор не найден."""
         mock_api = Mock()
-        mock_api.conn_list.return_value = json.dumps([])
+        mock_api.conn_list.return_value = []
 
         result = validate_connector_exists(mock_api, uuid4(), 'mssql')
 
@@ -59,7 +59,7 @@ class TestValidateConnector:
         typ = 'postgresql'
 
         mock_api = Mock()
-        mock_api.conn_list.return_value = json.dumps([{'connector_id': str(uuid4())}])
+        mock_api.conn_list.return_value = [{'connector_id': str(uuid4())}]
 
         result = validate_connector_exists(mock_api, uuid4(), typ)
 
@@ -367,26 +367,20 @@ class TestParamsCollector:
 
 
 class TestProcessData:
-    """Класс тестов на функцию обработки JSON данных."""
+    """Класс тестов на функцию вывода списка в формате JSON."""
 
-    TEST_DATA = json.dumps([{'connector_id': i} for i in range(1, 21)])
+    TEST_DATA = [{'connector_id': i} for i in range(1, 21)]
 
     def test_process_data_json_with_pagination(self, mock_api_dts):
-        """Обработка JSON при переданных параметрах пагинации."""
-        with (
-            patch('click.echo') as mock_echo,
-            patch('mls.manager.dts.utils.paginate') as mock_paginate,
-        ):
-            mock_paginate.return_value = 'paginated_data'
-
+        """Вывод страницы списка при переданных параметрах пагинации."""
+        with patch('mls.manager.dts.utils.paginate') as mock_paginate:
             process_json(data=self.TEST_DATA, page_number=2, page_size=5)
 
             mock_paginate.assert_called_once()
+            assert mock_paginate.call_args[1]['data'] == self.TEST_DATA
             assert mock_paginate.call_args[1]['page'] == 2
             assert mock_paginate.call_args[1]['per_page'] == 5
 
-            mock_echo.assert_called_once_with('paginated_data')
-
     @pytest.mark.parametrize('page_number, page_size', [(1, 10), (2, 10)])
     def test_process_data_json_without_pagination(self, page_number, page_size):
         """Обработка JSON при не переданных параметрах пагинации."""
@@ -400,29 +394,26 @@ class TestProcessData:
             )
             mock_echo.assert_called()
 
-    def test_process_data_invalid_json(self):
-        """Невалидный JSON."""
-        invalid_json = '{invalid_json}'
-
+    def test_process_data_where(self):
+        """Список сериализуется один раз после отбора --where."""
         with patch('click.echo') as mock_echo:
-            with pytest.raises(json.JSONDecodeError):
-                process_json(data=invalid_json, page_number=1, page_size=10)
+            process_json(data=self.TEST_DATA, page_number=None, page_size=None, where=lambda item: item['connector_id'] > 18)
 
-            mock_echo.assert_not_called()
+            mock_echo.assert_called_once()
+            assert json.loads(click.unstyle(mock_echo.call_args[0][0])) == self.TEST_DATA[18:]
 
-    def test_process_data_empty_data(self):
-        """Обработка пустых данных."""
+    @pytest.mark.parametrize('data', ['', 'Internal Server Error', {'detail': 'not found'}])
+    def test_process_data_not_list(self, data):
+        """Ответ, не являющийся списком (например, ошибка API), выводится без пагинации."""
         with (
             patch('click.echo') as mock_echo,
-            patch('mls.utils.style.success_format') as mock_format,
-            pytest.raises(json.decoder.JSONDecodeError),
+            patch('mls.manager.dts.utils.paginate') as mock_paginate,
         ):
-            mock_format.return_value = 'formatted_empty'
-
-            process_json(data='', page_number=1, page_size=1)
+            process_json(data=data, page_number=1, page_size=1)
 
-            mock_format.assert_called_once_with('')
-            mock_echo.assert_called_once_with('formatted_empty')
+            mock_paginate.assert_not_called()
+            expected = json.dumps(data, indent=4, ensure_ascii=False) if isinstance(data, dict) else data
+            assert click.unstyle(mock_echo.call_args[0][0]) == expected
 
 
 class TestValidatePositive:
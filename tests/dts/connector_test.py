@@ -14,6 +14,13 @@ class TestConnector:
         result = runner.invoke(cli, ['connector', 'list', '-O', out])
         assert result.exit_code == 0
 
+    @pytest.mark.parametrize('where, found', [('system=true and source-type=nfsprivate', True), ('status!=success', False)])
+    def test_connector_list_where(self, runner, mock_api_dts, where, found):
+        """Отбор коннекторов выражением --where."""
+        result = runner.invoke(cli, ['connector', 'list', '-O', 'text', '--where', where])
+        assert result.exit_code == 0
+        assert ('test_name' in result.output) is found
+
     def test_connector_create(self, runner, mock_api_dts):
         """Проверка метода создания коннектора."""
         result = runner.invoke(
@@ -1,4 +1,8 @@
 """Тестовые сценарии для проверки работы команд transfer."""
+import csv
+import io
+import json
+
 import pytest
 
 from mls.cli import cli
@@ -113,6 +117,32 @@ class TestTransfer:
         assert '40e36b8d-cb6c-4726-8e8c-2b1d51285934' in result.output
         assert 'f6c75f1b-2559-4eed-a982-5acb6c4439ce' in result.output
 
+    @pytest.mark.parametrize('output', ['json', 'text'])
+    def test_transfer_list_where(self, runner, mock_api_dts, output):
+        """Отбор правил переноса выражением --where."""
+        result = runner.invoke(cli, ['transfer', 'list', '-O', output, '--where', 'crontab.period>=2 and active=true'])
+        assert result.exit_code == 0
+        assert '40e36b8d-cb6c-4726-8e8c-2b1d51285934' not in result.output
+        assert 'f6c75f1b-2559-4eed-a982-5acb6c4439ce' in result.output
+
+    def test_transfer_list_ndjson_columns(self, runner, mock_api_dts):
+        """Вывод правил переноса в формате ndjson с проекцией полей и отбором --where."""
+        result = runner.invoke(
+            cli, ['transfer', 'list', '-O', 'ndjson', '--columns', 'transfer_id,crontab.period', '--where', 'crontab.period>=2'],
+        )
+        assert result.exit_code == 0
+        lines = [json.loads(line) for line in result.output.splitlines()]
+        assert lines and all(list(line) == ['transfer_id', 'crontab.period'] and line['crontab.period'] >= 2 for line in lines)
+        assert 'f6c75f1b-2559-4eed-a982-5acb6c4439ce' in {line['transfer_id'] for line in lines}
+
+    def test_transfer_list_csv(self, runner, mock_api_dts):
+        """Вывод правил переноса в формате csv."""
+        result = runner.invoke(cli, ['transfer', 'list', '-O', 'csv', '--columns', 'transfer_id,name'])
+        assert result.exit_code == 0
+        rows = list(csv.reader(io.StringIO(result.output)))
+        assert rows[0] == ['transfer_id', 'name']
+        assert [row[0] for row in rows[1:]] == ['40e36b8d-cb6c-4726-8e8c-2b1d51285934', 'f6c75f1b-2559-4eed-a982-5acb6c4439ce']
+
     @pytest.mark.parametrize('transfer_id', ['40e36b8d-cb6c-4726-8e8c-2b1d51285934'])
     def test_transfer_get(self, runner, mock_api_dts, transfer_id):
         """Получения информации о правиле переноса."""
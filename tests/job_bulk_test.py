@@ -0,0 +1,158 @@
+"""Тесты групповых операций kill, restart и submit."""
+import json
+
+import pytest
+import responses
+
+from .conftest import ENDPOINT_URL
+from mls.cli import cli
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_kill_single_name(runner):
+    """Одно имя без фильтров выводит ответ API как раньше."""
+    responses.delete(f'{ENDPOINT_URL}/jobs/job-1', json={'status': 'deleted'})
+
+    result = runner.invoke(cli, ['job', 'kill', 'job-1'])
+    assert result.exit_code == 0
+    assert '"status": "deleted"' in result.output
+
+
+@responses.activate
+def test_kill_many_names(runner, job_auth, tmp_path):
+    """Имена из аргументов и файла обрабатываются в одной сессии, повторы отбрасываются."""
+    for name in ('job-1', 'job-2', 'job-3'):
+        responses.delete(f'{ENDPOINT_URL}/jobs/{name}', json={'status': 'deleted'})
+    names = tmp_path / 'names.txt'
+    names.write_text('# sweep\njob-2\n\njob-3\njob-1\n')
+
+    result = runner.invoke(cli, ['job', 'kill', 'job-1', '--from_file', str(names), '--workers', '2'])
+    assert result.exit_code == 0
+    assert result.output.count('| успешно') == 3
+    assert 'Всего: 3, успешно: 3, с ошибкой: 0' in result.output
+    assert job_auth.call_count == 1
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_restart_selected_with_failures(runner):
+    """Фильтры выбирают задачи из списка; неудачный перезапуск даёт код завершения 1."""
+    responses.get(f'{ENDPOINT_URL}/jobs', json={'jobs': [
+        {'job_name': 'sweep-1'}, {'job_name': 'sweep-2'}, {'job_name': 'other'},
+    ]})
+    responses.post(
+        f'{ENDPOINT_URL}/jobs/restart', json={'status': 'restarted'},
+        match=[responses.matchers.json_params_matcher({'job_name': 'sweep-1'})],
+    )
+    responses.post(
+        f'{ENDPOINT_URL}/jobs/restart', json={'detail': 'job not found'}, status=404,
+        match=[responses.matchers.json_params_matcher({'job_name': 'sweep-2'})],
+    )
+
+    result = runner.invoke(cli, ['job', 'restart', '--status', 'Failed', '--name_pattern', 'sweep-*'])
+    assert result.exit_code == 1
+    assert 'job not found' in result.output
+    assert 'other' not in result.output
+    assert 'Всего: 2, успешно: 1, с ошибкой: 1' in result.output
+    assert 'status=Failed' in responses.calls[1].request.url
+
+
+@pytest.mark.usefixtures('job_profile')
+def test_kill_requires_names(runner):
+    """Без имён и фильтров команда завершается ошибкой использования."""
+    result = runner.invoke(cli, ['job', 'kill'])
+    assert result.exit_code != 0
+
+
+MANIFEST = '''job:
+  type: binary
+  script: python train.py --lr {lr}
+  environment:
+    image: cr.ai.cloud.ru/aicloud-base-images/py3.10-torch2.1.2:0.0.40
+  resource:
+    instance_type: a100.1gpu
+'''
+
+
+def script_matcher(script):
+    """Сопоставление запроса запуска задачи по скрипту."""
+    def match(request):
+        return json.loads(request.body)['script'] == script, ''
+    return match
+
+
+@responses.activate
+def test_submit_directory_and_multi_document(runner, job_auth, tmp_path):
+    """Манифесты каталога и документы многодокументного файла отправляются в одной сессии."""
+    submit = responses.post(f'{ENDPOINT_URL}/jobs', json={'job_name': 'lm-job', 'status': 'Pending'})
+    (tmp_path / 'a.yaml').write_text(MANIFEST.format(lr=1))
+    (tmp_path / 'b.yml').write_text(MANIFEST.format(lr=2) + '---\n' + MANIFEST.format(lr=3))
+    (tmp_path / 'notes.txt').write_text('skip')
+
+    result = runner.invoke(cli, ['job', 'submit', '--config', str(tmp_path), '--rate', '100'])
+    assert result.exit_code == 0, result.output
+    assert f'{tmp_path / "b.yml"}#2' in result.output
+    assert 'Всего: 3, успешно: 3, с ошибкой: 0' in result.output
+    assert submit.call_count == 3
+    assert job_auth.call_count == 1
+    scripts = sorted(json.loads(item.request.body)['script'] for item in responses.calls if item.request.url.endswith('/jobs'))
+    assert scripts == [f'python train.py --lr {lr}' for lr in (1, 2, 3)]
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_submit_validates_before_sending(runner, tmp_path):
+    """Ошибка в одном манифесте останавливает отправку всех задач."""
+    submit = responses.post(f'{ENDPOINT_URL}/jobs', json={'job_name': 'lm-job'})
+    valid, invalid = tmp_path / 'valid.yaml', tmp_path / 'invalid.yaml'
+    valid.write_text(MANIFEST.format(lr=1))
+    invalid.write_text('job:\n  type: binary\n')
+
+    result = runner.invoke(cli, ['job', 'submit', '-c', str(valid), '-c', str(invalid)])
+    assert result.exit_code != 0
+    assert f'{invalid}: отсутствует опция --script' in result.output
+    assert submit.call_count == 0
+
+
+@pytest.mark.usefixtures('job_profile')
+def test_submit_rejects_duplicate_manifests(runner, tmp_path):
+    """Манифест, указанный дважды (явно или через каталог), не отправляется молча один раз."""
+    manifest = tmp_path / 'sweep.yaml'
+    manifest.write_text(MANIFEST.format(lr=1))
+
+    for args in (['-c', str(manifest), '-c', str(manifest)], ['-c', str(tmp_path), '-c', str(manifest)]):
+        result = runner.invoke(cli, ['job', 'submit', *args])
+        assert result.exit_code != 0
+        assert f"Манифест '{manifest}' указан несколько раз" in result.output
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_submit_reports_failures(runner, tmp_path):
+    """Отказ API для одной задачи отражается в сводке и коде завершения."""
+    responses.post(f'{ENDPOINT_URL}/jobs', json={'job_name': 'lm-job-1'}, match=[script_matcher('python train.py --lr 1')])
+    responses.post(f'{ENDPOINT_URL}/jobs', json={'detail': 'quota exceeded'}, status=400, match=[script_matcher('python train.py --lr 2')])
+    manifest = tmp_path / 'sweep.yaml'
+    manifest.write_text(MANIFEST.format(lr=1) + '---\n' + MANIFEST.format(lr=2))
+
+    result = runner.invoke(cli, ['job', 'submit', '-c', str(manifest), '--parallel', '1'])
+    assert result.exit_code == 1
+    assert 'lm-job-1' in result.output
+    assert 'quota exceeded' in result.output
+    assert 'Всего: 2, успешно: 1, с ошибкой: 1' in result.output
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_submit_text_response(runner, tmp_path):
+    """Ответ не в формате JSON выводится в таблице как сообщение и не прерывает отправку остальных задач."""
+    submit = responses.post(f'{ENDPOINT_URL}/jobs', body='accepted', content_type='application/json; charset=utf-8')
+    (tmp_path / 'a.yaml').write_text(MANIFEST.format(lr=1))
+    (tmp_path / 'b.yaml').write_text(MANIFEST.format(lr=2))
+
+    result = runner.invoke(cli, ['job', 'submit', '--config', str(tmp_path)])
+    assert result.exit_code == 0, result.output
+    assert result.output.count('accepted') == 2
+    assert 'Всего: 2, успешно: 2, с ошибкой: 0' in result.output
+    assert submit.call_count == 2
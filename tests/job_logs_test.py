@@ -44,9 +44,9 @@ def mock_api_job(monkeypatch, read_profile):
         def get_job_logs(self, name: str, region: str, tail: int = 0, verbose: bool = False):
             return 'ABC'
 
-        def stream_logs(self, name, region, tail=0, verbose=False):
-            yield 'ABC'
-            yield 'PDF'
+        def stream_logs(self, name, region, tail=0, verbose=False, chunk_size=256, raw=False):
+            yield 'ABC\nP'
+            yield 'DF\n'
 
     monkeypatch.setattr('mls.manager.job.utils.read_profile', lambda x: read_profile)
     monkeypatch.setattr('mls.manager.job.utils.TrainingJobApi', lambda *a, **kw: MockTrainingJobApi)
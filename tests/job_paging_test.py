@@ -0,0 +1,95 @@
+"""Тесты постраничной загрузки списка задач."""
+import json
+
+import pytest
+import responses
+from responses import matchers
+
+from .conftest import ENDPOINT_URL
+from mls.cli import cli
+from mls.manager.job.paging import prefetch
+from mls.utils.output import json_chunks
+from mls_core import TrainingJobApi
+
+
+def add_page(offset, limit, count):
+    """Страница списка задач с count задачами, начиная с offset."""
+    jobs = [{'job_name': f'job-{offset + index}', 'status': 'Running'} for index in range(count)]
+    return responses.get(
+        f'{ENDPOINT_URL}/jobs', json={'jobs': jobs},
+        match=[matchers.query_param_matcher({'region': 'region', 'limit': str(limit), 'offset': str(offset)})],
+    )
+
+
+@pytest.fixture
+def api_job(monkeypatch):
+    """Клиент задач с тестовым адресом API."""
+    monkeypatch.setattr(TrainingJobApi, '_get_auth_token', lambda *_: 'ABC')
+    return TrainingJobApi(endpoint_url=ENDPOINT_URL, client_id='id', client_secret='secret', x_workspace_id='workspace', x_api_key='key')
+
+
+@responses.activate
+def test_iter_jobs_pages(api_job):
+    """Страницы запрашиваются до неполной страницы и не больше limit задач."""
+    add_page(0, 2, 2)
+    add_page(2, 2, 1)
+    assert [job['job_name'] for job in api_job.iter_jobs('region', None, None, None, 0, 0, page_size=2)] == ['job-0', 'job-1', 'job-2']
+
+    add_page(10, 3, 3)
+    add_page(13, 2, 2)
+    assert len(list(api_job.iter_jobs('region', None, None, None, 5, 10, page_size=3))) == 5
+
+
+@responses.activate
+def test_iter_jobs_lazy(api_job):
+    """Следующая страница не запрашивается, пока не прочитана текущая."""
+    first = add_page(0, 2, 2)
+    second = add_page(2, 2, 2)
+    jobs = api_job.iter_jobs('region', None, None, None, 0, 0, page_size=2)
+    assert next(jobs)['job_name'] == 'job-0'
+    assert next(jobs)['job_name'] == 'job-1'
+    assert (first.call_count, second.call_count) == (1, 0)
+
+
+@pytest.mark.parametrize('items', [[], [{'a': 1}], [{'имя': 'задача', 'nested': {'list': [1, 2]}}, {}, {'b': None}]])
+def test_json_chunks(items):
+    """Потоковый JSON совпадает с json.dumps(indent=4)."""
+    assert ''.join(json_chunks(items, 'jobs')) == json.dumps({'jobs': items}, indent=4, ensure_ascii=False)
+
+
+def test_prefetch():
+    """Порядок элементов сохраняется."""
+    assert list(prefetch(iter(range(5)))) == list(range(5))
+    assert not list(prefetch([]))
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_list_page_size(runner):
+    """С --page_size mls job list выводит тот же JSON, загружая задачи страницами."""
+    add_page(0, 2, 2)
+    add_page(2, 2, 1)
+
+    result = runner.invoke(cli, ['job', 'list', '--page_size', '2', '--limit', '0'])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == {'jobs': [{'job_name': f'job-{index}', 'status': 'Running'} for index in range(3)]}
+
+    add_page(0, 2, 2)
+    add_page(2, 2, 1)
+    result = runner.invoke(cli, ['job', 'table', '--page_size', '2', '--limit', '0'])
+    assert result.exit_code == 0, result.output
+    assert result.output.count('Имя задачи') == 1
+    assert [line.split('|')[1].strip() for line in result.output.splitlines()[3:-1]] == ['job-0', 'job-1', 'job-2']
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_list_page_size_error(runner):
+    """Ошибка загрузки первой страницы выводится телом ответа, без начатого документа."""
+    error = {'detail': 'Регион не найден'}
+    responses.get(f'{ENDPOINT_URL}/jobs', json=error, status=404)
+
+    for command in ('list', 'table'):
+        result = runner.invoke(cli, ['job', command, '--page_size', '2'])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output) == error
@@ -59,6 +59,8 @@ def fake_command(monkeypatch, runner, user_profile):
                 'client_secret': 'test_secret',
                 'x_workspace_id': 'test_workspace',
                 'x_api_key': 'test_x_api_key',
+                'profile': 'default',
+                'rate_limit': None,
             },
             'json',
             'test_region',
@@ -73,6 +75,8 @@ def fake_command(monkeypatch, runner, user_profile):
                 'client_secret': 'test_secret',
                 'x_workspace_id': 'test_workspace',
                 'x_api_key': 'test_x_api_key',
+                'profile': 'default',
+                'rate_limit': None,
             },
             'json',
             'SR008',
@@ -86,6 +90,8 @@ def fake_command(monkeypatch, runner, user_profile):
                 'client_secret': 'test_secret',
                 'x_workspace_id': 'test_workspace',
                 'x_api_key': 'test_x_api_key',
+                'profile': 'default',
+                'rate_limit': None,
             },
             'text',
             'test_region',
@@ -99,6 +105,8 @@ def fake_command(monkeypatch, runner, user_profile):
                 'client_secret': 'test_secret',
                 'x_workspace_id': 'test_workspace',
                 'x_api_key': 'test_x_api_key',
+                'profile': 'default',
+                'rate_limit': None,
             },
             'json',
             'test_region',
@@ -0,0 +1,127 @@
+"""Тесты mls job wait."""
+from unittest.mock import Mock
+
+import pytest
+import responses
+
+from .conftest import ENDPOINT_URL
+from mls.cli import cli
+from mls.manager.job.wait import decide
+from mls.manager.job.wait import StatusPoller
+from mls.manager.job.wait import TERMINAL_STATUSES
+
+
+@pytest.fixture(autouse=True)
+def profile(job_profile, monkeypatch):
+    """Текстовый вывод и опрос без задержек."""
+    job_profile['output'] = 'text'
+    monkeypatch.setattr('mls.manager.job.wait.time.sleep', lambda _: None)
+
+
+def add_list(*statuses):
+    """Ответ списка задач со статусами job-1, job-2, ..."""
+    jobs = [{'job_name': f'job-{index}', 'status': status} for index, status in enumerate(statuses, 1)]
+    return responses.get(f'{ENDPOINT_URL}/jobs', json={'jobs': jobs})
+
+
+def add_statuses(*statuses):
+    """Ответы статусов по имени для job-1, job-2, ..."""
+    for index, status in enumerate(statuses, 1):
+        responses.get(f'{ENDPOINT_URL}/jobs/job-{index}', json={'job_name': f'job-{index}', 'status': status})
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_wait_all_terminal(runner):
+    """Статусы нескольких задач запрашиваются по имени, без списка задач."""
+    add_statuses('Pending', 'Running')
+    add_statuses('Running', 'Completed')
+    add_statuses('Succeeded', 'Completed')
+
+    result = runner.invoke(cli, ['job', 'wait', 'job-1', 'job-2'])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == [
+        'job-1: Pending', 'job-2: Running', 'job-1: Running', 'job-2: Completed', 'job-1: Succeeded',
+    ]
+    assert [call.request.path_url for call in responses.calls[1:]] == ['/jobs/job-1', '/jobs/job-2'] * 3
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_wait_many_jobs_list(runner):
+    """Статусы многих задач опрос получает одним запросом списка."""
+    add_list('Pending', 'Running', 'Running', 'Running')
+    add_list('Completed', 'Completed', 'Failed', 'Stopped')
+
+    result = runner.invoke(cli, ['job', 'wait', 'job-1', 'job-2', 'job-3', 'job-4'])
+    assert result.exit_code == 3, result.output
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_wait_fail_fast(runner):
+    """С --fail_fast ожидание прерывается первой ошибкой, код завершения соответствует статусу."""
+    add_statuses('Running', 'Failed')
+
+    result = runner.invoke(cli, ['job', 'wait', 'job-1', 'job-2', '--fail_fast'])
+    assert result.exit_code == 1
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_wait_any_until_running(runner):
+    """С --any достаточно одной задачи в ожидаемом статусе."""
+    add_statuses('Pending', 'Running')
+
+    result = runner.invoke(cli, ['job', 'wait', 'job-1', 'job-2', '--until', 'Running', '--any'])
+    assert result.exit_code == 0
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_wait_missing_job_and_timeout(runner):
+    """Отсутствующая задача и истечение времени дают свои коды."""
+    responses.get(f'{ENDPOINT_URL}/jobs/old-job', json={'status': 'Pending'})
+    responses.get(f'{ENDPOINT_URL}/jobs/unknown', json={'detail': 'not found'}, status=404)
+
+    assert runner.invoke(cli, ['job', 'wait', 'unknown']).exit_code == 5
+    result = runner.invoke(cli, ['job', 'wait', 'old-job', '--timeout', '1'])
+    assert result.exit_code == 4
+    assert 'Истекло время ожидания: old-job' in result.output
+
+
+def test_poller_list_missing_job():
+    """Задача не из списка запрашивается по имени."""
+    api_job = Mock()
+    api_job.jobs.return_value = {'jobs': [{'job_name': 'a', 'status': 'Running'}]}
+    api_job.status.return_value = {'status': 'Pending'}
+
+    assert StatusPoller(api_job, 'region', ['a', 'b'], by_name=0).poll() == {'a': 'Running', 'b': 'Pending'}
+    api_job.status.assert_called_once_with('b')
+
+
+@pytest.mark.parametrize('statuses, wait_any, code', [
+    ({'a': 'Completed', 'b': 'Running'}, False, None),
+    ({'a': 'Completed', 'b': 'Stopped'}, False, 3),
+    ({'a': 'Completed', 'b': 'Running'}, True, 0),
+    ({'a': 'Failed', 'b': 'Completed'}, False, 1),
+])
+def test_decide_terminal(statuses, wait_any, code):
+    """Итог ожидания завершения задач."""
+    result = decide(statuses, set(TERMINAL_STATUSES), wait_any, fail_fast=False)
+    assert (result and result.code) == code
+
+
+def test_decide_unreachable():
+    """Задача завершилась, не перейдя в ожидаемый статус."""
+    assert decide({'a': 'Completed'}, {'running'}, wait_any=False, fail_fast=False).code == 6
+
+
+def test_poller_backoff():
+    """Интервал растёт вдвое с разбросом и сбрасывается при изменении статусов."""
+    poller = StatusPoller(None, 'region', [], initial=1, maximum=8)
+    delays = [poller.delay(changed=False) for _ in range(5)]
+    for delay, expected in zip(delays, (2, 4, 8, 8, 8)):
+        assert 0.75 * expected <= delay <= 1.25 * expected
+    assert 0.75 <= poller.delay(changed=True) <= 1.25
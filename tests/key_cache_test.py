@@ -0,0 +1,137 @@
+"""Тесты кэша ключа расшифровки учётных данных."""
+import pytest
+from click.testing import CliRunner
+from keyring.backends import chainer
+from keyring.backends import fail
+from keyrings.alt.file import PlaintextKeyring
+
+from mls.manager.configure.cli import configure
+from mls.utils import key_cache
+from mls.utils import openssl
+from mls.utils.common import load_saved_config
+from mls.utils.execption import DecryptionError
+from mls.utils.key_cache import decrypt_credentials
+from mls.utils.key_cache import DerivedKeyCache
+
+PASSWORD = 'secret'
+CREDENTIALS = '[default]\nkey_id = id\n'
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    """Включённый кэш с хранилищем keyring во временном каталоге вместо системного."""
+    keyring = PlaintextKeyring()
+    keyring.file_path = str(tmp_path / 'keyring.cfg')
+    monkeypatch.setattr('mls.utils.key_cache._backend', lambda: keyring)
+    monkeypatch.setattr('mls.utils.key_cache.KEYRING_CACHE', True)
+    monkeypatch.setattr('mls.manager.configure.utils.KEYRING_CACHE', True)
+    return keyring
+
+
+@pytest.fixture
+def encrypted_file(tmp_path, monkeypatch):
+    """Зашифрованный файл учётных данных."""
+    path = tmp_path / 'credentials.key'
+    path.write_bytes(openssl.encrypt(CREDENTIALS, PASSWORD))
+    monkeypatch.setattr('mls.utils.common.ENCRYPTED_CREDENTIALS_FILE', str(path))
+    monkeypatch.setattr('mls.utils.common.CREDENTIALS_FILE', str(tmp_path / 'credentials'))
+    monkeypatch.setattr('mls.manager.configure.utils.ENCRYPTED_CREDENTIALS_FILE', str(path))
+    return path
+
+
+@pytest.fixture
+def derive_calls(monkeypatch):
+    """Подсчёт генераций ключа из пароля."""
+    calls = []
+    derive_key = openssl.derive_key
+
+    def counted(password, salt):
+        calls.append(password)
+        return derive_key(password, salt)
+
+    monkeypatch.setattr('mls.utils.key_cache.derive_key', counted)
+    return calls
+
+
+def test_key_derived_once(backend, encrypted_file, derive_calls):
+    """Ключ генерируется один раз, затем берётся из keyring."""
+    cache = DerivedKeyCache(str(encrypted_file), backend=backend)
+    msg = encrypted_file.read_bytes()
+
+    assert cache.decrypt(msg, PASSWORD) == CREDENTIALS
+    assert cache.decrypt(msg, PASSWORD) == CREDENTIALS
+    assert derive_calls == [PASSWORD]
+
+
+def test_cached_key_bound_to_password(backend, encrypted_file):
+    """Сохранённый ключ не используется с другим паролем."""
+    cache = DerivedKeyCache(str(encrypted_file), backend=backend)
+    msg = encrypted_file.read_bytes()
+    cache.decrypt(msg, PASSWORD)
+
+    with pytest.raises(DecryptionError):
+        cache.decrypt(msg, 'wrong')
+
+
+def test_cached_key_expired_and_salt_changed(backend, encrypted_file, derive_calls):
+    """Ключ генерируется заново по истечении срока и после перезаписи файла."""
+    msg = encrypted_file.read_bytes()
+    DerivedKeyCache(str(encrypted_file), ttl=-1, backend=backend).decrypt(msg, PASSWORD)
+    DerivedKeyCache(str(encrypted_file), backend=backend).decrypt(msg, PASSWORD)
+
+    new_msg = openssl.encrypt(CREDENTIALS, PASSWORD)
+    DerivedKeyCache(str(encrypted_file), backend=backend).decrypt(new_msg, PASSWORD)
+    assert len(derive_calls) == 3
+
+
+def test_no_file_keyring(monkeypatch):
+    """Без системного хранилища кэш не используется: ключ не сохраняется в файл."""
+    plaintext = PlaintextKeyring()
+    monkeypatch.setattr('keyring.get_keyring', lambda: plaintext)
+    assert key_cache._backend() is None  # pylint: disable=protected-access
+
+    monkeypatch.setattr('keyring.get_keyring', lambda: fail.Keyring())
+    assert key_cache._backend() is None  # pylint: disable=protected-access
+
+    system = chainer.ChainerBackend()
+    monkeypatch.setattr(chainer.ChainerBackend, 'backends', [plaintext])
+    monkeypatch.setattr('keyring.get_keyring', lambda: system)
+    assert key_cache._backend() is None  # pylint: disable=protected-access
+
+
+def test_cache_disabled_by_default(encrypted_file, monkeypatch):
+    """По умолчанию кэш выключен: keyring не используется, разблокировка недоступна."""
+    monkeypatch.setattr('mls.utils.key_cache._backend', lambda: pytest.fail('keyring не должен использоваться'))
+
+    assert decrypt_credentials(encrypted_file.read_bytes(), PASSWORD) == CREDENTIALS
+    result = CliRunner().invoke(configure, ['--unlock'])
+    assert 'MLS_KEYRING_CACHE=true' in str(result.exception)
+
+
+def test_configure_unlock_lock(backend, encrypted_file, monkeypatch):
+    """После mls configure --unlock учётные данные читаются без пароля до mls configure --lock."""
+    runner = CliRunner()
+    monkeypatch.setattr('mls.manager.configure.utils.getpass', lambda *_: PASSWORD)
+    monkeypatch.setattr('mls.utils.key_cache.ENCRYPTED_CREDENTIALS_FILE', str(encrypted_file))
+
+    _, credentials = load_saved_config()
+    assert not credentials.has_section('default')
+
+    result = runner.invoke(configure, ['--unlock', '--ttl', '60'])
+    assert result.exit_code == 0
+    assert 'разблокированы на 60 с' in result.output
+    _, credentials = load_saved_config()
+    assert credentials.get('default', 'key_id') == 'id'
+
+    result = runner.invoke(configure, ['--lock'])
+    assert result.exit_code == 0
+    _, credentials = load_saved_config()
+    assert not credentials.has_section('default')
+
+
+def test_configure_unlock_wrong_password(backend, encrypted_file, monkeypatch):
+    """Неверный пароль не разблокирует учётные данные."""
+    monkeypatch.setattr('mls.manager.configure.utils.getpass', lambda *_: 'wrong')
+
+    result = CliRunner().invoke(configure, ['--unlock'])
+    assert isinstance(result.exception, DecryptionError)
@@ -0,0 +1,117 @@
+"""Тесты локального архива логов."""
+import gzip
+import re
+from datetime import datetime
+
+import pytest
+import responses
+
+from .conftest import ENDPOINT_URL
+from mls.cli import cli
+from mls.manager.job.archive import LogArchive
+
+
+def log_text(count):
+    """Журнал с метками времени, по строке в минуту."""
+    return ''.join(f'2024-01-31 {10 + i // 60:02d}:{i % 60:02d}:00 step {i} loss {i % 7}\n' for i in range(count))
+
+
+def test_archive_blocks_and_index(log_archive_dir):
+    """Журнал хранится блоками gzip; файл читается целиком стандартным gzip."""
+    store = LogArchive(block_size=256)
+    text = log_text(100)
+    ref = store.save('job', [text[i:i + 100].encode() for i in range(0, len(text), 100)])
+
+    assert ref['lines'] == 100
+    objects = list((log_archive_dir / 'objects').glob('*/*.gz'))
+    assert [path.name for path in objects] == [f'{ref["object"]}.gz']
+    assert gzip.decompress(objects[0].read_bytes()).decode() == text
+    assert len(store._blocks(ref['object'])) > 10
+
+    assert list(store.query('job')) == text.splitlines()
+    assert list(store.query('job', tail=3)) == text.splitlines()[-3:]
+    assert list(store.query('job', grep=re.compile('loss 6'), tail=2)) == [
+        '2024-01-31 11:30:00 step 90 loss 6',
+        '2024-01-31 11:37:00 step 97 loss 6',
+    ]
+    assert list(store.query('job', since=datetime(2024, 1, 31, 10, 58), until=datetime(2024, 1, 31, 11, 1))) == [
+        '2024-01-31 10:58:00 step 58 loss 2',
+        '2024-01-31 10:59:00 step 59 loss 3',
+        '2024-01-31 11:00:00 step 60 loss 4',
+        '2024-01-31 11:01:00 step 61 loss 5',
+    ]
+
+
+def test_archive_same_content_stored_once(log_archive_dir):
+    """Одинаковые журналы разных задач хранятся одним объектом."""
+    store = LogArchive()
+    first = store.save('job-1', [b'a\nb\n'])
+    second = store.save('job-2', [b'a\nb\n'])
+
+    assert first['object'] == second['object']
+    assert len(list((log_archive_dir / 'objects').glob('*/*.gz'))) == 1
+    assert store.ref('job-3') is None
+
+
+def test_archive_refs_scoped(log_archive_dir):
+    """Ссылки задач с одним именем в разных воркспейсах и регионах не пересекаются, имя не выходит из каталога refs."""
+    first = LogArchive(workspace='ws-1', region='A100')
+    second = LogArchive(workspace='ws-2', region='A100')
+    first.save('job', [b'first\n'])
+    second.save('job', [b'second\n'])
+
+    assert list(first.query('job')) == ['first']
+    assert list(second.query('job')) == ['second']
+    assert LogArchive(workspace='ws-1', region='V100').ref('job') is None
+
+    first.save('../../../escape', [b'x\n'])
+    first.save('a/b', [b'y\n'])
+    refs = log_archive_dir / 'refs'
+    assert sorted(path.relative_to(refs).as_posix() for path in refs.rglob('*.json')) == [
+        'ws-1/A100/%2E%2E%2F%2E%2E%2F%2E%2E%2Fescape.json',
+        'ws-1/A100/a%2Fb.json',
+        'ws-1/A100/job.json',
+        'ws-2/A100/job.json',
+    ]
+    assert list(first.query('a/b')) == ['y']
+
+
+def test_archive_keeps_blank_lines(log_archive_dir):
+    """Пустые строки журнала, в том числе в конце блоков, сохраняются."""
+    store = LogArchive(block_size=4)
+    store.save('job', [b'a\n\n\nb\n\n', b'c'])
+    assert list(store.query('job')) == ['a', '', '', 'b', '', 'c']
+    assert list(store.query('job', tail=3)) == ['b', '', 'c']
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_logs_archive_downloads_once(runner, job_profile):
+    """Журнал завершённой задачи загружается один раз, следующие запросы читают диск."""
+    job_profile['output'] = 'text'
+    status = responses.get(f'{ENDPOINT_URL}/jobs/job', json={'status': 'completed'})
+    download = responses.get(f'{ENDPOINT_URL}/jobs/job/logs', body=log_text(10))
+
+    result = runner.invoke(cli, ['job', 'logs', 'job', '--archive', '--tail', '2'])
+    assert result.exit_code == 0, result.output
+    assert result.output == '2024-01-31 10:08:00 step 8 loss 1\n2024-01-31 10:09:00 step 9 loss 2\n'
+
+    result = runner.invoke(cli, ['job', 'logs', 'job', '--archive', '--grep', 'loss [01]$'])
+    assert result.output.count('\n') == 4
+    assert download.call_count == 1
+    assert status.call_count == 1
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_logs_archive_running_job(runner, job_profile):
+    """Логи работающей задачи не архивируются."""
+    job_profile['output'] = 'text'
+    responses.get(f'{ENDPOINT_URL}/jobs/job', json={'status': 'Running'})
+
+    result = runner.invoke(cli, ['job', 'logs', 'job', '--archive'])
+    assert result.exit_code != 0
+    assert 'Архивируются только завершённые задачи' in result.output
+
+    result = runner.invoke(cli, ['job', 'logs', 'job', '--grep', 'loss'])
+    assert result.exit_code != 0
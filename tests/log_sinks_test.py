@@ -0,0 +1,81 @@
+"""Тесты приёмников строк журнала логов."""
+import gzip
+import json
+
+import pytest
+import responses
+
+from .conftest import ENDPOINT_URL
+from mls.cli import cli
+from mls.manager.job.sinks import open_sink
+
+
+def test_rotating_file_sink(tmp_path):
+    """Файл ротируется по размеру, сохраняется заданное число предыдущих файлов."""
+    path = tmp_path / 'train.log'
+    with open_sink('file', str(path), max_bytes=20, backup_count=2) as sink:
+        for index in range(6):
+            sink.write([f'line {index}', f'next {index}'.encode()])
+
+    assert path.read_text() == 'line 5\nnext 5\n'
+    assert (tmp_path / 'train.log.1').read_text() == 'line 4\nnext 4\n'
+    assert (tmp_path / 'train.log.2').read_text() == 'line 3\nnext 3\n'
+    assert not (tmp_path / 'train.log.3').exists()
+
+
+def test_gzip_sink_appends(tmp_path):
+    """Повторная запись в gzip дописывает новый член архива."""
+    path = tmp_path / 'train.log.gz'
+    for run in range(2):
+        with open_sink('gzip', str(path)) as sink:
+            sink.write([f'run {run}'.encode()], 'worker-0')
+
+    assert gzip.decompress(path.read_bytes()) == b'[worker-0] run 0\n[worker-0] run 1\n'
+
+
+def test_jsonl_sink(tmp_path):
+    """JSON Lines содержит время получения, источник и строку."""
+    path = tmp_path / 'train.jsonl'
+    with open_sink('jsonl', str(path)) as sink:
+        sink.write([b'\xd1\x88\xd0\xb0\xd0\xb3 1', b'\xff'], 'worker-0')
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record['line'] for record in records] == ['шаг 1', '�']
+    assert all(record['source'] == 'worker-0' and record['received_at'] > 0 for record in records)
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_logs_follow_bytes_to_file(runner, job_profile, tmp_path):
+    """Поток логов читается в байтах частями заданного размера и записывается в файл без искажений."""
+    job_profile['output'] = 'text'
+    body = ''.join(f'шаг {index}: loss\n' for index in range(100)).encode() + b'\xff raw\n'
+    responses.get(f'{ENDPOINT_URL}/jobs/job', json={'status': 'running'})
+    responses.get(f'{ENDPOINT_URL}/jobs/job', json={'status': 'running'})
+    responses.get(f'{ENDPOINT_URL}/jobs/job', json={'status': 'completed'})
+    responses.get(f'{ENDPOINT_URL}/jobs/job/logs', body=body, stream=True)
+    path = tmp_path / 'job.log'
+
+    result = runner.invoke(cli, ['job', 'logs', 'job', '--chunk_size', '7', '--sink', 'file', '--sink_path', str(path)])
+    assert result.exit_code == 0, result.output
+    assert result.output == ''
+    assert path.read_bytes() == body
+
+    result = runner.invoke(cli, ['job', 'logs', 'job', '--sink', 'gzip'])
+    assert result.exit_code != 0
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_logs_wait_status_not_in_sink(runner, job_profile, tmp_path, monkeypatch):
+    """Статус ожидания --wait не записывается в приёмник вместе со строками журнала."""
+    job_profile['output'] = 'text'
+    monkeypatch.setattr('mls.manager.job.cli.time.sleep', lambda _: None)
+    for status in ('pending', 'pending', 'completed'):
+        responses.get(f'{ENDPOINT_URL}/jobs/job', json={'status': status})
+    responses.get(f'{ENDPOINT_URL}/jobs/job/logs', body='step 1\nstep 2\n')
+    path = tmp_path / 'job.log'
+
+    result = runner.invoke(cli, ['job', 'logs', 'job', '--wait', '--sink', 'file', '--sink_path', str(path)])
+    assert result.exit_code == 0, result.output
+    assert path.read_text() == 'step 1\nstep 2\n'
@@ -0,0 +1,137 @@
+"""Тесты возобновляемого чтения логов."""
+import threading
+
+import pytest
+import requests
+import responses
+
+from .conftest import ENDPOINT_URL
+from mls.cli import cli
+from mls_core.logs import LogFollower
+from mls_core.logs import multiplex
+
+
+class FakeLog:
+    """Журнал задачи, поток которого обрывается после заданного числа частей."""
+
+    def __init__(self, runs):
+        """Каждый элемент runs - содержимое журнала к моменту очередного подключения."""
+        self.runs = list(runs)
+        self.requests = []
+
+    def open_stream(self, tail):
+        """Открытие потока с последними tail строками."""
+        self.requests.append(tail)
+        text = self.runs.pop(0)
+        if isinstance(text, Exception):
+            raise text
+        lines = text.splitlines(keepends=True)
+        text = ''.join(lines[-tail:] if tail else lines)
+        return (text[i:i + 3] for i in range(0, len(text), 3))
+
+    def is_running(self):
+        """Задача работает, пока есть следующие подключения."""
+        return bool(self.runs)
+
+
+def follow(log, **kwargs):
+    """Все строки журнала без задержек переподключения."""
+    return list(LogFollower(log.open_stream, log.is_running, backoff_factor=0, **kwargs))
+
+
+def lines(*numbers):
+    """Содержимое журнала из пронумерованных строк."""
+    return ''.join(f'line {number}\n' for number in numbers)
+
+
+def test_reconnect_emits_only_new_lines():
+    """Переподключение запрашивает окно и выдаёт только новые строки."""
+    log = FakeLog([lines(*range(5)), lines(*range(8)), lines(*range(8)), lines(*range(12))])
+
+    assert follow(log, window=4) == [f'line {number}' for number in range(12)]
+    assert log.requests == [0, 4, 4, 4]
+
+
+def test_repeated_lines_are_not_lost():
+    """Одинаковые строки журнала не принимаются за повторы."""
+    log = FakeLog(['a\nb\nb\n', 'a\nb\nb\nb\nb\nc\n'])
+
+    assert follow(log, window=10) == ['a', 'b', 'b', 'b', 'b', 'c']
+
+
+def test_gap_larger_than_window():
+    """Если за время разрыва строк больше окна, выдаётся всё окно."""
+    log = FakeLog([lines(0, 1), lines(*range(10))])
+
+    assert follow(log, window=3) == ['line 0', 'line 1', 'line 7', 'line 8', 'line 9']
+
+
+def test_partial_line_waits_for_reconnect():
+    """Незавершённая строка оборванного потока выдаётся целиком после переподключения."""
+    log = FakeLog(['first\nsec', 'first\nsecond\nlast'])
+
+    assert follow(log) == ['first', 'second', 'last']
+
+
+def test_stream_errors_reconnect():
+    """Сетевые ошибки приводят к переподключению, повторяющиеся - передаются вызывающему."""
+    log = FakeLog([lines(0), requests.exceptions.ConnectionError(), lines(0, 1)])
+    assert follow(log) == ['line 0', 'line 1']
+
+    log = FakeLog([requests.exceptions.ConnectionError()] * 3 + [''])
+    with pytest.raises(requests.exceptions.ConnectionError):
+        follow(log, max_errors=3)
+
+
+def test_idle_reconnect_backoff(monkeypatch):
+    """Переподключения без новых строк выполняются с растущей задержкой."""
+    sleeps = []
+    monkeypatch.setattr('mls_core.logs.time.sleep', sleeps.append)
+    log = FakeLog([lines(0)] * 5 + [lines(0, 1)] * 2)
+
+    list(LogFollower(log.open_stream, log.is_running, backoff_factor=1, max_backoff=4))
+    assert sleeps == [1, 2, 4, 4]
+
+
+def test_multiplex_slow_source_does_not_stall_others():
+    """Строки быстрого источника выводятся, пока медленный источник ждёт данных."""
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        yield 'late'
+
+    def fast():
+        yield from ('a', 'b', 'c')
+
+    merged = multiplex({'slow': slow, 'fast': fast}, buffer=1)
+    assert [next(merged) for _ in range(3)] == [('fast', 'a'), ('fast', 'b'), ('fast', 'c')]
+    release.set()
+    assert list(merged) == [('slow', 'late')]
+
+
+def test_multiplex_source_error():
+    """Ошибка одного источника выводится его строкой и не прерывает остальные."""
+    def broken():
+        yield 'start'
+        raise requests.exceptions.ConnectionError('reset')
+
+    merged = sorted(multiplex({'broken': broken, 'ok': lambda: iter(['line'])}))
+    assert merged == sorted([('broken', 'start'), ('broken', 'Ошибка чтения логов: reset'), ('ok', 'line')])
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_logs_many_jobs(runner, job_profile):
+    """Логи нескольких задач выводятся с именем задачи в начале строки."""
+    job_profile['output'] = 'text'
+    for name in ('job-1', 'job-2'):
+        responses.get(f'{ENDPOINT_URL}/jobs/{name}', json={'status': 'completed'})
+        responses.get(f'{ENDPOINT_URL}/jobs/{name}/logs', body=f'{name} step 1\n{name} step 2\n')
+
+    result = runner.invoke(cli, ['job', 'logs', 'job-1', 'job-2'])
+    assert result.exit_code == 0, result.output
+    output = result.output.splitlines()
+    assert sorted(output) == sorted(f'[{name}] {name} step {step}' for name in ('job-1', 'job-2') for step in (1, 2))
+    assert output.index('[job-1] job-1 step 1') < output.index('[job-1] job-1 step 2')
+    assert runner.invoke(cli, ['job', 'logs', 'job-1', '--pods']).exit_code != 0
@@ -1,5 +1,10 @@
 """Тесты имитирующие ошибки не связанные с работой cli."""
+import importlib
+import inspect
+import json
 import socket
+import subprocess
+import sys
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -10,12 +15,18 @@ import urllib3
 from urllib3.connection import HTTPConnection
 from urllib3.connectionpool import ConnectionPool
 
+from mls import __version__
 from mls.cli import auto_complete_function
+from mls.cli import COMMANDS
 from mls.cli import entry_point
 from mls.utils.common import suggest_autocomplete
+from mls.utils.completion import complete
+from mls.utils.completion import CompletionTrie
+from mls.utils.completion import load_index
 from mls.utils.execption import ConfigReadError
 from mls.utils.execption import ConfigWriteError
 from mls.utils.style import error_format
+from mls_core.exceptions import CircuitOpenError
 
 
 def test_entry_point_success():
@@ -104,18 +115,31 @@ def test_entry_point_connection_error(mock_echo, mock_cli):
         assert error_text == '\x1b[31m\x1b[1mНе удалось установить соединение, проверьте настройки сети\x1b[0m'
 
 
+@patch('mls.cli.cli')
+@patch('mls.cli.click.echo')
+def test_entry_point_circuit_open(mock_echo, mock_cli):
+    """Тест обработки CircuitOpenError: выводится причина отказа."""
+    mock_cli.side_effect = CircuitOpenError('API https://abc.com недоступно')
+    with pytest.raises(SystemExit):
+        entry_point()
+    assert mock_echo.mock_calls[0].args == (error_format('API https://abc.com недоступно'),)
+
+
 def test_cli_autocomplete():
     """Тест наполнения map для cli."""
     mapping = {}
     auto_complete_function(mapping)
-    assert set(mapping['mls job restart']) == {'--debug', '--endpoint_url', '--output', '--profile'}
+    assert set(mapping['mls job restart']) == {
+        '--debug', '--endpoint_url', '--output', '--profile',
+        '--from_file', '--status', '--queue', '--allocation_name', '--name_pattern', '--workers',
+    }
 
 
 def test_cli_autocomplete_config():
     """Тест наполнения map для cli."""
     mapping = {}
     auto_complete_function(mapping)
-    assert set(mapping['mls configure']) == {'--profile', '--encrypt'}
+    assert set(mapping['mls configure']) == {'--profile', '--encrypt', '--unlock', '--lock', '--ttl'}
 
 
 def test_cli_suggest():
@@ -132,3 +156,76 @@ def test_cli_suggest():
     assert suggest_autocomplete('mls connector cr', mapping) == ['create']
     assert suggest_autocomplete('mls tr', mapping) == ['transfer']
     assert set(suggest_autocomplete('mls transfer de', mapping)) == {'deactivate', 'delete'}
+
+
+@pytest.mark.parametrize('name', sorted(COMMANDS))
+def test_lazy_manifest_matches_commands(name):
+    """Статическое описание подкоманд совпадает с реальными командами."""
+    spec = COMMANDS[name]
+    module_name, attr = spec.import_path.split(':')
+    command = getattr(importlib.import_module(module_name), attr)
+    ctx = click.Context(command)
+
+    assert inspect.cleandoc(command.help) == spec.help
+    assert tuple(command.list_commands(ctx)) == spec.commands if isinstance(command, click.Group) else not spec.commands
+
+
+def test_version_does_not_import_commands():
+    """Mls --version не импортирует модули подкоманд и сетевые библиотеки."""
+    code = (
+        'import sys\n'
+        'from mls.cli import cli\n'
+        'try:\n'
+        '    cli(["--version"])\n'
+        'except SystemExit:\n'
+        '    pass\n'
+        'print(sorted(m for m in ("requests", "Crypto", "yaml", "tabulate", "mls.manager.job.cli") if m in sys.modules))\n'
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.splitlines()[-1] == '[]'
+
+
+def test_lazy_command_loaded_on_demand(runner):
+    """Подкоманда загружается при обращении к ней."""
+    from mls.cli import cli
+
+    result = runner.invoke(cli, ['job', 'types'])
+    assert result.exit_code == 0
+    assert 'binary' in result.output
+
+
+def test_completion_trie_matches_suggest():
+    """Префиксное дерево даёт те же подсказки, что и линейный поиск по словарю."""
+    mapping = {}
+    auto_complete_function(mapping)
+    trie = CompletionTrie.from_mapping(mapping)
+    for text in ('mls job re', 'mls job s', 'mls j', 'mls co', 'mls connector cr', 'mls transfer de'):
+        assert trie.suggest(text) == sorted(set(suggest_autocomplete(text, mapping)))
+    assert trie.suggest('mls job restart --p') == ['--profile']
+    assert not trie.suggest('mls unknown x')
+
+
+def test_completion_index_versioned(tmp_path, monkeypatch):
+    """Индекс строится один раз и перестраивается при смене версии."""
+    path = tmp_path / 'completion.json'
+    mapping, trie = load_index(str(path))
+    assert json.loads(path.read_text())['version'] == __version__
+
+    monkeypatch.setattr('mls.utils.completion.build_mapping', lambda: pytest.fail('индекс не должен перестраиваться'))
+    monkeypatch.setattr(CompletionTrie, 'from_mapping', lambda _: pytest.fail('дерево читается из индекса'))
+    loaded, loaded_trie = load_index(str(path))
+    assert loaded == mapping
+    assert loaded_trie.to_dict() == trie.to_dict()
+    assert complete(['autocomplete', 'mls', 'job', 'su'], loaded, loaded_trie) == 'submit'
+    monkeypatch.undo()
+
+    path.write_text(json.dumps({'version': '0.0.0', 'mapping': {'mls': ['old']}}))
+    monkeypatch.setattr('mls.utils.completion.build_mapping', lambda: {'mls': ['new']})
+    assert load_index(str(path))[0] == {'mls': ['new']}
+
+
+def test_completion_output():
+    """Вывод автозаполнения для подкоманд и опций."""
+    mapping = {'mls': ['job'], 'mls job': ['kill', 'list'], 'mls job kill': ['--profile']}
+    assert complete(['autocomplete', 'mls', 'job', 'k'], mapping) == 'kill'
+    assert complete(['autocomplete', 'mls', 'job', 'kill'], mapping) == '\n\u00A0\n--profile'
@@ -0,0 +1,80 @@
+"""Тесты потокового вывода списков."""
+import csv
+import io
+import json
+
+import pytest
+import responses
+from responses import matchers
+
+from .conftest import ENDPOINT_URL
+from mls.cli import cli
+from mls.utils.output import csv_lines
+from mls.utils.output import json_chunks
+from mls.utils.output import ndjson_lines
+from mls.utils.output import project
+from mls.utils.output import split_items
+
+ITEMS = [
+    {'name': 'a', 'query': {'source': 'bucket', 'paths': ['x', 'y']}, 'active': True},
+    {'name': 'б,в', 'query': None, 'active': False, 'extra': 'line\nbreak'},
+]
+
+
+@pytest.mark.parametrize('items', [[], ITEMS[:1], ITEMS])
+def test_json_chunks_array(items):
+    """Потоковый JSON-массив совпадает с json.dumps(indent=4)."""
+    assert ''.join(json_chunks(items)) == json.dumps(items, indent=4, ensure_ascii=False)
+
+
+def test_ndjson_and_projection():
+    """Проекция полей выполняется до сериализации; вложенные поля - через точку."""
+    lines = list(ndjson_lines(project(ITEMS, ['name', 'query.source', 'missing'])))
+    assert lines == [
+        '{"name": "a", "query.source": "bucket", "missing": null}\n',
+        '{"name": "б,в", "query.source": null, "missing": null}\n',
+    ]
+
+
+def test_csv_lines():
+    """CSV: заголовок по полям первого элемента, вложенные значения - JSON, None - пустая строка."""
+    rows = list(csv.reader(io.StringIO(''.join(csv_lines(ITEMS)))))
+    assert rows == [
+        ['name', 'query', 'active'],
+        ['a', '{"source": "bucket", "paths": ["x", "y"]}', 'True'],
+        ['б,в', '', 'False'],
+    ]
+    assert not list(csv_lines([]))
+    assert list(csv_lines([], ['name'])) == ['name\n']
+
+
+@pytest.mark.parametrize('response, expected', [
+    ([1, 2], (None, [1, 2])),
+    ({'jobs': [1], 'total': 1}, ('jobs', [1])),
+    ({'detail': 'error'}, (None, None)),
+    ('text', (None, None)),
+])
+def test_split_items(response, expected):
+    """Список элементов находится в списке или в единственном поле-списке словаря."""
+    assert split_items(response) == expected
+
+
+@responses.activate
+@pytest.mark.parametrize('output, expected', [
+    ('ndjson', '{"job_name": "job-0", "status": "Running"}\n{"job_name": "job-1", "status": "Pending"}\n'),
+    ('csv', 'job_name,status\njob-0,Running\njob-1,Pending\n'),
+    ('json', json.dumps({'jobs': [{'job_name': 'job-0'}, {'job_name': 'job-1'}]}, indent=4) + '\n'),
+])
+@pytest.mark.usefixtures('job_auth')
+def test_job_list_formats(runner, output, expected):
+    """Mls job list выводит задачи в выбранном формате по мере загрузки страниц."""
+    jobs = [{'job_name': 'job-0', 'status': 'Running', 'gpu_count': 1}, {'job_name': 'job-1', 'status': 'Pending', 'gpu_count': 2}]
+    responses.get(
+        f'{ENDPOINT_URL}/jobs', json={'jobs': jobs},
+        match=[matchers.query_param_matcher({'region': 'region', 'limit': '10', 'offset': '0'})],
+    )
+    columns = 'job_name' if output == 'json' else 'job_name,status'
+
+    result = runner.invoke(cli, ['job', 'list', '-O', output, '--columns', columns, '--limit', '10'])
+    assert result.exit_code == 0, result.output
+    assert result.output == expected
@@ -0,0 +1,81 @@
+"""Тесты планировщика запроса списка задач."""
+import pytest
+import responses
+from responses import matchers
+
+from .conftest import ENDPOINT_URL
+from mls.cli import cli
+from mls.manager.job.constants import job_query_params
+from mls.schema import compile_where
+from mls.schema.planner import plan_query
+
+PARAMS = {'region': 'region', 'queue': None, 'allocation_name': None, 'status': ()}
+
+
+def plan(expression, **params):
+    """План запроса для выражения --where."""
+    return plan_query({**PARAMS, **params}, job_query_params, where=compile_where(expression))
+
+
+@pytest.mark.parametrize('expression, params, residual', [
+    ('status = running', {'status': ['Running']}, None),
+    ('status in (Running, pending) and gpu_count >= 8', {'status': ['Running', 'Pending']}, 'gpu_count>=8'),
+    ('queue_id = q1 and allocation_name = "a 1"', {'queue': 'q1', 'allocation_name': 'a 1'}, None),
+    ('gpu_count > 1 and job_name ~ "^train"', {}, 'gpu_count > 1 and job_name ~ "^train"'),
+    ('status = Running or gpu_count = 8', {}, 'status = Running or gpu_count = 8'),
+    ('status != Running', {}, 'status != Running'),
+    ('status = unknown', {}, 'status = unknown'),
+    ('queue_id in (q1, q2)', {}, 'queue_id in (q1, q2)'),
+])
+def test_plan_where(expression, params, residual):
+    """В запрос переносятся равенства и списки значений для параметров API, объединённые через and."""
+    query = plan(expression)
+    assert query.params == {**PARAMS, **params}
+    assert (str(query.where) if query.where is not None else None) == residual
+
+
+def test_plan_intersects_options():
+    """Условие сужает значения, заданные опцией; при пустом пересечении остаётся клиенту."""
+    query = plan('status in (running, failed)', status=('Running', 'Pending'))
+    assert query.params['status'] == ['Running']
+    assert query.where is None
+
+    query = plan('status = Failed', status=('Running',))
+    assert query.params['status'] == ('Running',)
+    assert str(query.where) == 'status = Failed'
+
+    query = plan('queue_id = q2', queue='q1')
+    assert query.params['queue'] == 'q1'
+    assert str(query.where) == 'queue_id = q2'
+
+
+def test_plan_filters_and_sorting():
+    """Фильтры по полям без параметров API и сортировка выполняются клиентом."""
+    filters = [{'field': 'gpu_count', 'values': 2, 'type': 'eq'}, {'field': 'job_name', 'values': 'tes', 'type': 'like'}]
+    sorters = [{'field': 'gpu_count', 'direction': 'desc'}]
+    query = plan_query(PARAMS, job_query_params, filters, None, sorters)
+    assert query.params == PARAMS
+    assert (query.filters, query.where, query.sorters, query.pushed) == (filters, None, sorters, [])
+    assert query.describe() == (
+        'План запроса: API - region=region; клиент - gpu_count eq 2, job_name like tes, сортировка gpu_count desc'
+    )
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_table_pushes_where(runner, caplog):
+    """Mls job table передаёт условия на статус в запрос и фильтрует остаток на клиенте."""
+    responses.get(
+        f'{ENDPOINT_URL}/jobs',
+        json={'jobs': [
+            {'job_name': 'big', 'status': 'Running', 'gpu_count': 8},
+            {'job_name': 'small', 'status': 'Running', 'gpu_count': 1},
+        ]},
+        match=[matchers.query_param_matcher({'region': 'region', 'status': 'Running', 'limit': '6000', 'offset': '0'})],
+    )
+
+    with caplog.at_level('DEBUG', logger='TrainingJobApi.planner'):
+        result = runner.invoke(cli, ['job', 'table', '--where', 'status = running and gpu_count >= 8'])
+    assert result.exit_code == 0, result.output
+    assert 'big' in result.output and 'small' not in result.output
+    assert 'API - region=region, status=Running; перенесено в API: status=running; клиент - where gpu_count>=8' in caplog.text
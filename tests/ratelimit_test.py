@@ -0,0 +1,126 @@
+"""Тесты ограничения частоты запросов."""
+import threading
+
+import pytest
+import responses
+
+from mls_core import TrainingJobApi
+from mls_core.ratelimit import endpoint_class
+from mls_core.ratelimit import parse_limits
+from mls_core.ratelimit import RateLimiter
+from mls_core.ratelimit import TokenBucket
+
+ENDPOINT_URL = 'https://fake.api.com'
+OPTIONS = dict(endpoint_url=ENDPOINT_URL, client_id='id', client_secret='secret', x_workspace_id='workspace', x_api_key='key')
+
+
+class Clock:
+    """Управляемый источник времени."""
+
+    def __init__(self, now=1000.0):
+        """Инициализация."""
+        self.now = now
+
+    def __call__(self):
+        """Текущее время."""
+        return self.now
+
+
+@pytest.fixture
+def waits(monkeypatch):
+    """Ожидания ограничения частоты запросов."""
+    delays = []
+    monkeypatch.setattr(RateLimiter, 'sleep', staticmethod(delays.append))
+    return delays
+
+
+@pytest.mark.parametrize('spec, expected', [
+    ('', {}),
+    ('10', {'read': (10.0, 10), 'write': (10.0, 10), 'logs': (10.0, 10)}),
+    ('read=20, write=0.5:3', {'read': (20.0, 20), 'write': (0.5, 3)}),
+    ('5,logs=0', {'read': (5.0, 5), 'write': (5.0, 5)}),
+])
+def test_parse_limits(spec, expected):
+    """Частота и запас задаются по классам адресов; 0 снимает ограничение."""
+    assert parse_limits(spec) == expected
+
+
+@pytest.mark.parametrize('spec', ['jobs=5', 'read=fast', 'read=-1', 'write=1:0'])
+def test_parse_limits_errors(spec):
+    """Неверная настройка не принимается."""
+    with pytest.raises(ValueError):
+        parse_limits(spec)
+
+
+@pytest.mark.parametrize('method, path, expected', [
+    ('GET', 'jobs', 'read'),
+    ('GET', 'jobs/name/logs', 'logs'),
+    ('GET', 'jobs/elastic/name/pods/pod-0/logs', 'logs'),
+    ('POST', 'data_transfer/v3/connectors/s3custom/id/try', 'write'),
+    ('DELETE', 'jobs/name', 'write'),
+])
+def test_endpoint_class(method, path, expected):
+    """Класс адреса определяется методом и путём запроса."""
+    assert endpoint_class(method, path) == expected
+
+
+def test_bucket_reservation():
+    """Запас расходуется без ожидания, дальше запросы идут с частотой rate; 429 опустошает корзину."""
+    clock = Clock()
+    bucket = TokenBucket(rate=2, burst=2, clock=clock)
+    assert [bucket.reserve() for _ in range(4)] == [0, 0, 0.5, 1.0]
+
+    clock.now += 10
+    assert bucket.reserve() == 0
+    bucket.drain(3)
+    assert bucket.reserve() == 3.5
+
+
+def test_bucket_threads():
+    """Одновременные запросы из потоков выстраиваются в очередь без повторной выдачи маркеров."""
+    bucket = TokenBucket(rate=10, burst=5, clock=Clock())
+    delays = []
+    threads = [threading.Thread(target=lambda: delays.append(bucket.reserve())) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(round(delay, 6) for delay in delays) == [0] * 5 + [round(0.1 * n, 6) for n in range(1, 16)]
+
+
+def test_bucket_shared_file(tmp_path):
+    """Корзины с общим файлом (разные процессы) расходуют общий запас."""
+    clock = Clock()
+    path = str(tmp_path / 'bucket')
+    first, second = TokenBucket(1, 2, path, clock), TokenBucket(1, 2, path, clock)
+    assert first.reserve() == 0 and first.reserve() == 0
+    assert second.reserve() == 1
+    assert first.reserve() == 2
+
+
+@responses.activate
+def test_client_rate_limit(waits):
+    """Клиент ожидает маркер перед каждой попыткой; после 429 ожидают все запросы класса."""
+    class Api(TrainingJobApi):
+        def _get_auth_token(self, client_id, client_secret):
+            return 'ABC'
+
+    api = Api(**OPTIONS, rate_limit='read=100:1')
+    responses.get(f'{ENDPOINT_URL}/jobs/name', json={'status': 'Running'})
+    assert api.get_job_status('name') == {'status': 'Running'}
+    assert api.get_job_status('name') == {'status': 'Running'}
+    assert len(waits) == 1 and 0 < waits[0] <= 0.01
+
+    responses.reset()
+    responses.get(f'{ENDPOINT_URL}/jobs/name', status=429, headers={'Retry-After': '2'})
+    responses.get(f'{ENDPOINT_URL}/jobs/name', json={'status': 'Running'})
+    assert Api(**OPTIONS, rate_limit='read=100:1').get_job_status('name') == {'status': 'Running'}
+    assert waits[-1] == pytest.approx(2, abs=0.1)
+
+
+def test_client_set_rate_limit():
+    """Ограничение дополняется по классам адресов, прочие классы ограничиваются по-прежнему."""
+    api = TrainingJobApi(**OPTIONS, rate_limit='read=100:1,write=10')
+    api.set_rate_limit('write=2:1')
+    assert api._limiter.limits == {'read': (100.0, 1), 'write': (2.0, 1)}
+    assert api._agent_options['rate_limit'] == 'read=100:1,write=10,write=2:1'
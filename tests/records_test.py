@@ -0,0 +1,105 @@
+"""Тесты компактных записей ответов API."""
+import copy
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+from .dts import conftest
+from mls.manager.dts.table import display_transfers
+from mls.schema import compile_where
+from mls.schema.table import display_jobs
+from mls_core import ConnectorRecord
+from mls_core import DTSApi
+from mls_core import JobRecord
+from mls_core import TrainingJobApi
+from mls_core import TransferRecord
+
+JOB = {
+    'uid': '232d33b0-e3a4-49a7-85c1-000000000000',
+    'job_name': 'lm-mpi-job-d305a5a8',
+    'status': 'Running',
+    'region': 'A100-MT',
+    'instance_type': 'v100.1gpu',
+    'job_desc': None,
+    'gpu_count': 8,
+    'duration': '3600s',
+    'queue_id': '00000000-0000-0000-0000-000000000000',
+}
+# Копии: тесты dts изменяют объекты conftest.
+CONNECTOR = copy.deepcopy(conftest.CONNECTOR)
+TRANSFERS = copy.deepcopy(conftest.TRANSFERS)
+TRANSFER = TRANSFERS[0]
+OPTIONS = dict(endpoint_url='https://fake.api.com', client_id='id', client_secret='secret', x_workspace_id='workspace', x_api_key='key')
+
+
+def test_record_mapping():
+    """Запись хранит поля в слотах и читается так же, как словарь ответа API."""
+    record = TransferRecord({**TRANSFER, 'new_field': 1})
+    assert not hasattr(record, '__dict__')
+    assert record == {**TRANSFER, 'new_field': 1}
+    assert list(record) == [*TRANSFER, 'new_field']
+    assert record.name == record['name'] == record.get('name') == 'ИмяПереноса'
+    assert record['new_field'] == 1 and not hasattr(record, 'new_field')
+
+    job = JobRecord(JOB)
+    assert job.allocation_name is None and 'allocation_name' not in job
+    with pytest.raises(KeyError):
+        job['allocation_name']
+    assert job.to_dict() == JOB
+
+
+def test_lazy_nested_fields():
+    """Вложенные поля хранятся в виде JSON до первого обращения."""
+    record = ConnectorRecord(CONNECTOR)
+    assert isinstance(object.__getattribute__(record, '_parameters'), bytes)
+    assert record.parameters == {'namespace': 'ns0000001-00001'}
+    assert object.__getattribute__(record, '_parameters') is record.parameters
+
+    record = TransferRecord(TRANSFER)
+    assert record['query'] == TRANSFER['query']
+    assert record.crontab['weekdays'] == [1]
+
+
+def test_records_memory():
+    """Список записей занимает меньше половины памяти списка словарей."""
+    def allocated(build):
+        tracemalloc.start()
+        try:
+            items = build()
+            return tracemalloc.get_traced_memory()[0], items
+        finally:
+            tracemalloc.stop()
+
+    dicts, _ = allocated(lambda: [copy.deepcopy(TRANSFER) for _ in range(1000)])
+    records, _ = allocated(lambda: [TransferRecord(TRANSFER) for _ in range(1000)])
+    assert records * 2 < dicts
+
+
+def test_client_records_flag():
+    """Клиенты возвращают записи только с флагом records=True."""
+    with patch.object(DTSApi, '_request', return_value=copy.deepcopy(TRANSFERS)):
+        assert type(DTSApi(**OPTIONS).transfer_list()[0]) is dict
+        transfers = DTSApi(**OPTIONS, records=True).transfer_list()
+    assert [type(transfer) for transfer in transfers] == [TransferRecord, TransferRecord]
+    assert transfers == TRANSFERS
+
+    with patch.object(DTSApi, '_request', return_value=[CONNECTOR, {**CONNECTOR, 'source_type': 's3custom'}]):
+        connectors = DTSApi(**OPTIONS, records=True).conn_list(typ='s3custom')
+    assert [connector.source_type for connector in connectors] == ['s3custom']
+
+    with patch.object(TrainingJobApi, '_request', return_value={'jobs': [JOB]}):
+        api = TrainingJobApi(**OPTIONS, records=True)
+        assert isinstance(api.get_list_jobs('region', None, None, None, 10, 0)['jobs'][0], JobRecord)
+        assert [job.gpu_count for job in api.iter_jobs('region', None, None, None, page_size=10)] == [8]
+
+
+def test_records_in_tables():
+    """Таблицы и --where принимают записи так же, как словари."""
+    records = [TransferRecord(transfer) for transfer in TRANSFERS]
+    assert display_transfers(records, None) == display_transfers(TRANSFERS, None)
+    assert display_jobs([JobRecord(JOB)]) == display_jobs([JOB])
+
+    where = compile_where('query.destination ~ "^transfer" and gpu_count = 8')
+    assert not where(records[0])
+    assert compile_where('crontab.weekdays = 1 or active = true')(records[0])
@@ -0,0 +1,186 @@
+"""Тесты политики повторов запросов."""
+import pytest
+import requests
+import responses
+import urllib3
+
+from mls_core import DTSApi
+from mls_core import TrainingJobApi
+from mls_core.exceptions import CircuitOpenError
+from mls_core.retry import CircuitBreaker
+from mls_core.retry import IDEMPOTENCY_HEADER
+from mls_core.retry import IDEMPOTENT
+from mls_core.retry import NON_IDEMPOTENT
+from mls_core.retry import RetryBudget
+from mls_core.retry import RetryPolicy
+
+ENDPOINT_URL = 'https://fake.api.com'
+OPTIONS = dict(endpoint_url=ENDPOINT_URL, client_id='id', client_secret='secret', x_workspace_id='workspace', x_api_key='key')
+
+
+class Clock:
+    """Управляемый источник времени."""
+
+    def __init__(self):
+        """Инициализация."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Текущее время."""
+        return self.now
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Задержки перед повторами."""
+    delays = []
+    monkeypatch.setattr(RetryPolicy, 'sleep', staticmethod(delays.append))
+    return delays
+
+
+@pytest.fixture
+def api_job():
+    """Клиент задач без авторизации."""
+    class Api(TrainingJobApi):
+        def _get_auth_token(self, client_id, client_secret):
+            return 'ABC'
+    return Api(**OPTIONS, debug=True)
+
+
+def refused():
+    """Ошибка установления соединения: запрос не отправлен."""
+    reason = urllib3.exceptions.NewConnectionError(None, 'Connection refused')
+    return requests.exceptions.ConnectionError(urllib3.exceptions.MaxRetryError(None, ENDPOINT_URL, reason))
+
+
+@pytest.mark.parametrize('client, method, path, expected', [
+    (TrainingJobApi, 'GET', 'jobs', IDEMPOTENT),
+    (TrainingJobApi, 'DELETE', 'jobs/name', IDEMPOTENT),
+    (TrainingJobApi, 'POST', 'service_auth', IDEMPOTENT),
+    (TrainingJobApi, 'POST', 'jobs', NON_IDEMPOTENT),
+    (TrainingJobApi, 'POST', 'jobs/restart', NON_IDEMPOTENT),
+    (DTSApi, 'POST', 'data_transfer/v4/transfer/40e36b8d/switch', IDEMPOTENT),
+    (DTSApi, 'POST', 'data_transfer/v5/transfer', NON_IDEMPOTENT),
+    (DTSApi, 'POST', 'data_transfer/v3/connectors', NON_IDEMPOTENT),
+    (DTSApi, 'POST', 'data_transfer/v3/connectors/s3custom/9e12966e/halt', IDEMPOTENT),
+])
+def test_idempotency_classes(client, method, path, expected):
+    """Класс идемпотентности определяется методом и маршрутами идемпотентных POST клиента."""
+    policy = RetryPolicy(ENDPOINT_URL, idempotent_posts=client.IDEMPOTENT_POSTS)
+    assert policy.idempotency(method, path) == expected
+
+
+@responses.activate
+def test_post_retried_only_when_rejected(api_job, sleeps):
+    """Запуск задачи не повторяется после 502, а после 503 повторяется с тем же ключом идемпотентности."""
+    responses.post(f'{ENDPOINT_URL}/jobs', status=502, json={'detail': 'bad gateway'})
+    assert api_job.run_job({'script': 'train.py'}) == {'detail': 'bad gateway'}
+    assert len(responses.calls) == 1
+
+    responses.reset()
+    responses.post(f'{ENDPOINT_URL}/jobs', status=503, json={'detail': 'unavailable'})
+    responses.post(f'{ENDPOINT_URL}/jobs', json={'job_name': 'job-1'})
+    assert api_job.run_job({'script': 'train.py'}) == {'job_name': 'job-1'}
+    keys = {call.request.headers[IDEMPOTENCY_HEADER] for call in responses.calls}
+    assert len(responses.calls) == 2 and len(keys) == 1 and len(sleeps) == 1
+
+
+@responses.activate
+def test_post_retried_on_refused_connection(api_job, sleeps):
+    """POST повторяется, если соединение не установлено, и не повторяется после обрыва отправленного запроса."""
+    responses.post(f'{ENDPOINT_URL}/jobs', body=refused())
+    responses.post(f'{ENDPOINT_URL}/jobs', json={'job_name': 'job-1'})
+    assert api_job.run_job({}) == {'job_name': 'job-1'}
+
+    responses.reset()
+    responses.post(f'{ENDPOINT_URL}/jobs', body=requests.exceptions.ConnectionError('reset'))
+    with pytest.raises(requests.exceptions.ConnectionError):
+        api_job.run_job({})
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_retry_after(api_job, sleeps):
+    """Задержка берётся из Retry-After; слишком долгое ожидание не выполняется."""
+    responses.get(f'{ENDPOINT_URL}/jobs/name', status=429, headers={'Retry-After': '2'})
+    responses.get(f'{ENDPOINT_URL}/jobs/name', json={'status': 'Running'})
+    assert api_job.get_job_status('name') == {'status': 'Running'}
+    assert sleeps == [2.0]
+
+    responses.reset()
+    responses.get(f'{ENDPOINT_URL}/jobs/name', status=429, headers={'Retry-After': '3600'}, json={'detail': 'slow down'})
+    assert api_job.get_job_status('name') == {'detail': 'slow down'}
+    assert sleeps == [2.0]
+
+
+def test_retry_budget():
+    """Повтор расходует единицу бюджета, запрос пополняет его на долю ratio."""
+    budget = RetryBudget(ratio=0.5, minimum=2)
+    assert budget.withdraw() and budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+@responses.activate
+def test_budget_limits_retries(api_job, sleeps, monkeypatch):
+    """После исчерпания бюджета запрос не повторяется."""
+    monkeypatch.setattr(api_job._retry, 'budget', RetryBudget(ratio=0, minimum=1))
+    responses.get(f'{ENDPOINT_URL}/jobs/name', status=500, json={'detail': 'error'})
+    assert api_job.get_job_status('name') == {'detail': 'error'}
+    assert len(responses.calls) == 2
+
+
+def test_circuit_breaker():
+    """Автомат открывается после threshold неудач подряд и пропускает одну пробную попытку после reset_timeout."""
+    clock = Clock()
+    breaker = CircuitBreaker(threshold=2, reset_timeout=10, clock=clock)
+    breaker.failure()
+    breaker.success()
+    breaker.failure()
+    assert breaker.allow()
+    breaker.failure()
+    assert breaker.state == CircuitBreaker.OPEN and not breaker.allow()
+
+    clock.now = 10
+    assert breaker.allow() and not breaker.allow()
+    breaker.failure()
+    assert breaker.state == CircuitBreaker.OPEN and breaker.remaining() == 10
+
+    clock.now = 20
+    assert breaker.allow()
+    breaker.success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+
+
+def test_circuit_breaker_aborted_trial():
+    """Пробная попытка, прерванная исключением без ответа API, не оставляет автомат полуоткрытым."""
+    clock = Clock()
+    breaker = CircuitBreaker(threshold=1, reset_timeout=10, clock=clock)
+    policy = RetryPolicy(ENDPOINT_URL, breaker=breaker)
+    breaker.failure()
+    clock.now = 10
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        policy.send('GET', 'jobs', interrupted, {})
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow() and breaker.state == CircuitBreaker.HALF_OPEN
+
+
+@responses.activate
+def test_circuit_open_fails_fast(api_job, sleeps, caplog):
+    """Когда API недоступно, запросы завершаются ошибкой без обращения к сети; счётчики выводятся в --debug."""
+    responses.get(f'{ENDPOINT_URL}/jobs/name', body=refused())
+    with caplog.at_level('DEBUG'), pytest.raises(requests.exceptions.ConnectionError):
+        api_job.get_job_status('name')
+    assert len(responses.calls) == 5
+
+    with caplog.at_level('DEBUG'), pytest.raises(CircuitOpenError, match='недоступно'):
+        api_job.get_job_status('name')
+    assert len(responses.calls) == 5
+    assert 'повторов 4' in caplog.text and 'отклонено 1' in caplog.text
@@ -1,6 +1,9 @@
 """Тесты на проверку представления таблиц."""
 import pytest
+from tabulate import tabulate  # type: ignore
 
+from mls.schema.stream import format_table
+from mls.schema.stream import render_table
 from mls.schema.table import display_jobs
 from mls.schema.table import filter_by
 from mls.schema.table import JobTableView
@@ -123,3 +126,92 @@ def test_sort_key(sample):
     )[0] != sort_by(
         sample, [{'field': 'gpu_count', 'direction': 'desc'}],
     )[0]
+
+
+def test_sort_by_strings():
+    """Строки сортируются по алфавиту без учёта регистра, None - в конце при любом направлении."""
+    data = [{'name': 'beta'}, {'name': None}, {'name': 'Alpha'}, {'name': 'gamma'}]
+    assert [item['name'] for item in sort_by(data, [{'field': 'name', 'direction': 'asc'}])] == ['Alpha', 'beta', 'gamma', None]
+    assert [item['name'] for item in sort_by(data, [{'field': 'name', 'direction': 'desc'}])] == ['gamma', 'beta', 'Alpha', None]
+
+
+@pytest.mark.parametrize('values, expected', [
+    ([10, 9, 100], [9, 10, 100]),
+    (['10.5', '9', '100'], ['9', '10.5', '100']),
+    (['90s', '761461s', '5s'], ['5s', '90s', '761461s']),
+    (['2025-02-24T11:11:04.911528Z', '2025-02-24T10:59:38Z', '2024-12-31T23:00:00'],
+     ['2024-12-31T23:00:00', '2025-02-24T10:59:38Z', '2025-02-24T11:11:04.911528Z']),
+])
+def test_sort_by_typed(values, expected):
+    """Числа, длительности и даты ISO сравниваются по значению, а не как строки."""
+    data = [{'field': value} for value in values]
+    assert [item['field'] for item in sort_by(data, [{'field': 'field', 'direction': 'asc'}])] == expected
+
+
+def test_sort_by_multiple_keys_stable():
+    """Сортировка по нескольким полям устойчива: равные строки сохраняют исходный порядок."""
+    data = [
+        {'id': 1, 'status': 'Running', 'gpu_count': 2},
+        {'id': 2, 'status': 'Pending', 'gpu_count': 8},
+        {'id': 3, 'status': 'Running', 'gpu_count': 8},
+        {'id': 4, 'status': 'Pending', 'gpu_count': 8},
+        {'id': 5, 'status': 'Running', 'gpu_count': 2},
+    ]
+    result = sort_by(data, [{'field': 'status', 'direction': 'asc'}, {'field': 'gpu_count', 'direction': 'desc'}])
+    assert [item['id'] for item in result] == [2, 4, 3, 1, 5]
+
+
+def test_view_filter_and_sort_columns():
+    """Фильтры и сортировки TableView применяются к колоночному представлению за один вызов."""
+    data = [{'job_name': f'job-{index}', 'gpu_count': index % 3} for index in range(10)]
+    view = TableView(
+        data, [{'field': 'gpu_count', 'type': 'eq', 'values': 1}, {'field': 'job_name', 'type': 'like', 'values': 'job'}],
+        [{'field': 'job_name', 'direction': 'desc'}], lambda rows: [row['job_name'] for row in rows],
+    )
+    assert view.display() == ['job-7', 'job-4', 'job-1']
+
+
+@pytest.mark.parametrize('rows', [
+    [],
+    [['job', None, 2]],
+    [[' job ', 'Задача с описанием', 1.5], ['x', 'строка\nвторая', True]],
+])
+def test_format_table_as_tabulate(rows):
+    """Без ограничения ширины таблица совпадает с tabulate 'pretty'."""
+    headers = ['Имя', 'Описание', ' GPU']
+    assert format_table(headers, rows, width=None) == tabulate(rows, headers, tablefmt='pretty')
+
+
+def test_render_table_streaming():
+    """Строки выводятся по мере поступления: ширина по выборке, длинные значения обрезаются."""
+    consumed = []
+
+    def rows():
+        for index in range(5):
+            consumed.append(index)
+            yield f'job-{index}', 'x' * (index * 4)
+
+    lines = render_table(['Имя', 'Описание'], rows(), sample=2, width=None)
+    assert [next(lines) for _ in range(4)] == [
+        '+-------+----------+', '|  Имя  | Описание |', '+-------+----------+', '| job-0 |          |',
+    ]
+    assert consumed == [0, 1]
+    assert list(lines) == [
+        '| job-1 |   xxxx   |', '| job-2 | xxxxxxxx |', '| job-3 | xxxxxxx… |', '| job-4 | xxxxxxx… |', '+-------+----------+',
+    ]
+
+
+def test_render_table_width():
+    """Таблица сужается до заданной ширины за счёт самых широких столбцов."""
+    lines = list(render_table(['Имя', 'Описание'], [['job', 'очень длинное описание задачи']], width=25))
+    assert {len(line) for line in lines} == {25}
+    assert lines[3] == '| job | очень длинное … |'
+
+
+def test_display_jobs_full_width(monkeypatch):
+    """Таблица job table без --page_size не обрезается по ширине терминала."""
+    monkeypatch.setattr('mls.schema.stream.terminal_width', lambda: 40)
+    description = 'очень длинное описание задачи, которое не помещается в терминал'
+    table = display_jobs([{'job_name': 'job', 'status': 'Running', 'job_desc': description}])
+    assert description in table
+    assert '…' not in table
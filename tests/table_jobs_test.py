@@ -115,7 +115,7 @@ def test_filters_and_sorting_no_created_at(runner, mock_api_job, monkeypatch):
     test_filters = []
     test_sort = []
 
-    def capture_args(self, data, filters, sort):
+    def capture_args(self, data, filters, sort, **_):
         nonlocal test_filters, test_sort
         test_filters = filters
         test_sort = sort
@@ -151,7 +151,7 @@ def test_filters_and_sorting(runner, mock_api_job, monkeypatch):
     test_filters = []
     test_sort = []
 
-    def capture_args(self, data, filters, sort):
+    def capture_args(self, data, filters, sort, **_):
         nonlocal test_filters, test_sort
         test_filters = filters
         test_sort = sort
@@ -0,0 +1,100 @@
+"""Тесты режима наблюдения за таблицей задач."""
+import re
+
+import pytest
+import responses
+
+from .conftest import ENDPOINT_URL
+from mls.cli import cli
+from mls.schema import LiveTable
+
+
+def test_live_table_redraws_changed_rows():
+    """Второй кадр содержит только изменившуюся строку с выделенной ячейкой."""
+    live = LiveTable(('Имя', 'Статус'))
+    first = live.update([('a', 'Pending'), ('b', 'Running')], height=20)
+    assert first.startswith('\x1b[H\x1b[2J')
+    assert '|  a  | Pending |' in first
+
+    second = live.update([('a', 'Running'), ('b', 'Running')], height=20)
+    assert '\x1b[4;1H\x1b[2K|  a  | ' in second
+    assert '\x1b[5;1H' not in second
+    assert live.changes == {'a': {1}}
+    assert not live.reordered
+
+    third = live.update([('a', 'Running'), ('b', 'Running')], height=20)
+    assert '\x1b[4;1H\x1b[2K|  a  | Running |' in third
+    assert live.changes == {}
+
+
+def test_live_table_full_redraw():
+    """Изменение состава строк, высоты окна или ширины столбца перерисовывает таблицу целиком."""
+    live = LiveTable(('Имя', 'Статус'))
+    live.update([('a', 'Pending')], height=20)
+    assert live.update([('a', 'Pending'), ('b', 'Pending')], height=20).startswith('\x1b[H\x1b[2J')
+    assert live.update([('a', 'Pending'), ('b', 'Pending')], height=30).startswith('\x1b[H\x1b[2J')
+    assert live.update([('a', 'Pending'), ('b', 'Completed')], height=30).startswith('\x1b[H\x1b[2J')
+
+
+def test_live_table_truncated_to_terminal():
+    """Строки, не помещающиеся в окно, не выводятся; строка состояния сообщает об этом."""
+    live = LiveTable(('Имя',))
+    frame = live.update([(str(index),) for index in range(1000)], height=10, footer='12:00:00')
+    assert frame.count('\n') == 9
+    assert frame.endswith('12:00:00 Показано 5 из 1000.')
+
+
+def test_live_table_plain_output():
+    """Вне терминала выводится таблица, затем только изменённые строки без управляющих последовательностей."""
+    live = LiveTable(('Имя', 'Статус'), tty=False)
+    assert live.update([('a', 'Pending'), ('b', 'Running')]).count('\n') == 6
+    assert live.update([('a', 'Pending'), ('b', 'Running')]) == ''
+    assert live.update([('a', 'Running'), ('b', 'Running')]) == '|  a  | Running |\n'
+
+
+@responses.activate
+@pytest.mark.usefixtures('job_auth')
+def test_table_watch(runner, monkeypatch):
+    """Режим --watch опрашивает задачи одним клиентом и выводит изменения до Ctrl+C."""
+    delays = []
+
+    def sleep(delay):
+        delays.append(delay)
+        if len(delays) == 3:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr('mls.manager.job.cli.time.sleep', sleep)
+    monkeypatch.setattr('mls.manager.job.wait.random.uniform', lambda *_: 1)
+    for status, duration in (('Pending', '0s'), ('Pending', '0s'), ('Running', '5s')):
+        responses.get(f'{ENDPOINT_URL}/jobs', json={'jobs': [{'job_name': 'job', 'status': status, 'duration': duration}]})
+
+    result = runner.invoke(cli, ['job', 'table', '--watch'])
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert len(lines) == 6
+    assert 'Pending' in lines[3] and 'Running' in lines[5]
+    assert len(responses.calls) == 4
+    assert delays == [2, 4, 2]
+
+
+@pytest.mark.parametrize('rows', [[], [('a', 'x')]])
+def test_live_table_first_frame(rows):
+    """Первый кадр выводит таблицу даже без строк."""
+    assert LiveTable(('Имя', 'Статус'), tty=False).update(rows).startswith('+-----+')
+
+
+def test_live_table_narrow_terminal():
+    """В узком терминале строки сужаются до ширины окна, длинные значения обрезаются."""
+    live = LiveTable(('Имя', 'Описание'))
+    rows = [('a', 'очень длинное описание задачи'), ('b', 'short')]
+    first = live.update(rows, height=20, width=25)
+    lines = first[len('\x1b[H\x1b[2J'):].split('\n')
+    assert {len(line) for line in lines[:-1]} == {25}
+    assert '|  a  | очень длинное … |' in lines
+
+    second = live.update([rows[0], ('b', 'описание стало длиннее')], height=20, width=25)
+    assert not second.startswith('\x1b[H\x1b[2J')
+    row = re.sub(r'\x1b\[[0-9;]*[A-Za-z]', '', second.split('\x1b[2K')[1])
+    assert row == '|  b  | описание стало… |'
+
+    assert live.update(rows, height=20, width=40).startswith('\x1b[H\x1b[2J')
@@ -0,0 +1,98 @@
+"""Тесты кэша токенов доступа."""
+import re
+
+import responses
+
+from mls_core import TrainingJobApi
+from mls_core.token_cache import TokenCache
+
+ENDPOINT_URL = 'https://fake.api.com'
+AUTH_URL = f'{ENDPOINT_URL}/{TrainingJobApi.AUTH_ENDPOINT}'
+
+
+def make_cache(secret='secret'):
+    """Кэш для тестового набора учётных данных."""
+    return TokenCache('default', ENDPOINT_URL, 'workspace', 'client', secret)
+
+
+def make_client(profile='default'):
+    """Клиент для тестового набора учётных данных."""
+    return TrainingJobApi(
+        endpoint_url=ENDPOINT_URL,
+        client_id='client',
+        client_secret='secret',
+        x_workspace_id='workspace',
+        x_api_key='key',
+        profile=profile,
+    )
+
+
+def test_save_load():
+    """Сохраненный токен читается обратно до истечения срока."""
+    cache = make_cache()
+    cache.save('token', expires_in=3600)
+    assert make_cache().load() == 'token'
+
+
+def test_expired_token():
+    """Просроченный токен считается промахом."""
+    cache = make_cache()
+    cache.save('token', expires_in=1)
+    misses = TokenCache.misses
+    assert cache.load() is None
+    assert TokenCache.misses == misses + 1
+
+
+def test_other_secret():
+    """Токен не читается с другим секретом клиента."""
+    make_cache().save('token', expires_in=3600)
+    assert make_cache('other').load() is None
+
+
+def test_file_is_private(token_cache_dir):
+    """Файл кэша доступен только владельцу."""
+    cache = make_cache()
+    cache.save('token')
+    assert (token_cache_dir.stat().st_mode & 0o777) == 0o700
+    assert (token_cache_dir / cache.path.rsplit('/', 1)[-1]).stat().st_mode & 0o777 == 0o600
+
+
+@responses.activate
+def test_client_uses_cache():
+    """Повторное создание клиента не обращается к service_auth."""
+    auth = responses.post(AUTH_URL, json={'token': {'access_token': 'fresh', 'expires_in': 3600}})
+    responses.get(f'{ENDPOINT_URL}/jobs/name', json={'status': 'Running'})
+
+    make_client().get_job_status('name')
+    client = make_client()
+    client.get_job_status('name')
+
+    assert auth.call_count == 1
+    assert client._session.headers['authorization'] == 'fresh'
+
+
+@responses.activate
+def test_client_without_profile_skips_cache():
+    """Без профиля токен не кэшируется."""
+    auth = responses.post(AUTH_URL, json={'token': {'access_token': 'fresh'}})
+    responses.get(f'{ENDPOINT_URL}/jobs/name', json={'status': 'Running'})
+
+    make_client(profile=None).get_job_status('name')
+    make_client(profile=None).get_job_status('name')
+
+    assert auth.call_count == 2
+
+
+@responses.activate
+def test_refresh_on_unauthorized():
+    """Отклоненный сервером токен из кэша обновляется, запрос повторяется."""
+    make_cache().save('stale', expires_in=3600)
+    auth = responses.post(AUTH_URL, json={'token': {'access_token': 'fresh'}})
+    responses.get(re.compile(f'{ENDPOINT_URL}/jobs/name'), status=401)
+    responses.get(re.compile(f'{ENDPOINT_URL}/jobs/name'), json={'status': 'Running'})
+
+    client = make_client()
+    assert client.get_job_status('name') == {'status': 'Running'}
+    assert auth.call_count == 1
+    assert responses.calls[-1].request.headers['authorization'] == 'fresh'
+    assert make_cache().load() == 'fresh'
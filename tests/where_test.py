@@ -0,0 +1,63 @@
+"""Тесты языка условий --where."""
+import pytest
+
+from mls.cli import cli
+from mls.schema import compile_where
+from mls.schema import WhereSyntaxError
+from mls.schema.table import JobTableView
+
+JOBS = [
+    {'job_name': 'train-a', 'status': 'Running', 'gpu_count': 8, 'duration': '9000s', 'created_dt': '2025-02-24T10:59:38Z'},
+    {'job_name': 'train-b', 'status': 'Pending', 'gpu_count': 16, 'duration': '60s', 'created_dt': '2025-01-10T00:00:00Z'},
+    {'job_name': 'eval-c', 'status': 'Failed', 'gpu_count': 1, 'duration': '86400s', 'job_desc': None},
+    {'job_name': 'train-d', 'status': 'Completed', 'gpu_count': 8, 'duration': '7300s', 'query': {'source': 'bucket'}},
+]
+
+
+def select(expression):
+    """Имена задач, подходящих под выражение."""
+    where = compile_where(expression)
+    return [job['job_name'] for job in JOBS if where(job)]
+
+
+@pytest.mark.parametrize('expression, expected', [
+    ('gpu_count>=8 and status in (Running,Pending) and duration>2h', ['train-a']),
+    ('gpu_count >= 8 and status in (running, pending)', ['train-a', 'train-b']),
+    ('status not in (Running, Pending)', ['eval-c', 'train-d']),
+    ('duration<=1d and not (status=Failed or gpu_count=16)', ['train-a', 'train-d']),
+    ('duration>2h1m', ['train-a', 'eval-c', 'train-d']),
+    ('duration<2h1m', ['train-b']),
+    ('created_dt>=2025-02-01', ['train-a']),
+    ("job_name~'^train-[ab]$'", ['train-a', 'train-b']),
+    ('job_name!~^train', ['eval-c']),
+    ('job_desc=null', ['train-a', 'train-b', 'eval-c', 'train-d']),
+    ('query.source=bucket', ['train-d']),
+    ('gpu_count!=8', ['train-b', 'eval-c']),
+    ("status='completed' or gpu_count==1", ['eval-c', 'train-d']),
+])
+def test_where(expression, expected):
+    """Сравнения, списки, регулярные выражения, длительности, даты и логические операции."""
+    assert select(expression) == expected
+
+
+@pytest.mark.parametrize('expression', [
+    '', 'gpu_count>', 'status in (Running', '(gpu_count=1', 'gpu_count=1 status=2', 'job_name~(', 'a<null',
+    'created_dt>2025-02-30', 'created_dt in (2025-13-01)',
+])
+def test_where_syntax_error(expression):
+    """Ошибки разбора сообщаются исключением WhereSyntaxError."""
+    with pytest.raises(WhereSyntaxError):
+        compile_where(expression)
+
+
+def test_where_table_view():
+    """Условие применяется вместе с фильтрами и сортировкой таблицы."""
+    view = JobTableView(JOBS, [], [{'field': 'gpu_count', 'direction': 'desc'}], where=compile_where('gpu_count>1'))
+    assert [job['job_name'] for job in view.apply()] == ['train-b', 'train-a', 'train-d']
+
+
+def test_where_option(runner):
+    """Неверное выражение --where отклоняется до обращения к API."""
+    result = runner.invoke(cli, ['job', 'table', '--where', 'gpu_count>'])
+    assert result.exit_code == 2
+    assert 'не является допустимым выражением' in result.output